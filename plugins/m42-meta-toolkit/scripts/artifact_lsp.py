@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""
+M42 Artifact LSP - Language server for skills, commands, agents and references
+
+Publishes validator findings as diagnostics while a file is edited, before it
+is saved:
+
+    SKILL.md          creating-skills/scripts/validate_skill.py (SKILL.md checks)
+    commands/*.md     creating-commands/scripts/validate_command.py
+    agents/*.md       creating-subagents/scripts/validate_subagent.py
+    references/*.md   reference frontmatter schema (validate_reference_frontmatter)
+
+Each open document keeps a line model: its lines plus whether each line sits
+inside a ``` fence. An edit splices the model and re-scans fence state only
+until it matches the previous state again, then re-runs the line rules
+(imperative form, time-sensitive wording, path style, absolute paths) on the
+edited lines and on lines whose fence state flipped. Whole-document checks
+(frontmatter, headings, sizes, mentions) re-run only when an edit touches
+frontmatter, headings, fences, line count or the tokens those checks count;
+prose edits reuse their previous result.
+
+Completion offers frontmatter keys and values (model, color, skill) from the
+validators' schemas, and Skill() targets from an index of SKILL.md files under
+the workspace and ~/.claude/skills, cached until a SKILL.md is saved.
+
+Speaks JSON-RPC over stdio; point an editor's generic LSP client at
+`python3 plugins/m42-meta-toolkit/scripts/artifact_lsp.py` for markdown files.
+
+Usage:
+    python3 scripts/artifact_lsp.py          # serve on stdin/stdout
+    python3 scripts/artifact_lsp.py --check FILE   # print diagnostics once and exit
+"""
+
+import sys
+import os
+import re
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent / "skills"
+for _scripts in ("creating-skills", "creating-commands", "creating-subagents"):
+    sys.path.insert(0, str(SKILLS_DIR / _scripts / "scripts"))
+
+import validate_skill
+import validate_command
+import validate_subagent
+
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+
+# Checks the line model evaluates per line; dropped from whole-document results
+LINE_CHECKS = {"imperative form", "time-sensitive content (warning)", "path style", "portable paths"}
+
+# Whole-document checks count these; a prose edit touching one re-runs them
+DOC_TOKENS = ("references/", "scripts/", "Skill(", "Task(", "@", "!`", "```")
+
+REFERENCE_KEYS = ["title", "description", "skill", "keywords"]
+
+# Directories never indexed
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+
+WINDOWS_PATH = re.compile(r'[a-zA-Z]:\\')
+LINE_REF = re.compile(r'\bLine (\d+)\b')
+SKILL_CALL = re.compile(r'''Skill\(\s*(?:command\s*=\s*)?['"]?([\w:-]*)$''')
+
+
+def artifact_kind(path: Path) -> Optional[str]:
+    """skill, command, agent or reference for files the server validates, else None."""
+    if path.name == "SKILL.md":
+        return "skill"
+    if path.suffix != ".md":
+        return None
+    return {"commands": "command", "agents": "agent", "references": "reference"}.get(path.parent.name)
+
+
+def uri_to_path(uri: str) -> Path:
+    return Path(unquote(urlparse(uri).path))
+
+
+def utf16_to_index(line: str, column: int) -> int:
+    """Convert an LSP (UTF-16) column to a str index."""
+    units = 0
+    for index, char in enumerate(line):
+        if units >= column:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def index_to_utf16(line: str, index: int) -> int:
+    """Convert a str index to an LSP (UTF-16) column."""
+    return index + sum(1 for char in line[:index] if ord(char) > 0xFFFF)
+
+
+class LineModel:
+    """Lines of a document plus the fence state of each line.
+
+    in_fence[i] is True for lines inside a ``` block, including the closing
+    delimiter, using the validators' rule (a stripped line starting with ```).
+    """
+
+    def __init__(self, text: str):
+        self.lines = text.split('\n')
+        self.in_fence = []
+        self._scan_fences(0, None)
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.lines)
+
+    def _scan_fences(self, start: int, stop_after: Optional[int]) -> int:
+        """Recompute fence state from start; past stop_after, stop once a line's state is unchanged.
+
+        Returns the index after the last line whose state was recomputed.
+        """
+        inside = self.in_fence[start - 1] != self.lines[start - 1].strip().startswith('```') \
+            if start > 0 else False
+        old = self.in_fence
+        new = old[:start]
+        for i in range(start, len(self.lines)):
+            if stop_after is not None and i > stop_after and i < len(old) and old[i] == inside:
+                self.in_fence = new + old[i:]
+                return i
+            new.append(inside)
+            if self.lines[i].strip().startswith('```'):
+                inside = not inside
+        self.in_fence = new
+        return len(self.lines)
+
+    def frontmatter_end(self) -> int:
+        """Index of the closing --- of the frontmatter, or -1."""
+        if not self.lines or self.lines[0] != '---':
+            return -1
+        for i in range(1, len(self.lines)):
+            if self.lines[i] == '---':
+                return i
+        return -1
+
+    def apply(self, change: Dict) -> Tuple[int, int, List[str]]:
+        """Apply one LSP content change.
+
+        Returns (first, last) dirty line range (inclusive, new coordinates) and
+        the replaced lines.
+        """
+        if 'range' not in change:
+            old = self.lines
+            self.lines = change['text'].split('\n')
+            self.in_fence = []
+            self._scan_fences(0, None)
+            return 0, len(self.lines) - 1, old
+
+        start, end = change['range']['start'], change['range']['end']
+        first, last = start['line'], min(end['line'], len(self.lines) - 1)
+        head = self.lines[first][:utf16_to_index(self.lines[first], start['character'])]
+        tail = self.lines[last][utf16_to_index(self.lines[last], end['character']):]
+        replaced = self.lines[first:last + 1]
+        inserted = (head + change['text'] + tail).split('\n')
+
+        self.lines[first:last + 1] = inserted
+        self.in_fence[first:last + 1] = [False] * len(inserted)
+        new_last = first + len(inserted) - 1
+        # Fence state can flip for every line below an edited delimiter
+        stop = self._scan_fences(first, new_last)
+        return first, max(new_last, stop - 1), replaced
+
+
+def _line_rules(kind: str, module, line: str, in_fence: bool, in_frontmatter: bool) -> List[Tuple[str, int, int, int, str]]:
+    """Run the validator's line checks on one line.
+
+    Returns (check, severity, start, end, message) tuples with str indices.
+    """
+    # A fence line prepended makes the validator's own fence logic see the line as code
+    probe = '```\n' + line if in_fence else line
+    findings = []
+
+    if not (kind == "agent" and in_frontmatter):  # the subagent check reads the body only
+        for _, text in module.find_person_usage(probe):
+            col = line.find(text)
+            findings.append(("imperative form", SEVERITY_ERROR, col, col + len(text),
+                             f"First/second person: '{text}'. Use imperative form"))
+
+    for _, label in module.find_time_sensitive(probe):
+        match = next((p.search(line) for p, l in module.TIME_SENSITIVE_PATTERNS if l == label), None)
+        col, end = (match.start(), match.end()) if match else (0, len(line))
+        findings.append(("time-sensitive content (warning)", SEVERITY_WARNING, col, end,
+                         f"Time-sensitive wording ({label}); review manually"))
+
+    match = WINDOWS_PATH.search(line)
+    if match:
+        findings.append(("path style", SEVERITY_ERROR, match.start(), match.end(),
+                         "Backslash path; use forward slashes"))
+
+    if kind == "skill":
+        for finding in validate_skill.find_absolute_paths(line):
+            findings.append(("portable paths", SEVERITY_ERROR, finding.start, finding.end,
+                             f"User-specific absolute path ({finding.description}); use ~/ or a relative path"))
+    return findings
+
+
+class Document:
+    """An open artifact: line model, per-line findings and cached whole-document findings."""
+
+    MODULES = {"skill": validate_skill, "command": validate_command, "agent": validate_subagent}
+
+    def __init__(self, uri: str, text: str):
+        self.uri = uri
+        self.path = uri_to_path(uri)
+        self.kind = artifact_kind(self.path)
+        self.model = LineModel(text)
+        self.line_findings: List[list] = []
+        self.doc_findings: List[Tuple[str, int, int, str]] = []
+        self.rescan_lines(0, len(self.model.lines) - 1)
+        self.run_document_checks()
+
+    def rescan_lines(self, first: int, last: int) -> None:
+        module = self.MODULES.get(self.kind)
+        fm_end = self.model.frontmatter_end()
+        del self.line_findings[len(self.model.lines):]
+        self.line_findings += [[] for _ in range(len(self.model.lines) - len(self.line_findings))]
+        if module is None:
+            return
+        for i in range(first, min(last, len(self.model.lines) - 1) + 1):
+            self.line_findings[i] = _line_rules(self.kind, module, self.model.lines[i],
+                                                self.model.in_fence[i], i <= fm_end)
+
+    def frontmatter_line(self, key: str) -> int:
+        for i in range(1, max(self.model.frontmatter_end(), 0)):
+            if self.model.lines[i].startswith(f"{key}:"):
+                return i
+        return 0
+
+    def run_document_checks(self) -> None:
+        """Run the validator's whole-document checks on the buffer text."""
+        text = self.model.text
+        findings = []
+        if self.kind == "reference":
+            frontmatter, error = validate_skill.parse_yaml_frontmatter(text)
+            problems = [error] if error else validate_skill.validate_reference_frontmatter(frontmatter)['issues']
+            findings = [("reference frontmatter", SEVERITY_WARNING, 0, problem) for problem in problems]
+        elif self.kind in self.MODULES:
+            module = self.MODULES[self.kind]
+            with module.check_sink(None):
+                if self.kind == "skill":
+                    issues = validate_skill.validate_skill_md(self.path.parent, text)[0]
+                elif self.kind == "command":
+                    issues = validate_command.validate_command(self.path, text)[0]
+                else:
+                    issues = validate_subagent.validate_subagent(self.path, text)[0]
+            for issue in issues:
+                if issue.check in LINE_CHECKS:
+                    continue
+                ref = LINE_REF.search(f"{issue.found}\n{issue.fix}")
+                if ref:
+                    line = int(ref.group(1)) - 1
+                else:
+                    field = re.match(r'(name|description|model|color|allowed-tools)\b', issue.check)
+                    line = self.frontmatter_line(field.group(1)) if field else 0
+                severity = SEVERITY_WARNING if issue.severity == "warning" else SEVERITY_ERROR
+                findings.append((issue.check, severity, line, f"{issue.found}\nFix: {issue.fix}"))
+        self.doc_findings = findings
+
+    def needs_document_checks(self, first: int, last: int, replaced: List[str], line_delta: int) -> bool:
+        """True if an edit can change whole-document results."""
+        if self.kind in ("agent", "reference") or line_delta:
+            return True  # agents score word counts; references are all frontmatter
+        if first <= self.model.frontmatter_end() + 1 or self.model.frontmatter_end() < 0:
+            return True
+        touched = replaced + self.model.lines[first:last + 1]
+        if any(self.model.in_fence[i] for i in range(first, last + 1)):
+            return True
+        return any(line.lstrip().startswith('#') or any(t in line for t in DOC_TOKENS) for line in touched)
+
+    def change(self, changes: List[Dict]) -> None:
+        rerun = False
+        for change in changes:
+            before = len(self.model.lines)
+            first, last, replaced = self.model.apply(change)
+            delta = len(self.model.lines) - before
+            # Keep per-line findings aligned with the spliced lines
+            old_last = first + len(replaced) - 1
+            self.line_findings[first:old_last + 1] = [[] for _ in range(old_last - first + 1 + delta)]
+            self.rescan_lines(first, last)
+            rerun = rerun or self.needs_document_checks(first, last, replaced, delta)
+        if rerun:
+            self.run_document_checks()
+
+    def diagnostics(self) -> List[Dict]:
+        result = []
+        for i, findings in enumerate(self.line_findings):
+            line = self.model.lines[i]
+            for check, severity, start, end, message in findings:
+                result.append({
+                    "range": {"start": {"line": i, "character": index_to_utf16(line, max(start, 0))},
+                              "end": {"line": i, "character": index_to_utf16(line, max(end, 0))}},
+                    "severity": severity, "source": "m42", "code": check, "message": message,
+                })
+        for check, severity, line_no, message in self.doc_findings:
+            line_no = min(max(line_no, 0), len(self.model.lines) - 1)
+            length = index_to_utf16(self.model.lines[line_no], len(self.model.lines[line_no]))
+            result.append({
+                "range": {"start": {"line": line_no, "character": 0}, "end": {"line": line_no, "character": length}},
+                "severity": severity, "source": "m42", "code": check, "message": message,
+            })
+        return result
+
+
+class SkillIndex:
+    """Skill names and descriptions found under the workspace roots and ~/.claude/skills."""
+
+    def __init__(self, roots: List[Path]):
+        self.roots = roots
+        self._skills: Optional[Dict[str, Tuple[str, str]]] = None
+
+    def invalidate(self) -> None:
+        self._skills = None
+
+    def skills(self) -> Dict[str, Tuple[str, str]]:
+        """name -> (description, path), built on first use."""
+        if self._skills is None:
+            skills = {}
+            for root in self.roots + [Path.home() / ".claude" / "skills"]:
+                if not root.is_dir():
+                    continue
+                for dirpath, dirnames, filenames in os.walk(root):
+                    dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+                    if "SKILL.md" not in filenames:
+                        continue
+                    skill_md = Path(dirpath) / "SKILL.md"
+                    try:
+                        frontmatter, _ = validate_skill.parse_yaml_frontmatter(skill_md.read_text(encoding="utf-8"))
+                    except (OSError, UnicodeDecodeError):
+                        continue
+                    frontmatter = frontmatter if isinstance(frontmatter, dict) else {}
+                    name = str(frontmatter.get("name") or Path(dirpath).name)
+                    skills.setdefault(name, (str(frontmatter.get("description", "")), str(skill_md)))
+            self._skills = skills
+        return self._skills
+
+
+def complete(doc: Document, index: SkillIndex, line_no: int, column: int) -> List[Dict]:
+    """Completion items at a position."""
+    line = doc.model.lines[line_no] if line_no < len(doc.model.lines) else ""
+    before = line[:utf16_to_index(line, column)]
+    fm_end = doc.model.frontmatter_end()
+    in_frontmatter = 0 < line_no and (line_no < fm_end or (fm_end < 0 and doc.model.lines[0] == '---'))
+
+    def skill_items():
+        return [{"label": name, "kind": 18, "detail": path, "documentation": desc}
+                for name, (desc, path) in sorted(index.skills().items())]
+
+    if in_frontmatter:
+        key, sep, _ = before.partition(':')
+        if not sep:
+            keys = {
+                "skill": sorted(validate_skill.VALID_FRONTMATTER_KEYS),
+                "command": validate_command.REQUIRED_FIELDS,
+                "agent": validate_subagent.REQUIRED_FIELDS,
+                "reference": REFERENCE_KEYS,
+            }.get(doc.kind, [])
+            present = {l.split(':', 1)[0] for l in doc.model.lines[1:fm_end if fm_end > 0 else None]}
+            return [{"label": k, "kind": 10, "insertText": f"{k}: "} for k in keys if k not in present]
+        values = {
+            ("command", "model"): validate_command.VALID_MODELS,
+            ("agent", "model"): validate_subagent.VALID_MODELS,
+            ("agent", "color"): validate_subagent.VALID_COLORS,
+        }.get((doc.kind, key.strip()))
+        if values:
+            return [{"label": v, "kind": 12} for v in values]
+        if doc.kind == "reference" and key.strip() == "skill":
+            return skill_items()
+        return []
+
+    if SKILL_CALL.search(before):
+        return skill_items()
+    return []
+
+
+class Server:
+    """Minimal JSON-RPC/LSP loop over binary stdin/stdout."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.documents: Dict[str, Document] = {}
+        self.index = SkillIndex([Path.cwd()])
+        self.shutdown = False
+
+    def read_message(self) -> Optional[Dict]:
+        length = None
+        while True:
+            header = self.reader.readline()
+            if not header:
+                return None
+            header = header.strip()
+            if not header:
+                break
+            name, _, value = header.decode("ascii").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        if length is None:
+            return {}
+        return json.loads(self.reader.read(length))
+
+    def send(self, message: Dict) -> None:
+        body = json.dumps({"jsonrpc": "2.0", **message}).encode("utf-8")
+        self.writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+        self.writer.flush()
+
+    def publish(self, doc: Document) -> None:
+        self.send({"method": "textDocument/publishDiagnostics",
+                   "params": {"uri": doc.uri, "diagnostics": doc.diagnostics()}})
+
+    def handle(self, message: Dict) -> None:
+        method = message.get("method")
+        params = message.get("params") or {}
+        result = None
+
+        if method == "initialize":
+            folders = params.get("workspaceFolders") or []
+            roots = [uri_to_path(f["uri"]) for f in folders]
+            if not roots and params.get("rootUri"):
+                roots = [uri_to_path(params["rootUri"])]
+            self.index = SkillIndex(roots or [Path.cwd()])
+            result = {
+                "capabilities": {
+                    "textDocumentSync": {"openClose": True, "change": 2, "save": True},
+                    "completionProvider": {"triggerCharacters": ["(", "'", '"', "=", ":", " "]},
+                },
+                "serverInfo": {"name": "m42-artifact-lsp"},
+            }
+        elif method == "shutdown":
+            self.shutdown = True
+        elif method == "exit":
+            sys.exit(0 if self.shutdown else 1)
+        elif method == "textDocument/didOpen":
+            item = params["textDocument"]
+            if artifact_kind(uri_to_path(item["uri"])):
+                self.documents[item["uri"]] = doc = Document(item["uri"], item["text"])
+                self.publish(doc)
+        elif method == "textDocument/didChange":
+            doc = self.documents.get(params["textDocument"]["uri"])
+            if doc:
+                doc.change(params["contentChanges"])
+                self.publish(doc)
+        elif method == "textDocument/didSave":
+            uri = params["textDocument"]["uri"]
+            if uri_to_path(uri).name == "SKILL.md":
+                self.index.invalidate()
+            doc = self.documents.get(uri)
+            if doc and doc.kind == "skill":
+                # Layout checks read the folder, which may have changed on disk
+                doc.run_document_checks()
+                self.publish(doc)
+        elif method == "textDocument/didClose":
+            doc = self.documents.pop(params["textDocument"]["uri"], None)
+            if doc:
+                self.send({"method": "textDocument/publishDiagnostics",
+                           "params": {"uri": doc.uri, "diagnostics": []}})
+        elif method == "workspace/didChangeWatchedFiles":
+            if any(uri_to_path(c["uri"]).name == "SKILL.md" for c in params.get("changes", [])):
+                self.index.invalidate()
+        elif method == "textDocument/completion":
+            doc = self.documents.get(params["textDocument"]["uri"])
+            position = params["position"]
+            result = complete(doc, self.index, position["line"], position["character"]) if doc else []
+        elif "id" in message and method is not None:
+            self.send({"id": message["id"], "error": {"code": -32601, "message": f"Method not found: {method}"}})
+            return
+
+        if "id" in message and method is not None:
+            self.send({"id": message["id"], "result": result})
+
+    def serve(self) -> None:
+        while True:
+            message = self.read_message()
+            if message is None:
+                return
+            if message:
+                self.handle(message)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Language server for skills, commands, agents and reference docs',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 scripts/artifact_lsp.py
+  python3 scripts/artifact_lsp.py --check skills/creating-skills/SKILL.md
+        """
+    )
+    parser.add_argument('--check', type=Path, metavar='FILE',
+                        help='Print the diagnostics for FILE and exit (1 if any are errors)')
+    args = parser.parse_args()
+
+    if args.check:
+        path = args.check.resolve()
+        if not artifact_kind(path):
+            print(f"❌ Error: Not a SKILL.md, commands/, agents/ or references/ markdown file: {args.check}")
+            sys.exit(1)
+        try:
+            doc = Document(path.as_uri(), path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"❌ Error: Cannot read {args.check}: {e}")
+            sys.exit(1)
+        diagnostics = doc.diagnostics()
+        for d in sorted(diagnostics, key=lambda d: (d["range"]["start"]["line"], d["range"]["start"]["character"])):
+            icon = "✗" if d["severity"] == SEVERITY_ERROR else "⚠"
+            first_line = d["message"].split("\n")[0]
+            print(f"{args.check}:{d['range']['start']['line'] + 1}:{d['range']['start']['character'] + 1}: "
+                  f"{icon} {d['code']}: {first_line}")
+        sys.exit(1 if any(d["severity"] == SEVERITY_ERROR for d in diagnostics) else 0)
+
+    Server(sys.stdin.buffer, sys.stdout.buffer).serve()
+
+
+if __name__ == "__main__":
+    main()
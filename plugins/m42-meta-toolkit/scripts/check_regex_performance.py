@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+M42 Regex Audit - Fuzz every validator pattern for super-linear matching
+
+Collects each regex of the plugin's scripts without hooking the re module:
+compiled patterns reachable from the validator modules' globals (including
+the CLAUDE.md rule table), and, from the source of every script, literal
+patterns passed to re functions directly or through a name bound to literals
+in the same function. Each pattern is then run (finditer, as the detectors
+do) against adversarial inputs built from its own literal fragments - one
+long line of repeated fragments, a fragment followed by a long tail or a
+mismatching last character, many short lines without a terminator - at two
+sizes. A pattern whose worst-case time grows by more than MAX_GROWTH when
+the input grows by SIZE_FACTOR is reported as super-linear (linear growth is
+SIZE_FACTOR; quadratic is its square). A run is stopped after RUN_LIMIT
+seconds (SIGALRM, which the regex engine checks) and counts as super-linear,
+so exponential backtracking cannot hang the audit.
+
+Run before changing or adding detector patterns, and with --rules to vet a
+custom CLAUDE.md rules file.
+
+Usage:
+    python3 scripts/check_regex_performance.py [--rules rules.json] [--verbose]
+"""
+
+import sys
+import re
+import ast
+import time
+import signal
+from pathlib import Path
+
+PLUGIN_DIR = Path(__file__).resolve().parent.parent
+
+BASE_SIZE = 4000
+SIZE_FACTOR = 4
+# Between linear (SIZE_FACTOR) and quadratic (SIZE_FACTOR ** 2) growth
+MAX_GROWTH = 8
+# Timings below this at the larger size are noise, whatever the growth
+MIN_SECONDS = 0.005
+# A single run longer than this is stopped and reported
+RUN_LIMIT = 2.0
+
+FILLER = "lorem ipsum dolor"
+
+# Literal runs in a pattern source, and the escapes that carry no literal text
+LITERAL_RUN = re.compile(r'(?:\\.|[^\\()\[\]{}?*+|^$])+')
+ZERO_WIDTH_ESCAPE = re.compile(r'\\[bBAZwWsSdD]')
+ESCAPED_CHAR = re.compile(r'\\(.)')
+
+# re function -> position of its flags argument
+RE_FLAGS_ARG = {'compile': 1, 'search': 2, 'match': 2, 'fullmatch': 2, 'findall': 2,
+                'finditer': 2, 'split': 3, 'sub': 4, 'subn': 4}
+
+
+def compiled_patterns(value, found=None, seen=None) -> set:
+    """(pattern, flags) of every compiled regex reachable from value through containers."""
+    found = set() if found is None else found
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return found
+    seen.add(id(value))
+    if isinstance(value, re.Pattern):
+        if isinstance(value.pattern, str):
+            found.add((value.pattern, int(value.flags & ~re.UNICODE)))
+    elif isinstance(value, dict):
+        for item in (*value.keys(), *value.values()):
+            compiled_patterns(item, found, seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            compiled_patterns(item, found, seen)
+    return found
+
+
+def _literal_strings(node, bindings: dict, depth: int = 0) -> list:
+    """Strings a literal expression can take: constants, containers of them,
+    names bound to literals, and f-strings over those (re.escape included)."""
+    if depth > 8:
+        return []
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return [node.value]
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return [s for element in node.elts for s in _literal_strings(element, bindings, depth + 1)]
+    if isinstance(node, ast.Dict):
+        return [s for key in node.keys if key is not None for s in _literal_strings(key, bindings, depth + 1)]
+    if isinstance(node, ast.Name):
+        return [s for bound in bindings.get(node.id, []) for s in _literal_strings(bound, bindings, depth + 1)]
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'escape'
+            and isinstance(node.func.value, ast.Name) and node.func.value.id == 're' and len(node.args) == 1):
+        return [re.escape(s) for s in _literal_strings(node.args[0], bindings, depth + 1)]
+    if isinstance(node, ast.JoinedStr):
+        results = ['']
+        for part in node.values:
+            if isinstance(part, ast.FormattedValue):
+                part = part.value
+            values = _literal_strings(part, bindings, depth + 1)
+            results = [head + value for head in results for value in values]
+        return results
+    return []
+
+
+def _bind_loop(target, iterable, bindings: dict, depth: int = 0):
+    """Bind a for-loop target to each literal element it iterates over."""
+    if isinstance(iterable, ast.Name):
+        if depth < 8:
+            for bound in bindings.get(iterable.id, []):
+                _bind_loop(target, bound, bindings, depth + 1)
+        return
+    if not isinstance(iterable, (ast.List, ast.Tuple, ast.Set)):
+        return
+    for element in iterable.elts:
+        if isinstance(target, ast.Name):
+            bindings.setdefault(target.id, []).append(element)
+        elif (isinstance(target, ast.Tuple) and isinstance(element, ast.Tuple)
+              and len(target.elts) == len(element.elts)):
+            for name, value in zip(target.elts, element.elts):
+                if isinstance(name, ast.Name):
+                    bindings.setdefault(name.id, []).append(value)
+
+
+def _literal_flags(node) -> int:
+    """Value of a flags expression such as re.I | re.M (0 when not a literal)."""
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 're':
+        flag = getattr(re, node.attr, 0)
+        return int(flag) if isinstance(flag, re.RegexFlag) else 0
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return _literal_flags(node.left) | _literal_flags(node.right)
+    return 0
+
+
+def source_patterns(source_file: Path) -> set:
+    """(pattern, flags) of literal patterns given to re functions in a script."""
+    tree = ast.parse(source_file.read_text(encoding='utf-8'), filename=str(source_file))
+    found = set()
+    for scope in ast.walk(tree):
+        if not isinstance(scope, (ast.Module, ast.FunctionDef)):
+            continue
+        # Names bound in this scope: pattern = r'...', for p, msg in [(...), ...]
+        bindings = {}
+        for node in ast.walk(scope):
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                bindings.setdefault(node.targets[0].id, []).append(node.value)
+        for node in ast.walk(scope):
+            if isinstance(node, (ast.For, ast.comprehension)):
+                _bind_loop(node.target, node.iter, bindings)
+
+        for node in ast.walk(scope):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                    and isinstance(node.func.value, ast.Name) and node.func.value.id == 're'
+                    and node.func.attr in RE_FLAGS_ARG and node.args):
+                continue
+            position = RE_FLAGS_ARG[node.func.attr]
+            flags_node = node.args[position] if len(node.args) > position else next(
+                (kw.value for kw in node.keywords if kw.arg == 'flags'), None)
+            flags = _literal_flags(flags_node) if flags_node is not None else 0
+            found.update((p, flags) for p in _literal_strings(node.args[0], bindings))
+    return found
+
+
+def fragments(pattern: str) -> list:
+    """Literal text fragments of a pattern, used to build inputs it partly matches."""
+    found = []
+    for run in LITERAL_RUN.findall(pattern):
+        text = ESCAPED_CHAR.sub(r'\1', ZERO_WIDTH_ESCAPE.sub('', run.replace('\\n', '')))
+        if text.strip() and text not in found:
+            found.append(text)
+    return found or ["a"]
+
+
+def adversarial_inputs(pattern: str, size: int):
+    """Yield (name, text) inputs of about size characters."""
+    parts = fragments(pattern)
+    joined = " ".join(parts) + " "
+    yield "all fragments, one line", (joined * (size // len(joined) + 1))[:size]
+    yield "filler lines", (FILLER + "\n") * (size // (len(FILLER) + 1))
+    yield "filler, one line", (FILLER + " ") * (size // (len(FILLER) + 1))
+    yield "blank lines", "\n" * size
+    yield "spaces", " " * size
+    for part in parts:
+        yield f"{part!r} repeated", ((part + " ") * (size // (len(part) + 1) + 1))[:size]
+        yield f"{part!r} glued", (part * (size // len(part) + 1))[:size]
+        yield f"{part!r} + tail", part + "a" * size
+        yield f"{part!r} glued + mismatch", (part * (size // len(part) + 1))[:size - 1] + "\0"
+        yield f"{part!r} lines", ((part + " " + FILLER + "\n") * (size // (len(part) + len(FILLER) + 2) + 1))[:size]
+
+
+class RunTooLong(BaseException):
+    """Raised by the SIGALRM handler when a run exceeds RUN_LIMIT."""
+
+
+def _stop_run(signum, frame):
+    raise RunTooLong()
+
+
+def worst_time(regex, pattern: str, size: int):
+    """Slowest finditer run over the adversarial inputs: (seconds, input name).
+
+    A run stopped at RUN_LIMIT counts as infinitely slow.
+    """
+    worst = (0.0, "")
+    previous = signal.signal(signal.SIGALRM, _stop_run)
+    try:
+        for name, text in adversarial_inputs(pattern, size):
+            start = time.perf_counter()
+            signal.setitimer(signal.ITIMER_REAL, RUN_LIMIT)
+            try:
+                for _ in regex.finditer(text):
+                    pass
+                elapsed = time.perf_counter() - start
+            except RunTooLong:
+                return float('inf'), name
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            worst = max(worst, (elapsed, name))
+    finally:
+        signal.signal(signal.SIGALRM, previous)
+    return worst
+
+
+def audit(patterns) -> list:
+    """Return (pattern, flags, small seconds, large seconds, input name) for super-linear patterns."""
+    offenders = []
+    for pattern, flags in patterns:
+        try:
+            regex = re.compile(pattern, flags)
+        except re.error:
+            continue
+        small, name = worst_time(regex, pattern, BASE_SIZE)
+        if small == float('inf'):
+            offenders.append((pattern, flags, small, small, name))
+            continue
+        large, name = worst_time(regex, pattern, BASE_SIZE * SIZE_FACTOR)
+        if large > MIN_SECONDS and large > MAX_GROWTH * max(small, 1e-6):
+            # One slow run can be a scheduler hiccup: confirm with the best of three
+            small = min(worst_time(regex, pattern, BASE_SIZE)[0] for _ in range(3))
+            large, name = min(worst_time(regex, pattern, BASE_SIZE * SIZE_FACTOR) for _ in range(3))
+            if large > MIN_SECONDS and large > MAX_GROWTH * max(small, 1e-6):
+                offenders.append((pattern, flags, small, large, name))
+    return offenders
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Fuzz every validator regex with adversarial input and report super-linear patterns',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 scripts/check_regex_performance.py
+  python3 scripts/check_regex_performance.py --rules .claude/claudemd-rules.json
+        """
+    )
+    parser.add_argument('--rules', type=Path, help='Also audit the patterns of a CLAUDE.md rules file')
+    parser.add_argument('-v', '--verbose', action='store_true', help='List every audited pattern')
+    args = parser.parse_args()
+
+    import validation_api  # imports every validator
+    import lint_plugins  # noqa: F401 - its module-level patterns are audited too
+
+    seen = set()
+    for module in list(sys.modules.values()):
+        if str(getattr(module, '__file__', '') or '').startswith(str(PLUGIN_DIR)):
+            compiled_patterns(vars(module), seen)
+    for source_file in sorted(PLUGIN_DIR.rglob('*.py')):
+        seen |= source_patterns(source_file)
+
+    if args.rules:
+        validate_claudemd = validation_api.validate_claudemd
+        try:
+            rules = validate_claudemd.load_rules(args.rules)
+            compiled_patterns(validate_claudemd.compile_rules(validate_claudemd.ANTIPATTERN_RULES + rules), seen)
+        except (OSError, ValueError, re.error) as e:
+            print(f"❌ Error loading rules from {args.rules}: {e}")
+            sys.exit(1)
+
+    patterns = sorted(seen)
+    print(f"Auditing {len(patterns)} patterns (inputs {BASE_SIZE} and {BASE_SIZE * SIZE_FACTOR} chars)")
+    if args.verbose:
+        for pattern, flags in patterns:
+            print(f"  {pattern!r} flags={flags}")
+
+    offenders = audit(patterns)
+    for pattern, flags, small, large, name in offenders:
+        if large == float('inf'):
+            print(f"✗ {pattern!r} (flags={flags}): over {RUN_LIMIT:g}s on {name}")
+        else:
+            print(f"✗ {pattern!r} (flags={flags}): {small * 1000:.1f}ms → {large * 1000:.1f}ms on {name}")
+
+    if offenders:
+        print(f"\n{len(offenders)} super-linear patterns: anchor them, bound repeats or split the scan per line")
+        sys.exit(1)
+    print("✓ All patterns scale linearly")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Issue baseline shared by validate_skill.py, validate_command.py,
+validate_subagent.py and validate_claudemd.py (--baseline FILE, --new-only).
+
+An issue is recorded as its occurrences: one per line of its context (found
+and fix text; the detail of a CLAUDE.md result). Each occurrence is the
+check, the line with line references ("Line 12", "(line 12)") blanked and
+case and whitespace normalized, and the other numbers on the line (counts,
+sizes) kept apart. The baseline is a multiset of occurrences per file and
+validator:
+
+    {"version": 2, "files": {path: {validator: [[check, text, [numbers]], ...]}}}
+
+Paths are relative to the baseline file's directory, so the file works from
+any working directory. An issue is known when every occurrence consumes a
+recorded one with the same check and text and no larger number. So editing
+elsewhere in a file or fixing one of several matches keeps it known, while
+one more match (a second "you should", a new line in a "Line N: ..." list)
+or a grown count ("1 → 3 prohibitions", "7 matches" past the listed
+examples) makes it new.
+
+Usage:
+    python3 scripts/issue_baseline.py .m42-baseline.json   # summarize a baseline
+"""
+
+import sys
+import os
+import re
+import json
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+BASELINE_VERSION = 2
+
+LINE_REFERENCE = re.compile(r'\b(lines?)\s+\d+(?:\s*[-–]\s*\d+)?', re.IGNORECASE)
+NUMBER = re.compile(r'\b\d+\b')
+
+
+def blank_line_references(text: str) -> str:
+    """Text with "Line 12" / "lines 3-5" replaced by "line #", so edits elsewhere do not change it."""
+    return LINE_REFERENCE.sub(lambda m: m.group(1).lower() + ' #', text)
+
+
+def occurrence(check: str, line: str) -> Tuple[str, str, Tuple[int, ...]]:
+    """(check, text, numbers) of one context line: line references blanked, other numbers kept apart."""
+    text = blank_line_references(line)
+    numbers = tuple(int(n) for n in NUMBER.findall(text))
+    text = ' '.join(NUMBER.sub('#', text).split()).lower()
+    return ' '.join(blank_line_references(check).split()).lower(), text, numbers
+
+
+def occurrences(check: str, context: str) -> List[Tuple[str, str, Tuple[int, ...]]]:
+    """Occurrences of an issue, one per non-blank context line (at least one)."""
+    lines = [line for line in context.splitlines() if line.strip()]
+    return [occurrence(check, line) for line in lines or ['']]
+
+
+def issue_context(issue) -> str:
+    """Text a ValidationIssue is matched by: what was found and the per-match detail in the fix."""
+    return f"{issue.found}\n{issue.fix}"
+
+
+def baseline_key(path: Path, baseline_file: Path) -> str:
+    """Path as recorded in a baseline: relative to the baseline file's directory when possible."""
+    path = Path(path).resolve()
+    try:
+        return Path(os.path.relpath(path, Path(baseline_file).resolve().parent)).as_posix()
+    except ValueError:  # different drive on Windows
+        return path.as_posix()
+
+
+def load_baseline(baseline_file: Path) -> Dict[str, dict]:
+    """Return {path: {validator: [[check, text, numbers], ...]}} of a baseline file."""
+    data = json.loads(Path(baseline_file).read_text(encoding='utf-8'))
+    if not isinstance(data, dict) or data.get('version') != BASELINE_VERSION:
+        raise ValueError(f"not a version {BASELINE_VERSION} baseline file (record it again with --baseline)")
+    return data['files']
+
+
+def update_baseline(baseline_file: Path, validator: str, found: Dict[str, List[Tuple[str, str]]]) -> int:
+    """Record found ({path: [(check, context)]}) for validator, replacing earlier entries for those paths.
+
+    Entries of other validators and other paths are kept; a baseline of an
+    older version is replaced. Returns the number of issues recorded.
+    """
+    baseline_file = Path(baseline_file)
+    try:
+        files = load_baseline(baseline_file)
+    except (FileNotFoundError, ValueError):
+        files = {}
+    recorded = 0
+    for path, issues in found.items():
+        entries = sorted(list(occ[:2]) + [list(occ[2])]
+                         for check, context in issues for occ in occurrences(check, context))
+        validators = files.setdefault(path, {})
+        validators.pop(validator, None)
+        if entries:
+            validators[validator] = entries
+        if not validators:
+            del files[path]
+        recorded += len(issues)
+
+    # One occurrence per line, sorted by path and validator, so baseline diffs are reviewable
+    lines = ['{', f' "version": {BASELINE_VERSION},', ' "files": {']
+    for i, path in enumerate(sorted(files)):
+        lines.append(f'  {json.dumps(path)}: {{')
+        validators = sorted(files[path])
+        for j, name in enumerate(validators):
+            lines.append(f'   {json.dumps(name)}: [')
+            entries = files[path][name]
+            lines += [f'    {json.dumps(entry, ensure_ascii=False)}' + (',' if k < len(entries) - 1 else '')
+                      for k, entry in enumerate(entries)]
+            lines.append('   ]' + (',' if j < len(validators) - 1 else ''))
+        lines.append('  }' + (',' if i < len(files) - 1 else ''))
+    lines += [' }', '}']
+
+    baseline_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=baseline_file.parent)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.replace(tmp_name, baseline_file)
+    return recorded
+
+
+def split_known(items: list, validator: str, path: str, files: Dict[str, dict],
+                describe: Optional[Callable] = None) -> Tuple[list, list]:
+    """Split items into (new, known) against a loaded baseline.
+
+    describe(item) returns its (check, context); the default describes a
+    ValidationIssue. Each recorded occurrence is used by at most one current
+    occurrence.
+    """
+    describe = describe or (lambda issue: (issue.check, issue_context(issue)))
+    available = {}
+    for check, text, numbers in files.get(path, {}).get(validator, []):
+        available.setdefault((check, text), []).append(tuple(numbers))
+
+    new, known = [], []
+    for item in items:
+        taken = []
+        for check, text, numbers in occurrences(*describe(item)):
+            pool = available.get((check, text), [])
+            fits = [recorded for recorded in pool if len(recorded) == len(numbers)
+                    and all(n <= r for n, r in zip(numbers, recorded))]
+            if not fits:
+                break
+            # The tightest fit leaves larger recorded counts for later occurrences
+            best = min(fits, key=sum)
+            pool.remove(best)
+            taken.append((pool, best))
+        else:
+            known.append(item)
+            continue
+        for pool, recorded in taken:
+            pool.append(recorded)
+        new.append(item)
+    return new, known
+
+
+def passed_without_known(passed: int, total: int, new: list, known: list) -> int:
+    """Passed-check count once known errors are forgiven, consistent with the errors still shown.
+
+    All checks pass when no new error remains; otherwise checks whose errors
+    are all known are credited, short of a full pass.
+    """
+    new_errors = {issue.check for issue in new if issue.severity == 'error'}
+    if not new_errors:
+        return total
+    forgiven = {issue.check for issue in known if issue.severity == 'error'} - new_errors
+    return min(total - 1, passed + len(forgiven))
+
+
+def main():
+    if len(sys.argv) != 2 or sys.argv[1] in ('-h', '--help'):
+        print(__doc__.strip())
+        sys.exit(0 if len(sys.argv) == 2 else 1)
+
+    try:
+        files = load_baseline(Path(sys.argv[1]))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error: Cannot read baseline {sys.argv[1]}: {e}")
+        sys.exit(1)
+    for path, validators in sorted(files.items()):
+        for validator, entries in sorted(validators.items()):
+            checks = sorted({check for check, _, _ in entries})
+            print(f"{path} [{validator}]: {len(entries)} occurrence(s) of {', '.join(checks)}")
+
+
+if __name__ == "__main__":
+    main()
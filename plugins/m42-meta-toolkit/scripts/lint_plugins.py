@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+M42 Lint - Validate every artifact under a plugins root in one run
+
+Classifies artifacts by path and dispatches each to its validator:
+
+    skill     <dir>/SKILL.md               creating-skills/scripts/validate_skill.py
+    command   commands/*.md                creating-commands/scripts/validate_command.py
+    agent     agents/*.md                  creating-subagents/scripts/validate_subagent.py
+    claudemd  CLAUDE.md                    crafting-claudemd/scripts/validate_claudemd.py
+    doc       references/*.md, docs/**.md  writing-ai-docs/scripts/check_doc_quality.py
+
+Validators run in a shared process pool through validation_api (the same
+checks as each script's --minimal mode, without their output). An artifact
+fails when its validator reports an error; warnings are listed but do not fail.
+Each artifact runs under a time budget (--timeout); one that overruns is
+reported as "check timed out" rather than stalling the run.
+
+--changed [REV] lints only what a change touches: files from `git diff
+--name-only REV` (default HEAD, i.e. uncommitted work) plus untracked files are
+mapped to the artifacts that own them, then expanded to dependents - resources
+that reference a changed file (per analyze_cross_references) and commands,
+agents and skills that mention a changed skill.
+
+Usage:
+    python3 scripts/lint_plugins.py [plugins-root] [--jobs N] [--kind KIND]... [--quiet]
+    python3 scripts/lint_plugins.py [plugins-root] --changed [REV]
+"""
+
+import sys
+import os
+import re
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import validation_api
+from validation_api import validate_skill
+
+KINDS = ["skill", "command", "agent", "claudemd", "doc"]
+
+# Directories never walked
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+
+# Per-artifact time budget in seconds (--timeout)
+DEFAULT_TIMEOUT = 30
+
+
+def classify(root: Path) -> list:
+    """
+    Walk root and return sorted (kind, path) artifacts.
+
+    Skills are folders with SKILL.md; their other files are not artifacts of
+    their own, except references/*.md which are linted as docs.
+    """
+    artifacts = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        current = Path(dirpath)
+        parent = current.name
+
+        if "SKILL.md" in filenames:
+            artifacts.append(("skill", current))
+        for name in sorted(filenames):
+            path = current / name
+            if name == "CLAUDE.md":
+                artifacts.append(("claudemd", path))
+            elif not name.endswith(".md") or name == "SKILL.md":
+                continue
+            elif parent == "commands":
+                artifacts.append(("command", path))
+            elif parent == "agents":
+                artifacts.append(("agent", path))
+            elif parent == "references" or "docs" in path.relative_to(root).parts[:-1]:
+                artifacts.append(("doc", path))
+
+    return sorted(artifacts, key=lambda a: (KINDS.index(a[0]), str(a[1])))
+
+
+def git_changed_files(root: Path, rev: str = "HEAD") -> set:
+    """
+    Absolute paths changed since rev (working tree vs rev), plus untracked files.
+
+    Raises:
+        RuntimeError: not a git checkout or unknown rev
+    """
+    def git(*args):
+        proc = subprocess.run(["git", "-C", str(root), *args], capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip() or f"git {' '.join(args)} failed")
+        return proc.stdout
+
+    toplevel = Path(git("rev-parse", "--show-toplevel").strip())
+    names = git("diff", "--name-only", rev, "--").splitlines()
+    names += git("ls-files", "--others", "--exclude-standard").splitlines()
+    return {(toplevel / name).resolve() for name in names if name}
+
+
+def select_changed(artifacts: list, changed: set) -> tuple:
+    """
+    Pick the artifacts a set of changed files affects.
+
+    Returns:
+        (selected artifacts in input order, number added as dependents)
+    """
+    docs = {path: (kind, path) for kind, path in artifacts if kind == "doc"}
+    selected = set()
+    changed_skills = {}  # skill dir -> changed files inside it
+
+    for kind, path in artifacts:
+        if kind == "skill":
+            inside = {f for f in changed if f.is_relative_to(path)}
+            if inside:
+                selected.add((kind, path))
+                changed_skills[path] = inside
+        elif path in changed:
+            selected.add((kind, path))
+    direct = len(selected)
+
+    # Resources that reference a changed resource, from the skill's cross-reference graph
+    for skill_dir, files in changed_skills.items():
+        skill_md = skill_dir / "SKILL.md"
+        if not skill_md.is_file():
+            continue
+        xref = validate_skill.analyze_cross_references(skill_dir, skill_md.read_text(encoding="utf-8"))
+        for rel, info in xref["xref_map"].items():
+            if skill_dir / rel not in files:
+                continue
+            for referrer, _ in info["referenced_by"]:
+                if skill_dir / referrer in docs:
+                    selected.add(docs[skill_dir / referrer])
+
+    # Commands, agents and skills that mention a changed skill by name
+    if changed_skills:
+        names = re.compile(r"(?<![\w-])(" + "|".join(re.escape(d.name) for d in changed_skills) + r")(?![\w-])")
+        for kind, path in artifacts:
+            if (kind, path) in selected or kind not in ("skill", "command", "agent"):
+                continue
+            source = path / "SKILL.md" if kind == "skill" else path
+            try:
+                text = source.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            if any(m.group(1) != path.name for m in names.finditer(text)):
+                selected.add((kind, path))
+
+    return [a for a in artifacts if a in selected], len(selected) - direct
+
+
+def lint_artifact(artifact: tuple, timeout: float = 0) -> dict:
+    """Run the validator for one (kind, path). Returns a picklable result dict."""
+    kind, path = artifact
+    result = validation_api.validate(kind, path, timeout=timeout or None)
+    return {
+        "kind": kind,
+        "path": str(path),
+        "errors": [(issue.check, issue.fix) for issue in result.errors],
+        "warnings": [(issue.check, issue.fix) for issue in result.warnings],
+        "score": f"{result.passed}/{result.total}" if result.total else "",
+    }
+
+
+def run_lint(artifacts: list, jobs: int = 0, timeout: float = 0):
+    """Yield results in artifact order, validating up to `jobs` artifacts at once (0 = CPU count).
+
+    timeout > 0 gives each artifact that many seconds before it is reported as timed out.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(artifacts) <= 1:
+        for artifact in artifacts:
+            yield lint_artifact(artifact, timeout)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(artifacts))) as pool:
+        # map() preserves input order, so output stays deterministic
+        yield from pool.map(partial(lint_artifact, timeout=timeout), artifacts, chunksize=4)
+
+
+def print_result(result: dict, root: Path, quiet: bool = False) -> None:
+    """Print one artifact's result: a summary line plus errors and warnings."""
+    failed = bool(result["errors"])
+    if quiet and not failed:
+        return
+
+    rel = os.path.relpath(result["path"], root)
+    score = f"{result['score']} | " if result["score"] else ""
+    status = "✗ FAIL" if failed else "✓ PASS"
+    print(f"{result['kind']:<8} {rel}: {score}{len(result['errors'])} errors, "
+          f"{len(result['warnings'])} warnings | {status}")
+    for check, fix in result["errors"]:
+        print(f"  ✗ {check}: {fix}" if fix else f"  ✗ {check}")
+    if not quiet:
+        for check, _ in result["warnings"]:
+            print(f"  ⚠ {check}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Validate every skill, command, agent, CLAUDE.md and doc under a plugins root',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 scripts/lint_plugins.py plugins/
+  python3 scripts/lint_plugins.py plugins/ --kind skill --kind command
+  python3 scripts/lint_plugins.py plugins/m42-meta-toolkit --quiet --jobs 4
+        """
+    )
+    parser.add_argument('root', nargs='?', type=Path, default=Path('.'),
+                        help='Plugins root or single plugin directory (default: current directory)')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='Parallel workers (default: 0 = CPU count)')
+    parser.add_argument('--kind', action='append', choices=KINDS,
+                        help='Only lint this artifact kind (repeatable)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Only print failing artifacts and their errors')
+    parser.add_argument('--changed', nargs='?', const='HEAD', metavar='REV',
+                        help='Only lint artifacts affected by changes since REV (default: HEAD) and their dependents')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, metavar='SECONDS',
+                        help=f'Report an artifact as "check timed out" after SECONDS, 0 = no limit (default: {DEFAULT_TIMEOUT})')
+
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 (CPU count) or positive")
+    if args.timeout < 0:
+        parser.error("--timeout must be 0 (no limit) or positive")
+
+    root = args.root.resolve()
+    if not root.is_dir():
+        print(f"❌ Error: Not a directory: {root}")
+        sys.exit(1)
+
+    artifacts = classify(root)
+    if args.changed:
+        try:
+            changed = git_changed_files(root, args.changed)
+        except (OSError, RuntimeError) as e:
+            print(f"❌ Error: --changed needs a git checkout: {e}")
+            sys.exit(1)
+        artifacts, dependents = select_changed(artifacts, changed)
+        print(f"{len(changed)} changed files since {args.changed} → {len(artifacts)} artifacts "
+              f"({dependents} via references)\n")
+
+    artifacts = [a for a in artifacts if not args.kind or a[0] in args.kind]
+    if not artifacts:
+        print("No affected artifacts" if args.changed else f"No artifacts found under {root}")
+        sys.exit(0)
+
+    start = time.perf_counter()
+    failed = 0
+    for result in run_lint(artifacts, args.jobs, args.timeout):
+        print_result(result, root, args.quiet)
+        failed += bool(result["errors"])
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{len(artifacts)} artifacts: {len(artifacts) - failed} passed, {failed} failed ({elapsed:.2f}s)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
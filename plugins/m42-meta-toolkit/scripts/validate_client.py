@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+M42 Validate Client - Run a validator through the validation server
+
+Forwards the validator's CLI arguments to validation_server.py and streams
+its output back, exiting with the validator's exit code. When no server is
+listening, runs the validator script directly instead, so the client is always
+safe to call from hooks, commands and agents. It only talks to a socket owned by
+the current user, sends just the environment variables the validators read, and
+runs --watch directly (a watch never finishes, so the server does not take it).
+
+Validators: skill, command, agent, claudemd, doc, hook (see validation_server.py).
+
+Usage:
+    python3 scripts/validate_client.py <validator> [validator arguments...]
+"""
+
+import sys
+import os
+import json
+import socket
+
+# Stdlib-only import: the server's validators are loaded lazily
+from validation_server import (SKILLS_DIR, VALIDATORS, forwarded_env, is_own_socket,
+                               peer_is_self, socket_path)
+
+
+def run_direct(name: str, argv: list) -> None:
+    """Replace this process with the validator script."""
+    skill, module_name = VALIDATORS[name]
+    script = str(SKILLS_DIR / skill / "scripts" / f"{module_name}.py")
+    os.execv(sys.executable, [sys.executable, script, *argv])
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in VALIDATORS:
+        print(f"Usage: python3 validate_client.py <{'|'.join(VALIDATORS)}> [arguments...]", file=sys.stderr)
+        sys.exit(2)
+
+    name, argv = sys.argv[1], sys.argv[2:]
+    path = socket_path()
+    if "--watch" in argv or not is_own_socket(path):
+        run_direct(name, argv)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+        if not peer_is_self(sock):
+            raise ConnectionRefusedError(f"{path} is served by another user")
+    except OSError:
+        sock.close()
+        run_direct(name, argv)
+
+    request = {
+        "validator": name,
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": forwarded_env(os.environ),
+        # validate_hook.py reads settings from stdin when given '-'
+        "stdin": sys.stdin.read() if "-" in argv else None,
+    }
+    with sock, sock.makefile("rb") as responses:
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        for line in responses:
+            message = json.loads(line)
+            if "exit" in message:
+                sys.stdout.flush()
+                sys.exit(message["exit"])
+            stream = sys.stdout if message["stream"] == "stdout" else sys.stderr
+            stream.write(message["data"])
+            stream.flush()
+
+    print("❌ Error: validation server closed the connection", file=sys.stderr)
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+M42 Validation API - Run the toolkit validators in-process
+
+Library entry points for the skill, command, agent, CLAUDE.md, doc and hook
+validators. Each call returns a ValidationResult instead of printing or
+exiting, so validation can be embedded in other Python tools and services.
+Output is the caller's choice: pass a reporter (ConsoleReporter,
+JsonLinesReporter, CollectingReporter, or any object with check() and
+result() methods) to receive per-check events and finished results.
+
+Nothing here touches process-wide state: the validators route their check
+output through a context-local sink, so concurrent calls from several threads
+each see only their own events.
+
+With a timeout, a validation that overruns its time budget is interrupted
+(SIGALRM on the main thread, else a child process that is killed) and its
+result carries a "check timed out" error instead of the caller hanging on
+pathological content.
+
+    from validation_api import validate, ConsoleReporter
+    result = validate("skill", Path("skills/creating-skills"), reporter=ConsoleReporter())
+    if not result.ok:
+        ...
+
+Usage:
+    python3 scripts/validation_api.py <kind> <path>   # print the result as JSON
+"""
+
+import sys
+import json
+import time
+import signal
+import threading
+import multiprocessing
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent / "skills"
+for _scripts in ("creating-skills", "creating-commands", "creating-subagents",
+                 "crafting-claudemd", "writing-ai-docs", "creating-hooks"):
+    # Appended, so the caller's own modules are never shadowed by these scripts
+    if str(SKILLS_DIR / _scripts / "scripts") not in sys.path:
+        sys.path.append(str(SKILLS_DIR / _scripts / "scripts"))
+
+import validate_skill
+import validate_command
+import validate_subagent
+import validate_claudemd
+import check_doc_quality
+import validate_hook
+
+KINDS = ["skill", "command", "agent", "claudemd", "doc", "hook"]
+
+
+class Issue:
+    """One finding: severity is "error" or "warning"; location/expected/fix may be empty."""
+
+    # Batch runs keep many issues alive: no per-instance __dict__, check names and
+    # locations interned so repeats share one string
+    __slots__ = ("check", "severity", "location", "found", "expected", "fix")
+
+    def __init__(self, check: str, severity: str = "error", location: str = "",
+                 found: str = "", expected: str = "", fix: str = ""):
+        self.check = sys.intern(check)
+        self.severity = sys.intern(severity)
+        self.location = sys.intern(location)
+        self.found = found
+        self.expected = expected
+        self.fix = fix
+
+    def to_dict(self) -> Dict:
+        return {
+            "check": self.check,
+            "severity": self.severity,
+            "location": self.location,
+            "found": self.found,
+            "expected": self.expected,
+            "fix": self.fix,
+        }
+
+    def __repr__(self):
+        return f"Issue({self.severity}: {self.check})"
+
+
+class ValidationResult:
+    """Outcome of validating one artifact."""
+
+    def __init__(self, kind: str, path: Path):
+        self.kind = kind
+        self.path = Path(path)
+        self.passed = 0          # checks passed (validators that score checks)
+        self.total = 0           # checks run (0 when the validator does not score)
+        self.issues: List[Issue] = []
+        self.metrics: Dict = {}
+
+    @property
+    def errors(self) -> List[Issue]:
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def warnings(self) -> List[Issue]:
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+    @property
+    def ok(self) -> bool:
+        """True when there are no errors (warnings do not fail)."""
+        return not self.errors
+
+    def to_dict(self) -> Dict:
+        return {
+            "kind": self.kind,
+            "path": str(self.path),
+            "ok": self.ok,
+            "passed": self.passed,
+            "total": self.total,
+            "issues": [issue.to_dict() for issue in self.issues],
+            "metrics": self.metrics,
+        }
+
+
+class Reporter:
+    """Reporter base: receives check events while validating, then the result. Ignores both."""
+
+    def check(self, result: ValidationResult, kind: str, text: str) -> None:
+        """A check event: kind is header, section, pass, fail, skip, info or warn."""
+
+    def result(self, result: ValidationResult) -> None:
+        """A finished validation."""
+
+
+class ConsoleReporter(Reporter):
+    """Print results like the lint runner; verbose also prints every check line."""
+
+    def __init__(self, stream=None, verbose: bool = False):
+        self.stream = stream or sys.stdout
+        self.verbose = verbose
+        self._lock = threading.Lock()
+
+    def check(self, result, kind, text):
+        if self.verbose and kind not in ("header", "section"):
+            with self._lock:
+                print(f"  {validate_skill.CHECK_ICONS[kind][1]} {text}", file=self.stream)
+
+    def result(self, result):
+        score = f"{result.passed}/{result.total} | " if result.total else ""
+        status = "✓ PASS" if result.ok else "✗ FAIL"
+        lines = [f"{result.kind:<8} {result.path}: {score}{len(result.errors)} errors, "
+                 f"{len(result.warnings)} warnings | {status}"]
+        lines += [f"  ✗ {i.check}: {i.fix}" if i.fix else f"  ✗ {i.check}" for i in result.errors]
+        lines += [f"  ⚠ {i.check}" for i in result.warnings]
+        with self._lock:
+            print("\n".join(lines), file=self.stream)
+
+
+class JsonLinesReporter(Reporter):
+    """Write each result as one JSON line."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def result(self, result):
+        with self._lock:
+            self.stream.write(json.dumps(result.to_dict()) + "\n")
+            self.stream.flush()
+
+
+class CollectingReporter(Reporter):
+    """Keep every result (and, optionally, check event) in memory."""
+
+    def __init__(self, keep_checks: bool = False):
+        self.keep_checks = keep_checks
+        self.results: List[ValidationResult] = []
+        self.checks: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def check(self, result, kind, text):
+        if self.keep_checks:
+            with self._lock:
+                self.checks.append((str(result.path), kind, text))
+
+    def result(self, result):
+        with self._lock:
+            self.results.append(result)
+
+
+def _from_validation_issues(result: ValidationResult, issues) -> None:
+    for i in issues:
+        result.issues.append(Issue(i.check, i.severity, i.location, i.found, i.expected, i.fix))
+
+
+def _run_scored(result: ValidationResult, module, validate, reporter: Optional[Reporter]) -> None:
+    """Run a check-printing validator with its events routed to the reporter."""
+    sink = (lambda kind, text: reporter.check(result, kind, text)) if reporter else None
+    with module.check_sink(sink):
+        issues, result.passed, result.total, extra = validate(result.path)
+    _from_validation_issues(result, issues)
+    if isinstance(extra, dict):
+        result.metrics = extra
+
+
+def _validate_claudemd(result: ValidationResult, extra_rules: Optional[list]) -> None:
+    # Rule table and import cache belong to this call: concurrent calls share nothing
+    compiled = validate_claudemd.compile_rules(validate_claudemd.ANTIPATTERN_RULES + extra_rules) if extra_rules else None
+    checks = validate_claudemd.validate_claudemd(result.path, compiled, import_cache={})
+    for status, check, detail in checks:
+        if status == validate_claudemd.FAIL:
+            result.issues.append(Issue(check, "error", str(result.path), fix=detail))
+        elif status == validate_claudemd.WARN:
+            result.issues.append(Issue(f"{check}: {detail}", "warning", str(result.path), found=detail))
+    result.passed = sum(1 for status, _, _ in checks if status == validate_claudemd.PASS)
+    result.total = len(checks)
+
+
+def _validate_doc(result: ValidationResult) -> None:
+    quality = check_doc_quality.analyze_quality(result.path)
+    result.issues += [Issue(e, "error", str(result.path)) for e in quality["errors"]]
+    result.issues += [Issue(w, "warning", str(result.path)) for w in quality["warnings"]]
+    result.metrics = quality["metrics"]
+
+
+def _validate_hooks(result: ValidationResult) -> None:
+    _, _, hooks_config = validate_hook.load_hooks_source(str(result.path))
+    for location, messages in validate_hook.validate_full_hooks_config(hooks_config).items():
+        result.issues += [Issue(message, "error", location) for message in messages]
+    result.metrics = {
+        event: dict(zip(("commands", "unique_commands"), validate_hook.count_commands(configs)))
+        for event, configs in hooks_config.items() if isinstance(configs, list)
+    }
+
+
+class _TrackingReporter(Reporter):
+    """Remember the last check event (for timeout messages) and forward to another reporter."""
+
+    def __init__(self, reporter: Optional[Reporter] = None, conn=None):
+        self.reporter = reporter
+        self.conn = conn  # a child process's pipe to its parent
+        self.last_check = ""
+        self.finished = False
+
+    def check(self, result, kind, text):
+        self.last_check = text
+        if self.conn:
+            self.conn.send(("check", kind, text))
+        if self.reporter:
+            self.reporter.check(result, kind, text)
+
+    def result(self, result):
+        self.finished = True
+        if self.reporter:
+            self.reporter.result(result)
+
+
+def _timed_out(result: ValidationResult, timeout: float, last_check: str) -> None:
+    result.issues.append(Issue(
+        "check timed out", "error", str(result.path),
+        found=f"Validation still running after {timeout:g}s"
+              + (f" (last check: {last_check})" if last_check else ""),
+        fix="Look for very long lines or unusual repetition in the file; "
+            "run check_regex_performance.py if the file looks normal"))
+
+
+def _validate_with_alarm(kind: str, path: Path, reporter: Optional[Reporter],
+                         extra_rules: Optional[list], timeout: float) -> ValidationResult:
+    """Run validate() under the validators' SIGALRM time_limit (main thread only).
+
+    An alarm the caller already armed is honoured and re-armed afterwards.
+    """
+    tracker = _TrackingReporter(reporter)
+    result = ValidationResult(kind, path)
+    try:
+        with validate_skill.time_limit(timeout):
+            result = validate(kind, path, tracker, extra_rules)
+    except validate_skill.CheckTimedOut:
+        if not tracker.finished:
+            _timed_out(result, timeout, tracker.last_check)
+            if reporter:
+                reporter.result(result)
+    return result
+
+
+def _validate_in_child(conn, kind: str, path: Path, extra_rules: Optional[list]) -> None:
+    conn.send(("result", validate(kind, path, _TrackingReporter(conn=conn), extra_rules)))
+    conn.close()
+
+
+def _validate_in_process(kind: str, path: Path, reporter: Optional[Reporter],
+                         extra_rules: Optional[list], timeout: float) -> ValidationResult:
+    """Run validate() in a child process, killing it after timeout seconds (for non-main threads)."""
+    # Not fork: this runs on non-main threads, and forking a threaded process
+    # can deadlock the child on a lock another thread held
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    child = context.Process(target=_validate_in_child, args=(sender, kind, path, extra_rules), daemon=True)
+    child.start()
+    sender.close()
+
+    result = ValidationResult(kind, path)
+    last_check = ""
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not receiver.poll(remaining):
+                child.kill()
+                _timed_out(result, timeout, last_check)
+                break
+            try:
+                message = receiver.recv()
+            except EOFError:  # the child died without sending a result
+                result.issues.append(Issue("validator crashed", "error", str(path),
+                                           fix=f"Validation process exited with code {child.exitcode}"))
+                break
+            if message[0] == "result":
+                result = message[1]
+                break
+            last_check = message[2]
+            if reporter:
+                reporter.check(result, message[1], message[2])
+    finally:
+        receiver.close()
+        child.join()
+
+    if reporter:
+        reporter.result(result)
+    return result
+
+
+def validate(kind: str, path: Path, reporter: Optional[Reporter] = None,
+             extra_rules: Optional[list] = None, timeout: Optional[float] = None) -> ValidationResult:
+    """
+    Validate one artifact.
+
+    Args:
+        kind: skill (folder), command, agent, claudemd, doc (markdown files) or hook (settings file)
+        path: Artifact path
+        reporter: Receives check events and the result (default: none)
+        extra_rules: claudemd only - extra anti-pattern rules (validate_claudemd.load_rules format)
+        timeout: Time budget in seconds; an overrun is stopped and reported as a
+            "check timed out" error (default: no budget). Enforced with SIGALRM on
+            the main thread, else by validating in a forkserver (or spawn) child
+            process, which needs the calling script's `if __name__ == "__main__":` guard
+
+    Returns:
+        ValidationResult; an unreadable or crashing artifact is reported as an error issue
+
+    Raises:
+        ValueError: unknown kind
+    """
+    if kind not in KINDS:
+        raise ValueError(f"unknown kind {kind!r} (expected one of: {', '.join(KINDS)})")
+
+    if timeout:
+        if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+            return _validate_with_alarm(kind, path, reporter, extra_rules, timeout)
+        # Daemonic processes (e.g. multiprocessing.Pool workers) cannot start children
+        if not multiprocessing.current_process().daemon:
+            return _validate_in_process(kind, path, reporter, extra_rules, timeout)
+
+    result = ValidationResult(kind, path)
+    try:
+        if kind == "skill":
+            _run_scored(result, validate_skill, validate_skill.validate_skill_md, reporter)
+        elif kind == "command":
+            _run_scored(result, validate_command, validate_command.validate_command, reporter)
+        elif kind == "agent":
+            _run_scored(result, validate_subagent, validate_subagent.validate_subagent, reporter)
+        elif kind == "claudemd":
+            _validate_claudemd(result, extra_rules)
+        elif kind == "doc":
+            _validate_doc(result)
+        else:
+            _validate_hooks(result)
+    except Exception as e:  # one broken artifact must not take down the caller
+        result.issues.append(Issue("validator crashed", "error", str(path), fix=f"{type(e).__name__}: {e}"))
+
+    if reporter:
+        reporter.result(result)
+    return result
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in KINDS:
+        print(f"Usage: python3 validation_api.py <{'|'.join(KINDS)}> <path>")
+        sys.exit(1)
+
+    result = validate(sys.argv[1], Path(sys.argv[2]))
+    print(json.dumps(result.to_dict(), indent=2))
+    sys.exit(0 if result.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
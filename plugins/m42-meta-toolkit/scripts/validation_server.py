@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+M42 Validation Server - Keep the validators loaded between runs
+
+Runs the toolkit's validators in one long-lived process behind a Unix socket,
+so repeated validations skip interpreter startup, the PyYAML import and regex
+compilation. validate_client.py forwards a validator's CLI arguments here and
+streams its output back; the output and exit code match running the script.
+
+    skill     creating-skills/scripts/validate_skill.py
+    command   creating-commands/scripts/validate_command.py
+    agent     creating-subagents/scripts/validate_subagent.py
+    claudemd  crafting-claudemd/scripts/validate_claudemd.py
+    doc       writing-ai-docs/scripts/check_doc_quality.py
+    hook      creating-hooks/scripts/validate_hook.py
+
+Requests run one at a time in the client's working directory, with the few
+environment variables the validators read (FORWARDED_ENV). Frontmatter parses
+are cached by content; path-keyed caches are cleared before every request, and
+a validator whose source file changed is reloaded. The server is single-
+threaded, so a request is cut off when the client stalls for CLIENT_TIMEOUT
+seconds or validation runs past --request-timeout, and --watch is refused.
+
+Protocol: the client sends one JSON line {"validator", "argv", "cwd", "env",
+"stdin"}; the server answers with JSON lines {"stream": "stdout"|"stderr",
+"data"} and a final {"exit": code}. {"command": "ping"|"shutdown"} checks for
+or stops the server.
+
+Socket: $M42_VALIDATION_SOCKET, else $XDG_RUNTIME_DIR/m42-validation.sock,
+else m42-validation-<uid>/validation.sock in the temp directory. The socket is
+created 0600 and the fallback directory 0700; clients only connect to a socket
+owned by their own user.
+
+Usage:
+    python3 scripts/validation_server.py [--socket PATH] [--idle-timeout SECONDS] [--request-timeout SECONDS]
+    python3 scripts/validation_server.py --stop
+"""
+
+import sys
+import os
+import io
+import copy
+import json
+import stat
+import signal
+import socket
+import struct
+import tempfile
+import importlib
+import contextlib
+import socketserver
+import traceback
+from collections import OrderedDict
+from pathlib import Path
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent / "skills"
+
+# validator name -> (skill folder, module)
+VALIDATORS = {
+    "skill": ("creating-skills", "validate_skill"),
+    "command": ("creating-commands", "validate_command"),
+    "agent": ("creating-subagents", "validate_subagent"),
+    "claudemd": ("crafting-claudemd", "validate_claudemd"),
+    "doc": ("writing-ai-docs", "check_doc_quality"),
+    "hook": ("creating-hooks", "validate_hook"),
+}
+
+for _skill, _ in VALIDATORS.values():
+    sys.path.insert(0, str(SKILLS_DIR / _skill / "scripts"))
+
+# Frontmatter parses kept per content string
+PARSE_CACHE_SIZE = 1024
+
+DEFAULT_IDLE_TIMEOUT = 1800
+# Longest a single validation may run before the server reports a timeout
+DEFAULT_REQUEST_TIMEOUT = 120
+# Longest the server waits on a client read or write
+CLIENT_TIMEOUT = 10
+
+# The only environment the validators read (home, validation cache location);
+# nothing else from the client's environment is sent or applied
+FORWARDED_ENV = ('HOME', 'XDG_CACHE_HOME', 'M42_VALIDATION_CACHE_DIR')
+
+
+def socket_path() -> Path:
+    """Default socket path shared by server and client."""
+    override = os.environ.get("M42_VALIDATION_SOCKET")
+    if override:
+        return Path(override).expanduser()
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "m42-validation.sock"
+    return Path(tempfile.gettempdir()) / f"m42-validation-{os.getuid()}" / "validation.sock"
+
+
+def is_own_socket(path: Path) -> bool:
+    """True if path is a socket (not a symlink) owned by the current user."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def peer_is_self(sock: socket.socket) -> bool:
+    """True if the process on the other end runs as the current user (where the OS reports it)."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True  # no peer credentials (macOS); the socket owner check still applies
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+def forwarded_env(env: dict) -> dict:
+    """The FORWARDED_ENV subset of an environment."""
+    return {key: env[key] for key in FORWARDED_ENV if key in env}
+
+
+def cached_parser(parse):
+    """Wrap a parse_yaml_frontmatter(content) so each distinct content is parsed once."""
+    cache = OrderedDict()
+
+    def wrapper(content):
+        if content in cache:
+            cache.move_to_end(content)
+        else:
+            cache[content] = parse(content)
+            if len(cache) > PARSE_CACHE_SIZE:
+                cache.popitem(last=False)
+        # Callers may mutate the parsed frontmatter; hand out copies
+        return copy.deepcopy(cache[content])
+
+    wrapper.cache = cache
+    wrapper.__wrapped__ = parse
+    return wrapper
+
+
+class ValidatorPool:
+    """Loaded validator modules, reloaded when their source changes."""
+
+    def __init__(self):
+        self.modules = {}
+        self.mtimes = {}
+        for name in VALIDATORS:
+            self.load(name)
+
+    def load(self, name: str):
+        _, module_name = VALIDATORS[name]
+        if module_name in sys.modules and name in self.modules:
+            module = importlib.reload(sys.modules[module_name])
+        else:
+            module = importlib.import_module(module_name)
+        if hasattr(module, "parse_yaml_frontmatter"):
+            module.parse_yaml_frontmatter = cached_parser(module.parse_yaml_frontmatter)
+        self.modules[name] = module
+        self.mtimes[name] = Path(module.__file__).stat().st_mtime_ns
+        return module
+
+    def get(self, name: str):
+        """Return a validator module ready for a fresh run."""
+        module = self.modules[name]
+        if Path(module.__file__).stat().st_mtime_ns != self.mtimes[name]:
+            module = self.load(name)
+
+        # Reset per-run state: minimal mode and caches keyed by path
+        if hasattr(module, "set_minimal_mode"):
+            module.set_minimal_mode(False)
+        for value in vars(module).values():
+            if callable(getattr(value, "cache_clear", None)):
+                value.cache_clear()
+        return module
+
+
+class StreamWriter(io.TextIOBase):
+    """Text stream that forwards every write to the client as a JSON line."""
+
+    def __init__(self, wfile, stream: str):
+        self.wfile = wfile
+        self.stream = stream
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if data:
+            self.wfile.write(json.dumps({"stream": self.stream, "data": data}).encode("utf-8") + b"\n")
+            self.wfile.flush()
+        return len(data)
+
+
+@contextlib.contextmanager
+def client_context(request: dict):
+    """Run with the client's argv, cwd, forwarded environment and stdin; restore afterwards."""
+    saved = (sys.argv, os.getcwd(), forwarded_env(os.environ), sys.stdin)
+    name = request["validator"]
+    skill, module_name = VALIDATORS[name]
+    sys.argv = [str(SKILLS_DIR / skill / "scripts" / f"{module_name}.py"), *request.get("argv", [])]
+    if request.get("env") is not None:
+        for key in FORWARDED_ENV:
+            os.environ.pop(key, None)
+        os.environ.update(forwarded_env(request["env"]))
+    sys.stdin = io.StringIO(request.get("stdin") or "")
+    try:
+        os.chdir(request.get("cwd") or saved[1])
+        yield
+    finally:
+        sys.argv, sys.stdin = saved[0], saved[3]
+        os.chdir(saved[1])
+        for key in FORWARDED_ENV:
+            os.environ.pop(key, None)
+        os.environ.update(saved[2])
+
+
+class RequestTimedOut(BaseException):
+    """Raised by the alarm in the validator's frame; BaseException so validators cannot swallow it."""
+
+
+@contextlib.contextmanager
+def time_limit(seconds: float):
+    """Raise RequestTimedOut if the block runs longer than seconds (0 = no limit)."""
+    if not seconds:
+        yield
+        return
+
+    def expire(signum, frame):
+        raise RequestTimedOut()
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class ValidationHandler(socketserver.StreamRequestHandler):
+    # Socket timeout for every read and write, so a stalled client cannot hold the server
+    timeout = CLIENT_TIMEOUT
+
+    def handle(self):
+        if not peer_is_self(self.connection):
+            return
+        try:
+            request = json.loads(self.rfile.readline())
+        except (ValueError, OSError):
+            return
+        if request.get("command") in ("ping", "shutdown"):
+            self.wfile.write(b'{"exit": 0}\n')
+            self.server.shutdown_requested = request["command"] == "shutdown"
+            return
+        if request.get("validator") not in VALIDATORS:
+            self.wfile.write(json.dumps({"stream": "stderr", "data": f"Unknown validator: {request.get('validator')}\n"}).encode("utf-8") + b"\n")
+            self.wfile.write(b'{"exit": 2}\n')
+            return
+        if "--watch" in request.get("argv", []):
+            # Never returns; would block every other client
+            self.wfile.write(json.dumps({"stream": "stderr", "data": "--watch is not served; run the validator directly\n"}).encode("utf-8") + b"\n")
+            self.wfile.write(b'{"exit": 2}\n')
+            return
+
+        out, err = StreamWriter(self.wfile, "stdout"), StreamWriter(self.wfile, "stderr")
+        code = 0
+        try:
+            with client_context(request), contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                try:
+                    with time_limit(self.server.request_timeout):
+                        self.server.pool.get(request["validator"]).main()
+                except RequestTimedOut:
+                    print(f"❌ Error: validation timed out after {self.server.request_timeout:g}s", file=sys.stderr)
+                    code = 1
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        code = e.code or 0
+                    else:
+                        print(e.code, file=sys.stderr)
+                        code = 1
+                except Exception:  # report like an uncaught exception, keep serving
+                    traceback.print_exc()
+                    code = 1
+            self.wfile.write(json.dumps({"exit": code}).encode("utf-8") + b"\n")
+        except (BrokenPipeError, ConnectionResetError, TimeoutError):
+            pass  # client went away or stopped reading
+
+
+class ValidationServer(socketserver.UnixStreamServer):
+    """Serves one request at a time: validators use process-wide state (cwd, argv, stdout)."""
+
+    def __init__(self, path: Path, idle_timeout: float, request_timeout: float = DEFAULT_REQUEST_TIMEOUT):
+        self.pool = ValidatorPool()
+        self.shutdown_requested = False
+        self.timeout = idle_timeout or None
+        self.request_timeout = request_timeout
+        super().__init__(str(path), ValidationHandler, bind_and_activate=False)
+        # Create the socket 0600 from the start: no window where others can connect
+        umask = os.umask(0o177)
+        try:
+            self.server_bind()
+        finally:
+            os.umask(umask)
+        self.server_activate()
+
+    def handle_timeout(self):
+        self.shutdown_requested = True
+
+
+def send_command(path: Path, command: str) -> bool:
+    """Send "ping" or "shutdown" to a server. Returns False if none of ours is listening."""
+    if not is_own_socket(path):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(str(path))
+            if not peer_is_self(sock):
+                return False
+            sock.sendall(json.dumps({"command": command}).encode("utf-8") + b"\n")
+            sock.recv(64)
+    except OSError:
+        return False
+    return True
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Serve the toolkit validators over a Unix socket (see validate_client.py)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 scripts/validation_server.py &
+  python3 scripts/validate_client.py skill skills/creating-skills --minimal
+  python3 scripts/validation_server.py --stop
+        """
+    )
+    parser.add_argument('--socket', type=Path, default=None,
+                        help='Socket path (default: $M42_VALIDATION_SOCKET or a per-user runtime path)')
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help=f'Exit after this many idle seconds, 0 = never (default: {DEFAULT_IDLE_TIMEOUT})')
+    parser.add_argument('--request-timeout', type=float, default=DEFAULT_REQUEST_TIMEOUT,
+                        help=f'Fail a validation running longer than this many seconds, 0 = never '
+                             f'(default: {DEFAULT_REQUEST_TIMEOUT})')
+    parser.add_argument('--stop', action='store_true', help='Stop the running server and exit')
+    args = parser.parse_args()
+
+    path = args.socket or socket_path()
+    if args.stop:
+        if send_command(path, "shutdown"):
+            print(f"Stopped validation server at {path}")
+            sys.exit(0)
+        print(f"No validation server at {path}")
+        sys.exit(1)
+
+    if args.socket is None and not os.environ.get("M42_VALIDATION_SOCKET"):
+        # Default location: a directory only this user can enter
+        path.parent.mkdir(mode=0o700, exist_ok=True)
+        st = os.lstat(path.parent)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+            print(f"❌ Error: {path.parent} must be a directory owned by you with mode 0700")
+            sys.exit(1)
+
+    if path.exists() or path.is_symlink():
+        if send_command(path, "ping"):
+            print(f"❌ Error: A validation server is already running at {path}")
+            sys.exit(1)
+        path.unlink()  # stale socket from a crashed server
+
+    server = ValidationServer(path, args.idle_timeout, args.request_timeout)
+    print(f"Validation server listening on {path}", flush=True)
+    try:
+        while not server.shutdown_requested:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ Usage:
     validate_claudemd.py <file-or-directory>
     validate_claudemd.py /path/to/CLAUDE.md        # Validate single file
     validate_claudemd.py /path/to/project           # Validate all CLAUDE.md files
+    validate_claudemd.py /path/to/project --jobs 8  # Validate files in parallel
+    validate_claudemd.py /path/to/project --timeout 10  # Fail files still running after 10s
+    validate_claudemd.py /path/to/project --baseline .m42-baseline.json --new-only
 
 Checks:
     - File size and line count (warns >300 lines, errors >500)
@@ -13,17 +16,46 @@ Checks:
     - Anti-patterns (vague instructions, duplicate linter rules, over-specification)
     - Writing style (imperative form, negative-only constraints, emphasis overuse)
     - Content coverage (essential sections present)
+    - Startup cost (transitive @import graph, cycles, chars/tokens loaded per session)
 """
 
+import json
+import os
 import sys
 import re
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 
+# Shared --baseline helper in the plugin's scripts/; absent when this skill is packaged on its own
+_PLUGIN_SCRIPTS = Path(__file__).resolve().parents[3] / 'scripts'
+if (_PLUGIN_SCRIPTS / 'issue_baseline.py').is_file() and str(_PLUGIN_SCRIPTS) not in sys.path:
+    sys.path.append(str(_PLUGIN_SCRIPTS))
+try:
+    import issue_baseline
+except ImportError:
+    issue_baseline = None
+
 PASS = "\033[32m✓\033[0m"
 WARN = "\033[33m⚠\033[0m"
 FAIL = "\033[31m✗\033[0m"
 INFO = "\033[36mℹ\033[0m"
 
+# Claude Code follows @imports up to 5 hops from the importing CLAUDE.md
+MAX_IMPORT_DEPTH = 5
+# ~500 lines of typical CLAUDE.md prose; above this every session pays noticeably
+STARTUP_TOKEN_BUDGET = 5000
+# Rough token estimate (1 token ≈ 4 characters)
+CHARS_PER_TOKEN = 4
+
+# @imports are explicit paths (./, ../, ~/, /) or bare paths ending in a file
+# extension (@README.md, @docs/guide.md); npm scopes and handles such as
+# @types/node or @company/sdk are not
+IMPORT_PATTERN = re.compile(r'(?<![\w`])@((?:~/|\.{1,2}/|/)[\w.\-/]+|[\w\-][\w.\-/]*\.[A-Za-z]\w*)(?![\w\-/])')
+
 
 def find_claudemd_files(target: Path) -> list[Path]:
     """Find all CLAUDE.md and CLAUDE.local.md files in target."""
@@ -93,79 +125,339 @@ def check_structure(lines: list[str]) -> list[tuple[str, str, str]]:
     return results
 
 
-def check_antipatterns(content: str, lines: list[str]) -> list[tuple[str, str, str]]:
-    """Check for common anti-patterns."""
+# Declarative anti-pattern rules, compiled once by compile_rules().
+#
+# Each rule produces one result line. Keys:
+#   check       - result label (pass_check overrides it for the passing line)
+#   patterns    - list of regexes, matched per line
+#   ignorecase  - compile with re.IGNORECASE
+#   unless      - drop a match if this regex is found in the matched text
+#   count       - 'matches' (every occurrence) or 'patterns' (distinct patterns hit)
+#   warn_above  - count above which the rule warns (None = never)
+#   fail_above  - count above which the rule fails (None = never)
+#   pass/warn/fail - detail messages, formatted with {count}
+#   combine     - scan together with other rules of the same case mode (default:
+#                 True unless anchored with ^); combined rules only see the
+#                 leftmost non-overlapping match, so set False for overlapping rules
+ANTIPATTERN_RULES = [
+    {
+        'check': "Vague instructions",
+        'patterns': [
+            r'\b(format|write|handle)\s+(code\s+)?properly\b',
+            r'\bbe careful with\b',
+            r'\btry to\b',
+            r'\bplease\b',
+        ],
+        'ignorecase': True,
+        'warn_above': 0,
+        'fail_above': 2,
+        'pass': "None detected",
+        'warn': "{count} found - consider making more specific",
+        'fail': "{count} found - rewrite as specific directives",
+    },
+    {
+        'check': "Negative-only constraints",
+        'patterns': [r'^[*-]\s*(?:never|don\'?t|do not|avoid)\s+[^.]+(?:\.|$)'],
+        'unless': r'\b(instead|prefer|use|rather)\b',
+        'ignorecase': True,
+        'warn_above': 0,
+        'pass': "All prohibitions include alternatives",
+        'warn': "{count} prohibitions without alternatives",
+    },
+    {
+        'check': "Emphasis overuse",
+        'pass_check': "Emphasis usage",
+        'patterns': [r'\bIMPORTANT\b', r'\bMUST\b', r'\bNEVER\b'],
+        'warn_above': 5,
+        'fail_above': 10,
+        'pass': "{count} emphatic markers (appropriate)",
+        'warn': "{count} emphatic markers - consider reserving for critical rules",
+        'fail': "{count} emphatic markers (IMPORTANT/MUST/NEVER) - dilutes impact",
+    },
+    {
+        'check': "Obvious documentation",
+        'patterns': [
+            r'the\s+[/`]?tests[/`]?\s+(?:directory|folder)\s+contains\s+test',
+            r'the\s+[/`]?src[/`]?\s+(?:directory|folder)\s+contains\s+source',
+            r'the\s+[/`]?components[/`]?\s+(?:directory|folder)\s+contains\s+component',
+        ],
+        'ignorecase': True,
+        'count': 'patterns',
+        'warn_above': 0,
+        'pass': "No trivially obvious statements",
+        'warn': "{count} statements explaining obvious directory structure",
+    },
+    {
+        'check': "@import usage",
+        'patterns': [r'^@\S+\.md\s*$'],
+        'warn_above': 5,
+        'pass': "{count} @imports",
+        'warn': "{count} @imports (each loads at startup - consider motivated pointers)",
+    },
+]
+
+RULE_KEYS = {'check', 'pass_check', 'patterns', 'ignorecase', 'unless', 'count',
+             'warn_above', 'fail_above', 'pass', 'warn', 'fail', 'combine'}
+
+# Numbered backreference (\1) or conditional ((?(1)...)) outside an escaped
+# backslash. Group numbers shift inside the combined alternation, so patterns
+# with these are always scanned on their own
+GROUP_NUMBER_REFERENCE = re.compile(r'(?<!\\)(?:\\\\)*\\[1-9]|\(\?\(\d')
+
+
+def compile_rules(rules: list[dict]) -> dict:
+    """Compile a rule table into grouped regexes so each line is scanned once.
+
+    Combinable rules with the same case mode share one alternation with a named
+    group per pattern; anchored or non-combinable rules, and patterns that refer
+    to groups by number, keep their own regex.
+    """
+    scans = []
+    grouped = {True: [], False: []}
+
+    for rule_idx, rule in enumerate(rules):
+        flags = re.IGNORECASE if rule.get('ignorecase') else 0
+        unless = re.compile(rule['unless'], flags) if rule.get('unless') else None
+        anchored = any(p.startswith('^') for p in rule['patterns'])
+        combine = rule.get('combine', not anchored)
+
+        for pat_idx, pattern in enumerate(rule['patterns']):
+            re.compile(pattern, flags)  # surface bad patterns with a clear error
+            key = (rule_idx, pat_idx, unless)
+            if combine and not GROUP_NUMBER_REFERENCE.search(pattern):
+                grouped[bool(flags)].append((key, pattern))
+            else:
+                scans.append((re.compile(pattern, flags), {None: key}))
+
+    for ignorecase, members in grouped.items():
+        if not members:
+            continue
+        flags = re.IGNORECASE if ignorecase else 0
+        alternation = '|'.join(f'(?P<r{i}>{pattern})' for i, (_, pattern) in enumerate(members))
+        try:
+            regex = re.compile(alternation, flags)
+        except re.error:
+            # e.g. inline global flags inside a user pattern; fall back to one scan each
+            for key, pattern in members:
+                scans.append((re.compile(pattern, flags), {None: key}))
+            continue
+        scans.append((regex, {f'r{i}': key for i, (key, _) in enumerate(members)}))
+
+    return {'rules': rules, 'scans': scans}
+
+
+def load_rules(config_path: Path) -> list[dict]:
+    """Load extra anti-pattern rules from a JSON file ({"rules": [...]} or [...])."""
+    data = json.loads(config_path.read_text(encoding="utf-8"))
+    rules = data.get('rules', []) if isinstance(data, dict) else data
+    if not isinstance(rules, list):
+        raise ValueError("'rules' must be a list")
+
+    for i, rule in enumerate(rules):
+        if not isinstance(rule, dict):
+            raise ValueError(f"rule {i} must be an object")
+        for field in ('check', 'patterns'):
+            if field not in rule:
+                raise ValueError(f"rule {i}: missing required '{field}'")
+        if not isinstance(rule['patterns'], list) or not rule['patterns']:
+            raise ValueError(f"rule {i}: 'patterns' must be a non-empty list")
+        unknown = set(rule) - RULE_KEYS
+        if unknown:
+            raise ValueError(f"rule {i}: unknown keys: {', '.join(sorted(unknown))}")
+        rule.setdefault('warn_above', 0)
+        rule.setdefault('pass', "None detected")
+        rule.setdefault('warn', "{count} found")
+    return rules
+
+
+# Built-in rules only; never reassigned. Extra rules travel as an explicit
+# compile_rules(ANTIPATTERN_RULES + extra) table through validate_claudemd()
+DEFAULT_RULES = compile_rules(ANTIPATTERN_RULES)
+
+
+def check_antipatterns(content: str, lines: list[str], compiled: dict | None = None) -> list[tuple[str, str, str]]:
+    """Check for common anti-patterns in a single pass over the lines.
+
+    compiled is a compile_rules() table; defaults to DEFAULT_RULES.
+    """
+    compiled = compiled or DEFAULT_RULES
+    rules = compiled['rules']
+    scans = compiled['scans']
+    match_counts = [0] * len(rules)
+    patterns_hit = [set() for _ in rules]
+
+    for line in lines:
+        for regex, keys in scans:
+            for match in regex.finditer(line):
+                rule_idx, pat_idx, unless = keys[match.lastgroup] if match.lastgroup in keys else keys[None]
+                if unless and unless.search(match.group()):
+                    continue
+                match_counts[rule_idx] += 1
+                patterns_hit[rule_idx].add(pat_idx)
+
     results = []
+    for rule_idx, rule in enumerate(rules):
+        if rule.get('count') == 'patterns':
+            count = len(patterns_hit[rule_idx])
+        else:
+            count = match_counts[rule_idx]
+
+        fail_above = rule.get('fail_above')
+        warn_above = rule.get('warn_above')
+        if fail_above is not None and count > fail_above:
+            results.append((FAIL, rule['check'], rule['fail'].format(count=count)))
+        elif warn_above is not None and count > warn_above:
+            results.append((WARN, rule['check'], rule['warn'].format(count=count)))
+        else:
+            results.append((PASS, rule.get('pass_check', rule['check']), rule['pass'].format(count=count)))
 
-    # Vague instructions
-    vague_patterns = [
-        (r'\b(format|write|handle)\s+(code\s+)?properly\b', "vague instruction"),
-        (r'\bbe careful with\b', "vague instruction"),
-        (r'\btry to\b', "weak instruction (use imperative)"),
-        (r'\bplease\b', "unnecessary politeness (use imperative)"),
-    ]
-    vague_count = 0
-    for pattern, desc in vague_patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        if matches:
-            vague_count += len(matches)
-
-    if vague_count == 0:
-        results.append((PASS, "Vague instructions", "None detected"))
-    elif vague_count <= 2:
-        results.append((WARN, "Vague instructions", f"{vague_count} found - consider making more specific"))
-    else:
-        results.append((FAIL, "Vague instructions", f"{vague_count} found - rewrite as specific directives"))
+    return results
 
-    # Negative-only constraints (prohibitions without alternatives)
-    negative_only = re.findall(
-        r'^[*-]\s*(?:never|don\'?t|do not|avoid)\s+[^.]+(?:\.|$)',
-        content, re.MULTILINE | re.IGNORECASE
-    )
-    # Filter out those that include "instead" or "prefer" or "use X"
-    truly_negative = [n for n in negative_only
-                      if not re.search(r'\b(instead|prefer|use|rather)\b', n, re.IGNORECASE)]
-    if truly_negative:
-        results.append((WARN, "Negative-only constraints",
-                        f"{len(truly_negative)} prohibitions without alternatives"))
-    else:
-        results.append((PASS, "Negative-only constraints", "All prohibitions include alternatives"))
-
-    # Emphasis overuse
-    important_count = len(re.findall(r'\bIMPORTANT\b', content))
-    must_count = len(re.findall(r'\bMUST\b', content))
-    never_caps = len(re.findall(r'\bNEVER\b', content))
-    emphasis_total = important_count + must_count + never_caps
-
-    if emphasis_total > 10:
-        results.append((FAIL, "Emphasis overuse",
-                        f"{emphasis_total} emphatic markers (IMPORTANT/MUST/NEVER) - dilutes impact"))
-    elif emphasis_total > 5:
-        results.append((WARN, "Emphasis overuse",
-                        f"{emphasis_total} emphatic markers - consider reserving for critical rules"))
-    else:
-        results.append((PASS, "Emphasis usage", f"{emphasis_total} emphatic markers (appropriate)"))
-
-    # Obvious structure documentation
-    obvious_patterns = [
-        r'the\s+[/`]?tests[/`]?\s+(?:directory|folder)\s+contains\s+test',
-        r'the\s+[/`]?src[/`]?\s+(?:directory|folder)\s+contains\s+source',
-        r'the\s+[/`]?components[/`]?\s+(?:directory|folder)\s+contains\s+component',
-    ]
-    obvious_count = sum(1 for p in obvious_patterns if re.search(p, content, re.IGNORECASE))
-    if obvious_count:
-        results.append((WARN, "Obvious documentation",
-                        f"{obvious_count} statements explaining obvious directory structure"))
-    else:
-        results.append((PASS, "Obvious documentation", "No trivially obvious statements"))
 
-    # @import overuse
-    import_count = len(re.findall(r'^@\S+\.md\s*$', content, re.MULTILINE))
-    if import_count > 5:
-        results.append((WARN, "@import usage",
-                        f"{import_count} @imports (each loads at startup - consider motivated pointers)"))
+def extract_imports(content: str) -> list[str]:
+    """Extract @import targets, skipping fenced code blocks and inline code spans."""
+    targets = []
+    in_code_block = False
+
+    for line in content.splitlines():
+        if line.strip().startswith('```') or line.strip().startswith('~~~'):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block or '@' not in line:
+            continue
+        if '`' in line:
+            line = re.sub(r'`[^`]+`', '', line)
+        for match in IMPORT_PATTERN.finditer(line):
+            targets.append(match.group(1).rstrip('.,;:'))
+
+    return targets
+
+
+def resolve_import(target: str, importer: Path) -> Path:
+    """Resolve an @import target relative to the importing file."""
+    path = Path(target).expanduser()
+    if not path.is_absolute():
+        path = importer.parent / path
+    return path.resolve()
+
+
+def read_import_node(filepath: Path, cache: dict | None = None) -> tuple[int, tuple[Path, ...], tuple[str, ...]]:
+    """Read one file of the import graph. Returns (chars, resolved imports, missing targets).
+
+    cache (path -> result) is owned by the caller, so files imported from
+    several validated CLAUDE.md files are read once per run.
+    """
+    if cache is not None and filepath in cache:
+        return cache[filepath]
+    content = filepath.read_text(encoding="utf-8")
+    resolved = []
+    missing = []
+    for target in extract_imports(content):
+        path = resolve_import(target, filepath)
+        if path.is_file():
+            resolved.append(path)
+        else:
+            missing.append(target)
+    node = len(content), tuple(resolved), tuple(missing)
+    if cache is not None:
+        cache[filepath] = node
+    return node
+
+
+def resolve_import_graph(filepath: Path, import_cache: dict | None = None) -> dict:
+    """Walk the transitive @import graph of a CLAUDE.md file (import_cache: see read_import_node).
+
+    Each file is counted once even if imported from several places, matching
+    what is actually loaded into the session.
+
+    Returns dict with:
+        - files: list of Paths loaded at startup (root first)
+        - total_chars: characters across all loaded files
+        - cycles: list of import chains that loop back on themselves
+        - missing: list of (importer, target) for imports that do not resolve
+        - too_deep: list of Paths imported beyond MAX_IMPORT_DEPTH hops
+        - unreadable: list of (Path, error) for imports that could not be read
+        - max_depth: deepest hop reached
+    """
+    graph = {
+        'files': [],
+        'total_chars': 0,
+        'cycles': [],
+        'missing': [],
+        'too_deep': [],
+        'unreadable': [],
+        'max_depth': 0,
+    }
+    seen = set()
+
+    def visit(path: Path, depth: int, stack: list[Path]):
+        if path in stack:
+            graph['cycles'].append(stack[stack.index(path):] + [path])
+            return
+        if path in seen:
+            return
+        if depth > MAX_IMPORT_DEPTH:
+            graph['too_deep'].append(path)
+            return
+        try:
+            chars, imports, missing = read_import_node(path, import_cache)
+        except (OSError, UnicodeDecodeError) as e:
+            graph['unreadable'].append((path, str(e)))
+            return
+
+        seen.add(path)
+        graph['files'].append(path)
+        graph['total_chars'] += chars
+        graph['max_depth'] = max(graph['max_depth'], depth)
+        graph['missing'].extend((path, target) for target in missing)
+
+        for child in imports:
+            visit(child, depth + 1, stack + [path])
+
+    visit(filepath.resolve(), 0, [])
+    return graph
+
+
+def check_startup_cost(filepath: Path, import_cache: dict | None = None) -> list[tuple[str, str, str]]:
+    """Resolve the @import graph and report what is loaded at session start."""
+    results = []
+    graph = resolve_import_graph(filepath, import_cache)
+    root = filepath.resolve().parent
+
+    def rel(path: Path) -> str:
+        try:
+            return str(path.relative_to(root))
+        except ValueError:
+            return str(path)
+
+    imported = len(graph['files']) - 1
+    if graph['cycles']:
+        chains = '; '.join(' -> '.join(rel(p) for p in chain) for chain in graph['cycles'][:3])
+        results.append((WARN, "@import cycles", f"{len(graph['cycles'])} found: {chains}"))
+    else:
+        results.append((PASS, "@import graph",
+                        f"{imported} imported files resolved (depth {graph['max_depth']})"))
+
+    if graph['missing']:
+        examples = ', '.join(f"{target} (in {rel(importer)})" for importer, target in graph['missing'][:3])
+        results.append((WARN, "Unresolved @imports", f"{len(graph['missing'])} not found: {examples}"))
+
+    if graph['too_deep']:
+        examples = ', '.join(rel(p) for p in graph['too_deep'][:3])
+        results.append((WARN, "@import depth",
+                        f"{len(graph['too_deep'])} imports beyond {MAX_IMPORT_DEPTH} hops are not loaded: {examples}"))
+
+    if graph['unreadable']:
+        examples = ', '.join(f"{rel(p)} ({err})" for p, err in graph['unreadable'][:3])
+        results.append((WARN, "Unreadable @imports", examples))
+
+    tokens = graph['total_chars'] // CHARS_PER_TOKEN
+    detail = f"{graph['total_chars']} chars (~{tokens} tokens) across {len(graph['files'])} files"
+    if tokens > STARTUP_TOKEN_BUDGET:
+        results.append((WARN, "Startup context cost",
+                        f"{detail} - exceeds ~{STARTUP_TOKEN_BUDGET} token budget, paid every session"))
     else:
-        results.append((PASS, "@import usage", f"{import_count} @imports"))
+        results.append((PASS, "Startup context cost", detail))
 
     return results
 
@@ -188,20 +480,85 @@ def check_content_coverage(content: str) -> list[tuple[str, str, str]]:
     return results
 
 
-def validate_file(filepath: Path) -> tuple[int, int, int]:
-    """Validate a single CLAUDE.md file. Returns (pass, warn, fail) counts."""
+def validate_claudemd(filepath: Path, compiled: dict | None = None,
+                      import_cache: dict | None = None) -> list[tuple[str, str, str]]:
+    """Run all checks on a single CLAUDE.md file without printing.
+
+    All state is passed in: compiled is the rule table (see check_antipatterns)
+    and import_cache a caller-owned dict shared across files of one run (see
+    read_import_node). Concurrent calls with their own arguments never interact.
+    """
     content = filepath.read_text(encoding="utf-8")
     lines = content.splitlines()
 
-    print(f"\n{'='*60}")
-    print(f"  {filepath}")
-    print(f"{'='*60}")
-
     all_results = []
     all_results.extend(check_size(content, lines))
     all_results.extend(check_structure(lines))
-    all_results.extend(check_antipatterns(content, lines))
+    all_results.extend(check_antipatterns(content, lines, compiled))
     all_results.extend(check_content_coverage(content))
+    all_results.extend(check_startup_cost(filepath, import_cache))
+    return all_results
+
+
+class CheckTimedOut(BaseException):
+    """Raised by the --timeout alarm; a BaseException so broad excepts in checks let it through."""
+
+
+@contextmanager
+def time_limit(seconds: float | None):
+    """Raise CheckTimedOut if the block runs longer than seconds (None or 0 = no limit).
+
+    SIGALRM, as in validation_api: the regex engine checks for signals, so a
+    runaway rule pattern is interrupted. An alarm already pending (the
+    validation server's request limit) is re-armed with its remaining time on exit.
+    """
+    if not seconds:
+        yield
+        return
+
+    outer = signal.getitimer(signal.ITIMER_REAL)[0]
+    outer_fired = []
+
+    def expire(signum, frame):
+        if outer and outer < seconds and callable(previous):
+            outer_fired.append(True)  # delivered here, so not re-armed on exit
+            previous(signum, frame)  # the outer limit is due first: let it act
+        raise CheckTimedOut()
+
+    started = time.monotonic()
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, min(seconds, outer) if outer else seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        if outer and not outer_fired:
+            signal.setitimer(signal.ITIMER_REAL, max(outer - (time.monotonic() - started), 0.001))
+
+
+def _collect_worker(filepath: Path, compiled: dict | None = None, import_cache: dict | None = None,
+                    timeout: float | None = None) -> tuple[list[tuple[str, str, str]] | None, str | None]:
+    """Pool worker: returns (results, error) so read failures survive pickling.
+
+    A file still being checked after timeout seconds gets a single failing
+    "check timed out" result; the alarm runs in the worker's own main thread.
+    """
+    try:
+        with time_limit(timeout):
+            return validate_claudemd(filepath, compiled, import_cache), None
+    except CheckTimedOut:
+        return [(FAIL, "check timed out", f"Validation still running after {timeout:g}s - "
+                 "look for very long lines or unusual repetition")], None
+    except (OSError, UnicodeDecodeError) as e:
+        return None, str(e)
+
+
+def print_results(filepath: Path, all_results: list[tuple[str, str, str]]) -> tuple[int, int, int]:
+    """Print collected results for one file. Returns (pass, warn, fail) counts."""
+    print(f"\n{'='*60}")
+    print(f"  {filepath}")
+    print(f"{'='*60}")
 
     for status, check, detail in all_results:
         print(f"  {status}  {check}: {detail}")
@@ -214,38 +571,169 @@ def validate_file(filepath: Path) -> tuple[int, int, int]:
     return passes, warns, fails
 
 
+def validate_file(filepath: Path) -> tuple[int, int, int]:
+    """Validate a single CLAUDE.md file. Returns (pass, warn, fail) counts."""
+    return print_results(filepath, validate_claudemd(filepath))
+
+
+# Import cache of a pool worker process (see _init_worker)
+_worker_import_cache: dict | None = None
+
+
+def _init_worker():
+    """Pool initializer: give this worker process its own import cache."""
+    global _worker_import_cache
+    _worker_import_cache = {}
+
+
+def _pool_worker(filepath: Path, compiled: dict | None = None,
+                 timeout: float | None = None) -> tuple[list[tuple[str, str, str]] | None, str | None]:
+    """_collect_worker with the worker's import cache, so files shared by several CLAUDE.md files are read once."""
+    return _collect_worker(filepath, compiled, _worker_import_cache, timeout)
+
+
+def iter_results(files: list[Path], jobs: int = 1, compiled: dict | None = None,
+                 timeout: float | None = None):
+    """Yield (file, results, error) in input order, validating up to `jobs` files at once.
+
+    compiled is the rule table for every file (see check_antipatterns);
+    timeout is the per-file budget in seconds (None = no limit).
+    """
+    if jobs <= 1 or len(files) <= 1:
+        import_cache = {}
+        for f in files:
+            yield (f, *_collect_worker(f, compiled, import_cache, timeout))
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files)), initializer=_init_worker) as pool:
+        # map() preserves input order, so output stays deterministic
+        worker = partial(_pool_worker, compiled=compiled, timeout=timeout)
+        for f, (results, error) in zip(files, pool.map(worker, files, chunksize=4)):
+            yield f, results, error
+
+
+def drop_known_results(results: list[tuple[str, str, str]], path: str,
+                       files: dict[str, dict]) -> tuple[list[tuple[str, str, str]], int]:
+    """Drop non-passing results recorded in a loaded baseline. Returns (kept results, number dropped)."""
+    _, known = issue_baseline.split_known([r for r in results if r[0] != PASS], 'validate_claudemd', path, files,
+                                          describe=lambda result: (result[1], result[2]))
+    known = {id(result) for result in known}
+    kept = [result for result in results if id(result) not in known]
+    return kept, len(results) - len(kept)
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: validate_claudemd.py <file-or-directory>")
-        print("  Validates CLAUDE.md files against best practices.")
-        sys.exit(1)
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Validate CLAUDE.md files against best practices',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 scripts/validate_claudemd.py /path/to/CLAUDE.md
+  python3 scripts/validate_claudemd.py /path/to/project
+  python3 scripts/validate_claudemd.py /path/to/project --jobs 8
+  python3 scripts/validate_claudemd.py /path/to/project --rules team-rules.json
+  python3 scripts/validate_claudemd.py /path/to/project --rules team-rules.json --timeout 10
+  python3 scripts/validate_claudemd.py /path/to/project --baseline .m42-baseline.json
+  python3 scripts/validate_claudemd.py /path/to/project --baseline .m42-baseline.json --new-only
+
+Extra rules file (JSON):
+  {"rules": [{"check": "Hedging", "patterns": ["\\\\bmaybe\\\\b"], "ignorecase": true,
+              "warn_above": 0, "fail_above": 3, "warn": "{count} hedges",
+              "fail": "{count} hedges - state rules directly"}]}
+
+Baseline:
+  --baseline FILE records the warnings and failures of every scanned file in
+  FILE (other files' entries are kept). Add --new-only to show only results
+  missing from FILE. Paths are relative to FILE. Line numbers do not affect
+  matching; another occurrence of a known issue, or a larger count, is
+  reported as new.
+        """
+    )
 
-    target = Path(sys.argv[1]).resolve()
+    parser.add_argument('target', type=Path, help='CLAUDE.md file or directory to scan')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of files to validate in parallel (0 = one per CPU, default: 1)')
+    parser.add_argument('--rules', type=Path,
+                        help='JSON file with extra anti-pattern rules (same schema as ANTIPATTERN_RULES)')
+    parser.add_argument('--timeout', type=float, metavar='SECONDS',
+                        help='Fail a file with "check timed out" if its checks (--rules patterns included) '
+                             'run longer than SECONDS')
+    parser.add_argument('--baseline', type=Path, metavar='FILE',
+                        help='Record warnings and failures in this baseline file (compare against it with --new-only)')
+    parser.add_argument('--new-only', action='store_true',
+                        help='Show only warnings and failures not recorded in the --baseline file')
+
+    args = parser.parse_args()
+    if args.new_only and not args.baseline:
+        parser.error('--new-only requires --baseline FILE')
+    if args.baseline and issue_baseline is None:
+        parser.error("--baseline needs issue_baseline.py from the scripts directory of the m42-meta-toolkit plugin")
+    if args.timeout and not hasattr(signal, 'setitimer'):
+        parser.error('--timeout needs SIGALRM, which this platform lacks')
+
+    target = args.target.resolve()
     if not target.exists():
         print(f"Error: {target} does not exist")
         sys.exit(1)
 
+    compiled = DEFAULT_RULES
+    if args.rules:
+        try:
+            compiled = compile_rules(ANTIPATTERN_RULES + load_rules(args.rules))
+        except (OSError, ValueError, re.error) as e:
+            print(f"Error loading rules from {args.rules}: {e}")
+            sys.exit(1)
+
+    known_issues = None
+    if args.new_only:
+        try:
+            known_issues = issue_baseline.load_baseline(args.baseline)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error loading baseline {args.baseline}: {e}")
+            sys.exit(1)
+
     files = find_claudemd_files(target)
     if not files:
         print(f"No CLAUDE.md files found in {target}")
         sys.exit(1)
 
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
     total_pass = total_warn = total_fail = 0
-    for f in files:
-        try:
-            p, w, fail = validate_file(f)
-            total_pass += p
-            total_warn += w
-            total_fail += fail
-        except (OSError, UnicodeDecodeError) as e:
-            print(f"\n  Error reading {f}: {e}")
+    hidden = 0
+    found = {}
+    for f, results, error in iter_results(files, jobs, compiled, args.timeout):
+        if error is not None:
+            print(f"\n  Error reading {f}: {error}")
             total_fail += 1
+            continue
+        if known_issues is not None:
+            results, dropped = drop_known_results(results, issue_baseline.baseline_key(f, args.baseline), known_issues)
+            hidden += dropped
+        elif args.baseline:
+            found[issue_baseline.baseline_key(f, args.baseline)] = [(check, detail) for status, check, detail in results if status != PASS]
+        p, w, fail = print_results(f, results)
+        total_pass += p
+        total_warn += w
+        total_fail += fail
 
     if len(files) > 1:
         print(f"\n{'='*60}")
         print(f"  Overall: {len(files)} files, {total_pass} passed, {total_warn} warnings, {total_fail} failed")
         print(f"{'='*60}")
 
+    if known_issues is not None:
+        print(f"\n  Baseline: {hidden} known issue(s) hidden ({args.baseline})")
+    elif args.baseline:
+        try:
+            recorded = issue_baseline.update_baseline(args.baseline, 'validate_claudemd', found)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error writing baseline {args.baseline}: {e}")
+            sys.exit(1)
+        print(f"\n  Baseline: recorded {recorded} issue(s) in {args.baseline}")
+
     sys.exit(1 if total_fail > 0 else 0)
 
 
@@ -7,16 +7,57 @@ Outputs complete skill context for use in command preflight checks:
 - Complete frontmatter from all reference files
 - All markdown headers from all reference files
 
+With --budget N the output is limited to roughly N tokens (4 chars per token).
+Sections are filled by rank - SKILL.md body, then reference TOCs, then the file
+listing - and anything cut is replaced by a truncation marker.
+
+Rendered output is cached per skill and options. The cache entry records a
+Merkle hash of the skill directory plus every file's (mtime, size): a warm call
+only stats files and prints the cached text; if stats changed but the Merkle
+hash did not, the cached text is still used. --rebuild forces a fresh render.
+Cache location: $M42_SKILL_CONTEXT_CACHE_DIR, else
+$XDG_CACHE_HOME/m42-meta-toolkit/skill-context, else ~/.cache/m42-meta-toolkit/skill-context.
+
+Several skills can be loaded at once, by path or by name. Names are looked up
+in $CLAUDE_PLUGIN_ROOT/skills, .claude/skills, ~/.claude/skills and the skills
+of installed plugins (~/.claude/plugins); use plugin:skill to pick one plugin.
+Skills are read concurrently into one document. Reference files are parsed once
+per distinct content, and a reference shared by several skills is listed in
+full only the first time.
+
+--format json emits the same data as structured JSON: SKILL.md content,
+per-reference frontmatter and header tree, and the file inventory per skill.
+
 Usage:
     python3 scripts/load_skill_context.py /path/to/skill-folder
     python3 scripts/load_skill_context.py ~/.claude/skills/creating-commands
+    python3 scripts/load_skill_context.py ~/.claude/skills/creating-commands --budget 4000
+    python3 scripts/load_skill_context.py ~/.claude/skills/creating-commands --rebuild
+    python3 scripts/load_skill_context.py creating-commands creating-skills m42-meta-toolkit:creating-hooks
+    python3 scripts/load_skill_context.py ~/.claude/skills/creating-commands --format json
 """
 
 import sys
+import os
+import json
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import re
 import yaml
 
+# Rough token estimate used for --budget
+CHARS_PER_TOKEN = 4
+
+# Section ranks for --budget (lower is kept first)
+RANK_SKILL_MD = 0
+RANK_REFERENCE = 1
+RANK_FILE_LISTING = 2
+
+CACHE_VERSION = 2
+
 def extract_frontmatter(content: str) -> dict:
     """Extract YAML frontmatter from markdown content."""
     frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n'
@@ -53,99 +94,427 @@ def extract_all_headers(content: str) -> list:
 
     return headers
 
-def load_skill_context(skill_path: str):
-    """Load and display complete skill context."""
+@lru_cache(maxsize=None)
+def parse_reference(content: str):
+    """Parse a reference file's frontmatter and headers (once per distinct content)."""
+    return extract_frontmatter(content), extract_all_headers(content)
+
+def file_kind(path: Path) -> str:
+    """Classify a file for the directory listing."""
+    if path.suffix == '.md':
+        return 'markdown'
+    if path.suffix in ['.py', '.js', '.sh', '.rb']:
+        return 'script'
+    if path.suffix in ['.yaml', '.yml', '.json', '.toml']:
+        return 'config'
+    return ''
+
+def collect_context(skill_path) -> dict:
+    """
+    Read a skill folder into a context dict.
+
+    Returns:
+        {'name', 'path', 'skill_md', 'references': [{'path', 'sha256', 'frontmatter', 'headers'}],
+         'directories': {subdir: [(relative path, kind)]}}
+
+    Raises:
+        FileNotFoundError: skill folder or SKILL.md missing
+    """
     skill_dir = Path(skill_path).resolve()
 
     if not skill_dir.exists():
-        print(f"Error: Skill directory not found: {skill_dir}", file=sys.stderr)
-        sys.exit(1)
+        raise FileNotFoundError(f"Skill directory not found: {skill_dir}")
 
     skill_md = skill_dir / "SKILL.md"
     if not skill_md.exists():
-        print(f"Error: SKILL.md not found in {skill_dir}", file=sys.stderr)
-        sys.exit(1)
+        raise FileNotFoundError(f"SKILL.md not found in {skill_dir}")
 
-    # Output full SKILL.md content
-    print("=" * 80)
-    print("SKILL.md")
-    print("=" * 80)
-    with open(skill_md, 'r', encoding='utf-8') as f:
-        skill_content = f.read()
-        print(skill_content)
+    context = {
+        'name': skill_dir.name,
+        'path': str(skill_dir),
+        'skill_md': skill_md.read_text(encoding='utf-8'),
+        'references': [],
+        'directories': {},
+    }
 
-    # Process reference files
+    # Reference files: frontmatter and headers only
     ref_dir = skill_dir / "references"
     if ref_dir.exists() and ref_dir.is_dir():
-        ref_files = sorted([f for f in ref_dir.glob("*.md")])
-
-        if ref_files:
-            print("\n" + "=" * 80)
-            print("REFERENCE FILES")
-            print("=" * 80)
-
-            for ref_file in ref_files:
-                print(f"\n{'─' * 80}")
-                print(f"File: references/{ref_file.name}")
-                print('─' * 80)
-
-                with open(ref_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # Output complete frontmatter
-                frontmatter = extract_frontmatter(content)
-                if frontmatter:
-                    print("\nFrontmatter:")
-                    print("---")
-                    print(yaml.dump(frontmatter, default_flow_style=False, sort_keys=False).strip())
-                    print("---")
-                else:
-                    print("\nFrontmatter: None")
-
-                # Output all headers
-                headers = extract_all_headers(content)
-                if headers:
-                    print("\nTOC:")
-                    for level, text in headers:
-                        indent = "  " * (level - 1)
-                        print(f"{indent}{'#' * level} {text}")
-                else:
-                    print("\nHeaders: None found")
-
-    # List all other directories and their contents
-    print("\n" + "=" * 80)
-    print("OTHER DIRECTORIES & FILES")
-    print("=" * 80)
-
-    # Get all subdirectories except references (already processed)
+        for ref_file in sorted(ref_dir.glob("*.md")):
+            content = ref_file.read_text(encoding='utf-8')
+            frontmatter, headers = parse_reference(content)
+            context['references'].append({
+                'path': f"references/{ref_file.name}",
+                'sha256': hashlib.sha256(content.encode('utf-8')).hexdigest(),
+                'frontmatter': frontmatter,
+                'headers': headers,
+            })
+
+    # All other directories (references already processed)
     subdirs = sorted([d for d in skill_dir.iterdir()
                      if d.is_dir() and d.name not in ['references', '.git', '__pycache__']])
-
     for subdir in subdirs:
         all_files = sorted([f for f in subdir.rglob("*") if f.is_file()])
         if all_files:
-            print(f"\n{subdir.name}/:")
-            for file in all_files:
-                rel_path = file.relative_to(subdir)
-                # Show file type indicator
-                if file.suffix == '.md':
-                    print(f"  - {rel_path} (markdown)")
-                elif file.suffix in ['.py', '.js', '.sh', '.rb']:
-                    print(f"  - {rel_path} (script)")
-                elif file.suffix in ['.yaml', '.yml', '.json', '.toml']:
-                    print(f"  - {rel_path} (config)")
-                else:
-                    print(f"  - {rel_path}")
-
-    print("\n" + "=" * 80)
-    print("END OF SKILL CONTEXT")
-    print("=" * 80)
+            context['directories'][subdir.name] = [
+                (str(f.relative_to(subdir)), file_kind(f)) for f in all_files
+            ]
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python3 load_skill_context.py /path/to/skill-folder", file=sys.stderr)
-        print("\nExample:")
-        print("  python3 scripts/load_skill_context.py ~/.claude/skills/creating-commands", file=sys.stderr)
+    return context
+
+def skill_search_roots() -> list:
+    """Directories whose skills/ subfolders are searched when a skill is given by name."""
+    roots = []
+    if os.environ.get('CLAUDE_PLUGIN_ROOT'):
+        roots.append(Path(os.environ['CLAUDE_PLUGIN_ROOT']) / 'skills')
+    roots.append(Path.cwd() / '.claude' / 'skills')
+    roots.append(Path.home() / '.claude' / 'skills')
+    roots.append(Path(__file__).resolve().parents[2])  # skills shipped next to this one
+    return roots
+
+def resolve_skill(spec: str) -> Path:
+    """
+    Resolve a skill path, name, or plugin:name to a skill folder.
+
+    Raises:
+        FileNotFoundError: nothing matches
+    """
+    path = Path(spec).expanduser()
+    if (path / "SKILL.md").is_file():
+        return path.resolve()
+
+    plugin, _, name = spec.rpartition(':')
+    if '/' not in name and name:
+        if not plugin:
+            for root in skill_search_roots():
+                if (root / name / "SKILL.md").is_file():
+                    return (root / name).resolve()
+
+        # Installed plugins: ~/.claude/plugins/**/<plugin>/skills/<name>
+        plugins_dir = Path.home() / '.claude' / 'plugins'
+        if plugins_dir.is_dir():
+            for skill_md in sorted(plugins_dir.glob(f"**/skills/{name}/SKILL.md")):
+                if not plugin or skill_md.parents[2].name == plugin:
+                    return skill_md.parent.resolve()
+
+    if path.exists():
+        raise FileNotFoundError(f"SKILL.md not found in {path.resolve()}")
+    raise FileNotFoundError(f"Skill not found: {spec}")
+
+def collect_contexts(skill_dirs: list) -> list:
+    """Read several skill folders concurrently, in input order."""
+    if len(skill_dirs) == 1:
+        return [collect_context(skill_dirs[0])]
+    with ThreadPoolExecutor(max_workers=min(len(skill_dirs), 8)) as executor:
+        return list(executor.map(collect_context, skill_dirs))
+
+def banner(title: str, char: str = "=") -> str:
+    return f"{char * 80}\n{title}\n{char * 80}\n"
+
+def render_reference(ref: dict) -> str:
+    """Render one reference file's frontmatter and TOC."""
+    out = []
+    frontmatter = ref['frontmatter']
+    if frontmatter:
+        out.append("\nFrontmatter:\n---\n")
+        out.append(yaml.dump(frontmatter, default_flow_style=False, sort_keys=False).strip() + "\n")
+        out.append("---\n")
+    else:
+        out.append("\nFrontmatter: None\n")
+
+    if ref['headers']:
+        out.append("\nTOC:\n")
+        for level, text in ref['headers']:
+            indent = "  " * (level - 1)
+            out.append(f"{indent}{'#' * level} {text}\n")
+    else:
+        out.append("\nHeaders: None found\n")
+    return ''.join(out)
+
+def render_file_listing(directories: dict) -> str:
+    out = []
+    for name, files in directories.items():
+        out.append(f"\n{name}/:\n")
+        for rel_path, kind in files:
+            out.append(f"  - {rel_path} ({kind})\n" if kind else f"  - {rel_path}\n")
+    return ''.join(out)
+
+def render_blocks(context: dict, seen: dict = None) -> list:
+    """
+    Lay out the text output as (rank, heading, body) blocks in output order.
+
+    Headings are always printed; bodies are what --budget ranks and truncates
+    (rank None = never truncated). seen maps reference content hashes to where
+    they were first listed, so shared references are listed once.
+    """
+    seen = {} if seen is None else seen
+    blocks = [(RANK_SKILL_MD, banner("SKILL.md"), context['skill_md'] + "\n")]
+
+    if context['references']:
+        blocks.append((None, "\n" + banner("REFERENCE FILES"), ""))
+        for ref in context['references']:
+            heading = "\n" + banner(f"File: {ref['path']}", "─")
+            first = seen.setdefault(ref['sha256'], f"{context['name']}/{ref['path']}")
+            if first != f"{context['name']}/{ref['path']}":
+                blocks.append((None, heading, f"\nSame content as {first}\n"))
+            else:
+                blocks.append((RANK_REFERENCE, heading, render_reference(ref)))
+
+    blocks.append((RANK_FILE_LISTING, "\n" + banner("OTHER DIRECTORIES & FILES"),
+                   render_file_listing(context['directories'])))
+    blocks.append((None, "\n" + banner("END OF SKILL CONTEXT"), ""))
+    return blocks
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def truncate_lines(text: str, tokens: int) -> str:
+    """Keep whole lines of text that fit within tokens."""
+    limit = tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    return text[:cut + 1] if cut >= 0 else ""
+
+def apply_budget(blocks: list, budget: int) -> list:
+    """
+    Fit block bodies into a token budget, best-ranked first.
+
+    Headings and truncation markers are paid for up front; a body that does not
+    fit entirely is cut at a line boundary and followed by a marker.
+    """
+    marker_reserve = estimate_tokens("[... truncated: 00000 tokens omitted ...]\n")
+    remaining = budget - sum(estimate_tokens(heading) for _, heading, _ in blocks)
+    remaining -= marker_reserve * sum(1 for rank, _, body in blocks if rank is not None and body)
+
+    bodies = {}
+    order = sorted((i for i, (rank, _, body) in enumerate(blocks) if rank is not None and body),
+                   key=lambda i: (blocks[i][0], i))
+    for i in order:
+        body = blocks[i][2]
+        cost = estimate_tokens(body)
+        if cost <= remaining:
+            bodies[i] = body
+            remaining -= cost
+            continue
+        kept = truncate_lines(body, max(remaining, 0))
+        remaining -= estimate_tokens(kept)
+        omitted = cost - estimate_tokens(kept)
+        bodies[i] = kept + f"[... truncated: {omitted} tokens omitted ...]\n"
+
+    return [(rank, heading, bodies.get(i, body)) for i, (rank, heading, body) in enumerate(blocks)]
+
+def render_text(contexts: list, budget: int = None) -> str:
+    """Render one or more skill contexts as a single document."""
+    if len(contexts) == 1:
+        blocks = render_blocks(contexts[0])
+    else:
+        blocks, seen = [], {}
+        for index, context in enumerate(contexts):
+            title = banner(f"SKILL CONTEXT: {context['name']} ({context['path']})", "#")
+            blocks.append((None, ("\n" if index else "") + title + "\n", ""))
+            blocks.extend(render_blocks(context, seen))
+    if budget is not None:
+        blocks = apply_budget(blocks, budget)
+    return ''.join(heading + body for _, heading, body in blocks)
+
+def header_tree(headers: list) -> list:
+    """Nest (level, text) headers into [{'level', 'text', 'children'}]."""
+    root = {'level': 0, 'children': []}
+    stack = [root]
+    for level, text in headers:
+        node = {'level': level, 'text': text, 'children': []}
+        while stack[-1]['level'] >= level:
+            stack.pop()
+        stack[-1]['children'].append(node)
+        stack.append(node)
+    return root['children']
+
+def render_json(contexts: list) -> str:
+    """Render skill contexts as a JSON document ({"skills": [...]})."""
+    seen = {}
+    skills = []
+    for context in contexts:
+        references = []
+        for ref in context['references']:
+            location = f"{context['name']}/{ref['path']}"
+            first = seen.setdefault(ref['sha256'], location)
+            if first != location:
+                references.append({'path': ref['path'], 'sha256': ref['sha256'], 'same_as': first})
+            else:
+                references.append({
+                    'path': ref['path'],
+                    'sha256': ref['sha256'],
+                    'frontmatter': ref['frontmatter'] or {},
+                    'headers': header_tree(ref['headers']),
+                })
+        skills.append({
+            'name': context['name'],
+            'path': context['path'],
+            'skill_md': context['skill_md'],
+            'references': references,
+            'files': {
+                name: [{'path': rel_path, 'kind': kind or None} for rel_path, kind in files]
+                for name, files in context['directories'].items()
+            },
+        })
+    # default=str: YAML frontmatter may hold dates
+    return json.dumps({'skills': skills}, indent=2, ensure_ascii=False, default=str) + "\n"
+
+def cache_dir() -> Path:
+    """Return the rendered-context cache directory (not created)."""
+    override = os.environ.get('M42_SKILL_CONTEXT_CACHE_DIR')
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'm42-meta-toolkit' / 'skill-context'
+
+def cache_file(skill_dirs: list, options: dict) -> Path:
+    """Cache entry for a list of skill folders and render options."""
+    key = json.dumps([[str(d) for d in skill_dirs], options], sort_keys=True)
+    return cache_dir() / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.json"
+
+def skill_signature(skill_dir: Path) -> dict:
+    """Map each file to [mtime_ns, size] - stat only, no reads."""
+    signature = {}
+    for path in skill_dir.rglob("*"):
+        rel = path.relative_to(skill_dir)
+        if '.git' not in rel.parts and path.is_file():
+            st = path.stat()
+            signature[rel.as_posix()] = [st.st_mtime_ns, st.st_size]
+    return signature
+
+def merkle_hash(directory: Path) -> str:
+    """Hash a directory tree: each directory hashes its children's names and hashes."""
+    digest = hashlib.sha256()
+    for child in sorted(directory.iterdir()):
+        if child.name == '.git':
+            continue
+        if child.is_dir():
+            node = b'd' + merkle_hash(child).encode('ascii')
+        elif child.is_file():
+            node = b'f' + hashlib.sha256(child.read_bytes()).hexdigest().encode('ascii')
+        else:
+            continue
+        digest.update(child.name.encode('utf-8') + b'\0' + node + b'\n')
+    return digest.hexdigest()
+
+def read_cache(entry_path: Path, skill_dirs: list):
+    """Return the cached text if the entry still matches every skill folder, else None."""
+    try:
+        entry = json.loads(entry_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if entry.get('version') != CACHE_VERSION or entry.get('skills') != [str(d) for d in skill_dirs]:
+        return None
+
+    signatures = [skill_signature(d) for d in skill_dirs]
+    if entry['signatures'] == signatures:
+        return entry['text']
+
+    # Touched but maybe not changed (checkout, copy): compare content
+    if entry['merkles'] == [merkle_hash(d) for d in skill_dirs]:
+        entry['signatures'] = signatures
+        write_cache(entry_path, entry)
+        return entry['text']
+    return None
+
+def write_cache(entry_path: Path, entry: dict):
+    """Atomically write a cache entry; caching is best-effort."""
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=entry_path.parent)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_name, entry_path)
+    except OSError:
+        pass
+
+def cached_render(skill_dirs: list, budget: int = None, rebuild: bool = False,
+                  output_format: str = 'text') -> str:
+    """
+    Render skill context text, reusing the on-disk cache when the skills are unchanged.
+
+    Raises:
+        FileNotFoundError: skill folder or SKILL.md missing
+    """
+    entry_path = cache_file(skill_dirs, {'budget': budget, 'format': output_format})
+
+    if not rebuild:
+        text = read_cache(entry_path, skill_dirs)
+        if text is not None:
+            return text
+
+    # Signatures first: a file edited while rendering then fails the next stat check
+    signatures = [skill_signature(d) for d in skill_dirs]
+    contexts = collect_contexts(skill_dirs)
+    text = render_json(contexts) if output_format == 'json' else render_text(contexts, budget)
+    write_cache(entry_path, {
+        'version': CACHE_VERSION,
+        'skills': [str(d) for d in skill_dirs],
+        'signatures': signatures,
+        'merkles': [merkle_hash(d) for d in skill_dirs],
+        'text': text,
+    })
+    return text
+
+def load_skill_context(skill_paths: list, budget: int = None, rebuild: bool = False,
+                       output_format: str = 'text'):
+    """Load and display complete context for one or more skills."""
+    skill_dirs, missing = [], []
+    for spec in skill_paths:
+        try:
+            skill_dir = resolve_skill(spec)
+        except FileNotFoundError as e:
+            missing.append(str(e))
+            continue
+        if skill_dir not in skill_dirs:
+            skill_dirs.append(skill_dir)
+
+    if missing:
+        for message in missing:
+            print(f"Error: {message}", file=sys.stderr)
         sys.exit(1)
 
-    load_skill_context(sys.argv[1])
+    try:
+        text = cached_render(skill_dirs, budget, rebuild, output_format)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    sys.stdout.write(text)
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Output skill context for command preflight checks',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 scripts/load_skill_context.py ~/.claude/skills/creating-commands
+  python3 scripts/load_skill_context.py ~/.claude/skills/creating-commands --budget 4000
+  python3 scripts/load_skill_context.py ~/.claude/skills/creating-commands --rebuild
+  python3 scripts/load_skill_context.py creating-commands creating-skills --budget 8000
+  python3 scripts/load_skill_context.py creating-commands --format json
+        """
+    )
+    parser.add_argument('skills', nargs='+', metavar='skill',
+                        help='Skill folder, skill name, or plugin:skill-name')
+    parser.add_argument('--budget', type=int, metavar='N',
+                        help='Limit output to about N tokens, keeping SKILL.md, then reference TOCs, then the file listing')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                        help='Output format (default: text)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Ignore the cached rendering and render from disk')
+
+    args = parser.parse_args()
+    if args.budget is not None and args.budget <= 0:
+        parser.error("--budget must be a positive number of tokens")
+    if args.budget is not None and args.format == 'json':
+        parser.error("--budget applies to text output only")
+
+    load_skill_context(args.skills, args.budget, args.rebuild, args.format)
+
+if __name__ == "__main__":
+    main()
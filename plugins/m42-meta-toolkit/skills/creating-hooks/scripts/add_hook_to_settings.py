@@ -1,14 +1,32 @@
 #!/usr/bin/env python3
 """
 Safely adds hook configuration to settings.json file.
-Usage: python3 add_hook_to_settings.py <settings_path> <hook_event> <hook_config_json>
+
+The read-modify-write runs under an advisory lock on the settings directory, and
+the new settings are written to a temp file and renamed into place (keeping the
+file's mode), so parallel runs neither truncate the file nor lose each other's
+hooks. Hooks that are
+already registered (same event, matcher and normalized hook config) are skipped.
+
+Usage:
+    python3 add_hook_to_settings.py <settings_path> <hook_event> <hook_config_json>
+    python3 add_hook_to_settings.py <settings_path> --batch <hooks.json | ->
+
+A batch file uses the settings "hooks" layout: {"<event>": [<hook_config>, ...]}.
 """
 
 import json
 import sys
 import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking
+    fcntl = None
 
 def load_settings(settings_path: Path) -> Dict[str, Any]:
     """Load existing settings or return empty dict."""
@@ -22,61 +40,178 @@ def load_settings(settings_path: Path) -> Dict[str, Any]:
     return {}
 
 def save_settings(settings_path: Path, settings: Dict[str, Any]) -> None:
-    """Save settings with proper formatting."""
+    """Save settings with proper formatting (temp file + atomic rename).
+
+    A symlinked settings file is followed: its target is replaced, the link kept.
+    """
+    settings_path = settings_path.resolve()
+    settings_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{settings_path.name}.", suffix='.tmp', dir=settings_path.parent)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(settings, f, indent=2)
+            f.write('\n')  # Add trailing newline
+            f.flush()
+            os.fsync(f.fileno())
+        if settings_path.exists():
+            mode = settings_path.stat().st_mode & 0o777
+        else:
+            # mkstemp creates 0600; a new settings file gets the usual umask default
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, settings_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+@contextmanager
+def settings_lock(settings_path: Path):
+    """Hold an exclusive advisory lock for a settings file's read-modify-write.
+
+    Locks the containing directory: the file itself is replaced by rename, and a
+    separate lock file would be left behind in the user's .claude/ directory.
+    For a symlinked settings file that is the target's directory, where
+    save_settings writes.
+    """
+    settings_path = settings_path.resolve()
     settings_path.parent.mkdir(parents=True, exist_ok=True)
+    if not fcntl:
+        yield
+        return
+    dir_fd = os.open(settings_path.parent, os.O_RDONLY)
+    try:
+        fcntl.flock(dir_fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(dir_fd)  # releases the lock
 
-    with open(settings_path, 'w') as f:
-        json.dump(settings, f, indent=2)
-        f.write('\n')  # Add trailing newline
+def normalize(value: Any) -> str:
+    """Canonical JSON for comparing hook configs."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'))
 
-def add_hook(settings: Dict[str, Any], event: str, hook_config: Dict[str, Any]) -> Dict[str, Any]:
-    """Add hook configuration to settings."""
+def add_hook(settings: Dict[str, Any], event: str, hook_config: Dict[str, Any]) -> int:
+    """
+    Add hook configuration to settings, skipping hooks already registered.
+
+    Hooks are merged into an existing entry with the same matcher; only hooks
+    not already present there are appended.
+
+    Returns:
+        Number of hooks added
+    """
     if "hooks" not in settings:
         settings["hooks"] = {}
 
     if event not in settings["hooks"]:
         settings["hooks"][event] = []
 
-    # Add the new hook configuration
-    settings["hooks"][event].append(hook_config)
-
-    return settings
+    matcher = hook_config.get("matcher", "")
+    extra = {k: v for k, v in hook_config.items() if k not in ("matcher", "hooks")}
+    for existing in settings["hooks"][event]:
+        if existing.get("matcher", "") != matcher:
+            continue
+        if normalize({k: v for k, v in existing.items() if k not in ("matcher", "hooks")}) != normalize(extra):
+            continue
+        present = {normalize(hook) for hook in existing.get("hooks", [])}
+        new_hooks = []
+        for hook in hook_config["hooks"]:
+            if normalize(hook) not in present:
+                present.add(normalize(hook))
+                new_hooks.append(hook)
+        existing.setdefault("hooks", []).extend(new_hooks)
+        return len(new_hooks)
+
+    # Add the new hook configuration (dropping repeats within it)
+    unique = list({normalize(hook): hook for hook in hook_config["hooks"]}.values())
+    settings["hooks"][event].append({**hook_config, "hooks": unique})
+    return len(unique)
+
+def parse_batch(text: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """Parse a batch file ({"<event>": [hook_config, ...]}) into (event, config) pairs."""
+    data = json.loads(text)
+    if isinstance(data, dict) and isinstance(data.get("hooks"), dict):
+        data = data["hooks"]
+    if not isinstance(data, dict):
+        raise ValueError('batch must be an object: {"<event>": [<hook_config>, ...]}')
+    pairs = []
+    for event, configs in data.items():
+        if not isinstance(configs, list):
+            raise ValueError(f"{event}: expected an array of hook configurations")
+        pairs.extend((event, config) for config in configs)
+    return pairs
 
 def main():
-    if len(sys.argv) != 4:
-        print("Usage: python3 add_hook_to_settings.py <settings_path> <hook_event> <hook_config_json>", file=sys.stderr)
-        print("\nExample:", file=sys.stderr)
-        print('  python3 add_hook_to_settings.py ~/.claude/settings.json PreToolUse \'{"matcher": "Bash", "hooks": [{"type": "command", "command": "echo test"}]}\'', file=sys.stderr)
-        sys.exit(1)
-
-    settings_path = Path(sys.argv[1]).expanduser()
-    event = sys.argv[2]
-    hook_config_json = sys.argv[3]
-
-    try:
-        hook_config = json.loads(hook_config_json)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Invalid hook configuration JSON: {e}", file=sys.stderr)
-        sys.exit(1)
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Add hook configurations to a settings.json file',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 add_hook_to_settings.py ~/.claude/settings.json PreToolUse '{"matcher": "Bash", "hooks": [{"type": "command", "command": "echo test"}]}'
+  python3 add_hook_to_settings.py .claude/settings.json --batch hooks.json
+        """
+    )
+    parser.add_argument('settings_path', type=Path, help='Settings file to update')
+    parser.add_argument('event', nargs='?', help='Hook event (single mode)')
+    parser.add_argument('config', nargs='?', help='Hook configuration JSON (single mode)')
+    parser.add_argument('--batch', metavar='FILE',
+                        help='Apply every hook in FILE (or - for stdin) in one read-modify-write')
+    args = parser.parse_args()
+
+    settings_path = args.settings_path.expanduser()
+
+    if args.batch:
+        if args.event or args.config:
+            parser.error("--batch cannot be combined with <hook_event> <hook_config_json>")
+        try:
+            text = sys.stdin.read() if args.batch == '-' else Path(args.batch).read_text()
+            pairs = parse_batch(text)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Invalid batch file: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        if not (args.event and args.config):
+            parser.error("expected <hook_event> <hook_config_json> or --batch FILE")
+        try:
+            pairs = [(args.event, json.loads(args.config))]
+        except json.JSONDecodeError as e:
+            print(f"ERROR: Invalid hook configuration JSON: {e}", file=sys.stderr)
+            sys.exit(1)
 
     # Validate hook config structure
-    if "hooks" not in hook_config:
-        print("ERROR: Hook configuration must contain 'hooks' array", file=sys.stderr)
-        sys.exit(1)
-
-    # Load existing settings
-    print(f"Loading settings from {settings_path}...")
-    settings = load_settings(settings_path)
-
-    # Add hook
-    print(f"Adding {event} hook...")
-    settings = add_hook(settings, event, hook_config)
-
-    # Save settings
-    print(f"Saving settings to {settings_path}...")
-    save_settings(settings_path, settings)
+    for event, hook_config in pairs:
+        if not isinstance(hook_config, dict) or not isinstance(hook_config.get("hooks"), list):
+            print(f"ERROR: {event} hook configuration must contain 'hooks' array", file=sys.stderr)
+            sys.exit(1)
 
-    print(f"✅ Successfully added {event} hook to {settings_path}")
+    with settings_lock(settings_path):
+        # Load existing settings
+        print(f"Loading settings from {settings_path}...")
+        settings = load_settings(settings_path)
+
+        # Add hooks
+        added = 0
+        for event, hook_config in pairs:
+            count = add_hook(settings, event, hook_config)
+            added += count
+            if count:
+                print(f"Adding {event} hook ({count} commands)...")
+            else:
+                print(f"Skipping {event} hook: already registered")
+
+        if not added:
+            print(f"✅ Nothing to add, {settings_path} already has these hooks")
+            return
+
+        # Save settings
+        print(f"Saving settings to {settings_path}...")
+        save_settings(settings_path, settings)
+
+    print(f"✅ Successfully added {added} hooks to {settings_path}")
     print("\nNote: Restart Claude Code or run /hooks to reload hook configuration")
 
 if __name__ == "__main__":
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Benchmarks hook command latency by replaying synthetic event payloads.
+
+For every configured command hook, builds a payload for its event (and, for
+PreToolUse/PostToolUse, a tool its matcher fires for), pipes it to the command
+on stdin the way Claude Code does, and reports p50/p95/p99 wall time. Hooks
+whose p95 approaches their timeout are flagged. Everything runs locally; the
+payload's transcript and file paths point into a scratch directory.
+
+Settings sources work as in validate_hook.py: file paths, '-' for stdin, or
+no arguments to use the user, project and local settings files.
+
+Usage:
+    python3 benchmark_hooks.py [settings.json ...] [--runs N] [--event EVENT] [--env KEY=VALUE] [--dry-run]
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from validate_hook import (
+    DEFAULT_TIMEOUT,
+    EVENTS_WITH_MATCHERS,
+    discover_settings,
+    load_hooks_source,
+    tools_matching,
+    validate_full_hooks_config,
+)
+
+# Flag hooks whose p95 reaches this fraction of their timeout
+DEFAULT_WARN_RATIO = 0.8
+
+# Tool used when a matcher fires for no built-in tool (e.g. MCP patterns)
+FALLBACK_TOOL = "mcp__bench__tool"
+
+def sample_tool_io(tool: str, scratch: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return harmless (tool_input, tool_response) examples for a tool."""
+    target = str(scratch / "bench.txt")
+    if tool == "Bash":
+        return ({"command": "true", "description": "Hook benchmark"},
+                {"stdout": "", "stderr": "", "exitCode": 0})
+    if tool == "Write":
+        return {"file_path": target, "content": "benchmark\n"}, {"filePath": target, "success": True}
+    if tool in ("Edit", "MultiEdit"):
+        return ({"file_path": target, "old_string": "benchmark", "new_string": "benchmark", "replace_all": False},
+                {"filePath": target, "success": True, "replacementCount": 1})
+    if tool == "Read":
+        return ({"file_path": target, "offset": 0, "limit": 100},
+                {"content": "benchmark\n", "lineCount": 1, "truncated": False})
+    return {}, {}
+
+def build_payload(event: str, matcher: str, scratch: Path) -> Dict[str, Any]:
+    """Build a synthetic hook input for an event and matcher."""
+    payload = {
+        "session_id": "hook-benchmark",
+        "transcript_path": str(scratch / "transcript.jsonl"),
+        "cwd": os.getcwd(),
+        "hook_event_name": event,
+    }
+    if event in EVENTS_WITH_MATCHERS:
+        tools = tools_matching(matcher) or tools_matching(matcher, [FALLBACK_TOOL])
+        tool = tools[0] if tools else matcher
+        tool_input, tool_response = sample_tool_io(tool, scratch)
+        payload["tool_name"] = tool
+        payload["tool_input"] = tool_input
+        if event == "PostToolUse":
+            payload["tool_response"] = tool_response
+    elif event == "UserPromptSubmit":
+        payload["prompt"] = "Hook benchmark prompt"
+    elif event in ("Stop", "SubagentStop"):
+        payload["stop_hook_active"] = False
+    elif event == "SessionStart":
+        payload["source"] = matcher or "startup"
+    elif event == "SessionEnd":
+        payload["reason"] = "other"
+    elif event == "Notification":
+        payload["message"] = "Hook benchmark notification"
+    elif event == "PreCompact":
+        payload["trigger"] = matcher or "manual"
+        payload["custom_instructions"] = ""
+    return payload
+
+def run_once(command: str, stdin: bytes, timeout: float, env: Dict[str, str]) -> Tuple[float, Optional[int]]:
+    """Run a hook command once. Returns (seconds, exit code or None on timeout)."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(command, shell=True, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, env=env, start_new_session=True)
+    try:
+        proc.communicate(stdin, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        # Kill the whole process group, not just the shell
+        os.killpg(proc.pid, signal.SIGKILL)
+        proc.wait()
+        return time.perf_counter() - start, None
+    return time.perf_counter() - start, proc.returncode
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of samples."""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+def collect_hooks(scoped, event_filter: Optional[str]) -> List[Dict[str, Any]]:
+    """Flatten merged settings into one entry per command hook."""
+    hooks = []
+    for scope, _, hooks_config in scoped:
+        for event, event_configs in hooks_config.items():
+            if event_filter and event != event_filter:
+                continue
+            for config in event_configs:
+                matcher = config.get("matcher", "")
+                for hook in config["hooks"]:
+                    hooks.append({
+                        "scope": scope,
+                        "event": event,
+                        "matcher": matcher,
+                        "command": hook["command"],
+                        "timeout": hook.get("timeout", DEFAULT_TIMEOUT),
+                    })
+    return hooks
+
+def benchmark(hooks: List[Dict[str, Any]], runs: int, warmup: int, warn_ratio: float,
+              env: Dict[str, str]) -> bool:
+    """Benchmark each hook and print a report. Returns True if no hook is near or over its timeout."""
+    ok = True
+    with tempfile.TemporaryDirectory(prefix="hook-bench-") as tmp:
+        scratch = Path(tmp)
+        (scratch / "transcript.jsonl").touch()
+        (scratch / "bench.txt").write_text("benchmark\n")
+
+        print(f"{'event':<17} {'matcher':<16} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'timeout':>8}  command")
+        for hook in hooks:
+            stdin = json.dumps(build_payload(hook["event"], hook["matcher"], scratch)).encode("utf-8")
+            samples, timeouts, failures = [], 0, 0
+            for i in range(warmup + runs):
+                elapsed, code = run_once(hook["command"], stdin, hook["timeout"], env)
+                if i < warmup:
+                    continue
+                samples.append(elapsed)
+                if code is None:
+                    timeouts += 1
+                elif code not in (0, 2):
+                    failures += 1
+
+            p50, p95, p99 = (percentile(samples, pct) * 1000 for pct in (50, 95, 99))
+            command = hook["command"] if len(hook["command"]) <= 60 else hook["command"][:57] + "..."
+            print(f"{hook['event']:<17} {hook['matcher'] or '-':<16} {p50:>8.1f} {p95:>8.1f} {p99:>8.1f} "
+                  f"{hook['timeout']:>7}s  {command}")
+
+            if timeouts:
+                ok = False
+                print(f"  ❌ Timed out in {timeouts}/{runs} runs")
+            elif p95 >= hook["timeout"] * 1000 * warn_ratio:
+                ok = False
+                print(f"  ⚠ p95 is {p95 / (hook['timeout'] * 10):.0f}% of the {hook['timeout']}s timeout")
+            if failures:
+                print(f"  ⚠ Non-zero exit (not 0/2) in {failures}/{runs} runs")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark hook command latency with synthetic event payloads",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 benchmark_hooks.py
+  python3 benchmark_hooks.py .claude/settings.json --runs 50
+  python3 benchmark_hooks.py .claude/settings.json --event PreToolUse --env SPRINT_DIR=/tmp/sprint
+  python3 benchmark_hooks.py --dry-run
+        """
+    )
+    parser.add_argument("sources", nargs="*", help="Settings files or '-' for stdin (default: user, project and local settings)")
+    parser.add_argument("--runs", type=int, default=20, help="Measured runs per hook (default: 20)")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured runs per hook first (default: 1)")
+    parser.add_argument("--event", help="Only benchmark hooks for this event")
+    parser.add_argument("--warn-ratio", type=float, default=DEFAULT_WARN_RATIO,
+                        help=f"Flag hooks whose p95 reaches this fraction of their timeout (default: {DEFAULT_WARN_RATIO})")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="Extra environment variable for hook commands (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="List the hooks and payloads without running them")
+    args = parser.parse_args()
+
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    sources = args.sources or [str(path) for _, path in discover_settings()]
+    if not sources:
+        print("No settings files found (~/.claude/settings.json, .claude/settings.json, .claude/settings.local.json)", file=sys.stderr)
+        sys.exit(1)
+
+    scoped = []
+    for source in sources:
+        try:
+            scope, label, hooks_config = load_hooks_source(source)
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(1)
+        errors = validate_full_hooks_config(hooks_config)
+        if errors:
+            print(f"❌ {label} has invalid hooks; run validate_hook.py {source} first", file=sys.stderr)
+            sys.exit(1)
+        scoped.append((scope, label, hooks_config))
+
+    hooks = collect_hooks(scoped, args.event)
+    if not hooks:
+        print("No command hooks to benchmark")
+        sys.exit(0)
+
+    if args.dry_run:
+        scratch = Path(tempfile.gettempdir()) / "hook-bench"
+        for hook in hooks:
+            payload = build_payload(hook["event"], hook["matcher"], scratch)
+            print(f"{hook['scope']}: {hook['event']} [{hook['matcher'] or '-'}] {hook['command']}")
+            print(f"  stdin: {json.dumps(payload)}")
+        sys.exit(0)
+
+    env = dict(os.environ)
+    env.setdefault("CLAUDE_PROJECT_DIR", os.getcwd())
+    for item in args.env:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            parser.error(f"--env expects KEY=VALUE, got: {item}")
+        env[key] = value
+
+    print(f"Benchmarking {len(hooks)} hooks, {args.runs} runs each\n")
+    sys.exit(0 if benchmark(hooks, args.runs, args.warmup, args.warn_ratio, env) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,27 @@
 #!/usr/bin/env python3
 """
 Validates hook configuration JSON structure.
-Usage: python3 validate_hook.py <hook_event> <hook_config_json>
+
+Accepts a hooks JSON string, settings files, or '-' for stdin. With no
+arguments, discovers the user, project and local settings files, validates each
+scope and reports the merged hooks the way Claude Code combines them (hooks from
+all scopes run; identical commands run once).
+
+--fanout expands every PreToolUse/PostToolUse matcher against the built-in tool
+names and reports, per tool, how many hooks fire, the commands registered more
+than once under overlapping matchers, and the timeout budget of a tool call.
+
+Usage:
+    python3 validate_hook.py '<hooks_config_json>'
+    python3 validate_hook.py [settings.json ...] [--fanout]
+    cat settings.json | python3 validate_hook.py -
 """
 
 import json
+import re
 import sys
-from typing import Dict, Any, List
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
 
 VALID_EVENTS = [
     "PreToolUse",
@@ -24,6 +39,23 @@ EVENTS_WITH_MATCHERS = ["PreToolUse", "PostToolUse"]
 EVENTS_WITH_SOURCE_MATCHER = ["SessionStart"]
 EVENTS_WITH_TRIGGER_MATCHER = ["PreCompact"]
 
+# Built-in tool names that PreToolUse/PostToolUse matchers are tested against
+KNOWN_TOOLS = [
+    "Task", "Bash", "BashOutput", "KillShell", "Glob", "Grep", "Read", "Edit",
+    "MultiEdit", "Write", "NotebookEdit", "WebFetch", "WebSearch", "TodoWrite",
+    "ExitPlanMode", "SlashCommand",
+]
+
+# Hook timeout when none is configured (seconds)
+DEFAULT_TIMEOUT = 60
+
+# Settings files in merge order (later scopes are listed after earlier ones)
+SETTINGS_SCOPES = [
+    ("user", Path("~/.claude/settings.json")),
+    ("project", Path(".claude/settings.json")),
+    ("local", Path(".claude/settings.local.json")),
+]
+
 def validate_hook_event(event: str) -> List[str]:
     """Validate hook event name."""
     errors = []
@@ -39,6 +71,11 @@ def validate_matcher(event: str, matcher: str) -> List[str]:
         # Matcher should match tool names or patterns
         if not matcher:
             errors.append("Matcher can be empty string or '*' to match all tools")
+        elif matcher != "*":
+            try:
+                re.compile(matcher)
+            except re.error as e:
+                errors.append(f"Matcher is not a valid regex: {matcher} ({e})")
     elif event in EVENTS_WITH_SOURCE_MATCHER:
         valid_sources = ["startup", "resume", "clear", "compact"]
         if matcher and matcher not in valid_sources:
@@ -53,6 +90,16 @@ def validate_matcher(event: str, matcher: str) -> List[str]:
 
     return errors
 
+def tools_matching(matcher: str, tools: List[str] = KNOWN_TOOLS) -> List[str]:
+    """Return the tools a PreToolUse/PostToolUse matcher fires for ('' and '*' match all; otherwise a full regex match)."""
+    if not matcher or matcher == "*":
+        return list(tools)
+    try:
+        pattern = re.compile(matcher)
+    except re.error:
+        return [tool for tool in tools if tool == matcher]
+    return [tool for tool in tools if pattern.fullmatch(tool)]
+
 def validate_hook_config(event: str, config: Dict[str, Any]) -> List[str]:
     """Validate complete hook configuration structure."""
     errors = []
@@ -119,14 +166,231 @@ def validate_full_hooks_config(hooks_config: Dict[str, Any]) -> Dict[str, List[s
 
     return all_errors
 
+def discover_settings(project_dir: Path = None) -> List[Tuple[str, Path]]:
+    """Return (scope, path) for each existing user/project/local settings file."""
+    project_dir = Path(project_dir or Path.cwd())
+    found = []
+    for scope, path in SETTINGS_SCOPES:
+        path = path.expanduser() if str(path).startswith("~") else project_dir / path
+        if path.is_file():
+            found.append((scope, path))
+    return found
+
+def scope_for(path: Path) -> str:
+    """Name the settings scope a file belongs to (or 'file' if none)."""
+    path = path.expanduser().resolve()
+    if path == (Path.home() / ".claude" / "settings.json").resolve():
+        return "user"
+    if path.parent.name == ".claude":
+        return "local" if path.name == "settings.local.json" else "project"
+    return "file"
+
+def extract_hooks(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the hooks config from a settings object.
+
+    A bare hooks config (event names at the top level) is returned as-is; a
+    settings object without 'hooks' has no hooks.
+
+    Raises:
+        ValueError: 'hooks' is not an object
+    """
+    if "hooks" in data:
+        if not isinstance(data["hooks"], dict):
+            raise ValueError("'hooks' must be an object mapping events to arrays")
+        return data["hooks"]
+    if any(key in VALID_EVENTS for key in data):
+        return data
+    return {}
+
+def load_hooks_source(source: str) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    Load hooks from a settings file path, '-' (stdin), or a JSON string.
+
+    Returns:
+        (scope, label, hooks_config)
+
+    Raises:
+        ValueError: unreadable file or invalid JSON
+    """
+    if source == "-":
+        scope, label, text = "stdin", "<stdin>", sys.stdin.read()
+    elif source.lstrip().startswith("{"):
+        scope, label, text = "argument", "<argument>", source
+    else:
+        path = Path(source).expanduser()
+        scope, label = scope_for(path), str(path)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError as e:
+            raise ValueError(f"Cannot read {path}: {e.strerror}")
+
+    try:
+        data = json.loads(text) if text.strip() else {}
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {label}: {e}")
+    if not isinstance(data, dict):
+        raise ValueError(f"{label}: top level must be a JSON object")
+    try:
+        return scope, label, extract_hooks(data)
+    except ValueError as e:
+        raise ValueError(f"{label}: {e}")
+
+def merge_hooks(scoped: List[Tuple[str, str, Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Combine hooks from all scopes: each valid event's matcher groups are concatenated in scope order."""
+    merged = {}
+    for _, _, hooks_config in scoped:
+        for event, event_configs in hooks_config.items():
+            if event in VALID_EVENTS and isinstance(event_configs, list):
+                merged.setdefault(event, []).extend(event_configs)
+    return merged
+
+def count_commands(event_configs: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """Return (commands, unique commands) across an event's matcher groups."""
+    commands = [
+        hook.get("command")
+        for config in event_configs if isinstance(config, dict) and isinstance(config.get("hooks"), list)
+        for hook in config["hooks"] if isinstance(hook, dict) and hook.get("command")
+    ]
+    return len(commands), len(set(commands))
+
+def analyze_fanout(scoped: List[Tuple[str, str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Expand PreToolUse/PostToolUse matchers against KNOWN_TOOLS.
+
+    Returns per event:
+        {'tools': {tool: [registration]}, 'duplicates': {command: ([registration], [overlapping tools])},
+         'unmatched': [registration]}
+    where a registration is {'scope', 'matcher', 'command', 'timeout'}.
+    """
+    report = {}
+    for event in EVENTS_WITH_MATCHERS:
+        registrations = []
+        for scope, _, hooks_config in scoped:
+            for config in hooks_config.get(event, []):
+                if not isinstance(config, dict) or not isinstance(config.get("hooks"), list):
+                    continue
+                for hook in config["hooks"]:
+                    if isinstance(hook, dict) and isinstance(hook.get("command"), str):
+                        registrations.append({
+                            "scope": scope,
+                            "matcher": config.get("matcher", ""),
+                            "command": hook["command"],
+                            "timeout": hook.get("timeout", DEFAULT_TIMEOUT),
+                        })
+        if not registrations:
+            continue
+
+        matched = {}
+        for registration in registrations:
+            if registration["matcher"] not in matched:
+                matched[registration["matcher"]] = set(tools_matching(registration["matcher"]))
+
+        tools = {tool: [r for r in registrations if tool in matched[r["matcher"]]] for tool in KNOWN_TOOLS}
+
+        by_command = {}
+        for registration in registrations:
+            by_command.setdefault(registration["command"], []).append(registration)
+        duplicates = {}
+        for command, regs in by_command.items():
+            if len(regs) < 2:
+                continue
+            overlap = [tool for tool in KNOWN_TOOLS
+                       if sum(tool in matched[r["matcher"]] for r in regs) > 1]
+            if overlap:
+                duplicates[command] = (regs, overlap)
+
+        report[event] = {
+            "tools": {tool: regs for tool, regs in tools.items() if regs},
+            "duplicates": duplicates,
+            "unmatched": [r for r in registrations if not matched[r["matcher"]]],
+        }
+    return report
+
+def print_fanout(report: Dict[str, Dict[str, Any]]) -> None:
+    """Print the fan-out report from analyze_fanout()."""
+    if not report:
+        print("\nNo PreToolUse/PostToolUse hooks")
+        return
+
+    for event, analysis in report.items():
+        print(f"\nHook fan-out ({event}):")
+        for tool, regs in analysis["tools"].items():
+            # Identical commands run once; matching hooks run in parallel
+            unique = {}
+            for r in regs:
+                unique[r["command"]] = max(unique.get(r["command"], 0), r["timeout"])
+            print(f"  {tool:<14} {len(regs)} hooks ({len(unique)} unique)  "
+                  f"timeout budget: {sum(unique.values())}s total, {max(unique.values())}s worst-case wait")
+
+        if analysis["duplicates"]:
+            print("  Duplicate commands under overlapping matchers:")
+            for command, (regs, overlap) in analysis["duplicates"].items():
+                where = ", ".join(f"{r['scope']} [{r['matcher'] or '*'}]" for r in regs)
+                print(f"    ⚠ {command}: {where} → fire together for {', '.join(overlap)}")
+
+        for registration in analysis["unmatched"]:
+            print(f"  ⚠ Matcher '{registration['matcher']}' ({registration['scope']}) matches no built-in tool "
+                  f"(MCP tool or typo?): {registration['command']}")
+
+def validate_sources(sources: List[str], fanout: bool = False) -> bool:
+    """Validate settings sources per scope, then print the merged view. Returns True if all valid."""
+    scoped = []
+    ok = True
+    for source in sources:
+        try:
+            scoped.append(load_hooks_source(source))
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            ok = False
+
+    for scope, label, hooks_config in scoped:
+        errors = validate_full_hooks_config(hooks_config)
+        groups = sum(len(c) for c in hooks_config.values() if isinstance(c, list))
+        if errors:
+            ok = False
+            print(f"❌ {scope}: {label}", file=sys.stderr)
+            for location, error_list in errors.items():
+                print(f"  {location}:", file=sys.stderr)
+                for error in error_list:
+                    print(f"    • {error}", file=sys.stderr)
+        else:
+            print(f"✅ {scope}: {label} ({groups} hook groups)")
+
+    merged = merge_hooks(scoped)
+    if merged:
+        print(f"\nMerged hooks ({' → '.join(scope for scope, _, _ in scoped)}):")
+        for event, event_configs in merged.items():
+            total, unique = count_commands(event_configs)
+            duplicates = f", {total - unique} duplicate commands run once" if total != unique else ""
+            print(f"  {event}: {len(event_configs)} groups, {total} commands{duplicates}")
+
+    if fanout:
+        print_fanout(analyze_fanout(scoped))
+
+    return ok
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 validate_hook.py <hooks_config_json>", file=sys.stderr)
-        print("\nExample:", file=sys.stderr)
-        print('  python3 validate_hook.py \'{"PreToolUse": [{"matcher": "Bash", "hooks": [{"type": "command", "command": "echo test"}]}]}\'', file=sys.stderr)
-        sys.exit(1)
+    if len(sys.argv) >= 2 and sys.argv[1] in ("-h", "--help"):
+        print(__doc__.strip())
+        sys.exit(0)
+
+    fanout = "--fanout" in sys.argv[1:]
+    sources = [arg for arg in sys.argv[1:] if arg != "--fanout"]
+    if not sources:
+        sources = [str(path) for _, path in discover_settings()]
+        if not sources:
+            print("No settings files found (~/.claude/settings.json, .claude/settings.json, .claude/settings.local.json)", file=sys.stderr)
+            print("\nUsage: python3 validate_hook.py '<hooks_config_json>' | <settings.json>... | -", file=sys.stderr)
+            print("\nExample:", file=sys.stderr)
+            print('  python3 validate_hook.py \'{"PreToolUse": [{"matcher": "Bash", "hooks": [{"type": "command", "command": "echo test"}]}]}\'', file=sys.stderr)
+            sys.exit(1)
+
+    # Settings files or stdin
+    if fanout or len(sources) > 1 or sources[0] == "-" or not sources[0].lstrip().startswith("{"):
+        sys.exit(0 if validate_sources(sources, fanout) else 1)
 
-    hooks_json = sys.argv[1]
+    hooks_json = sources[0]
 
     try:
         hooks_config = json.loads(hooks_json)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Skill Bundler - Deduplicated, content-addressed bundle of many skills
+
+Skills in a plugin often ship identical scripts/ and references/ files. Instead
+of one zip per skill, a bundle stores every distinct file content once and a
+small manifest per skill:
+
+    bundle.json                 Format version and list of skills
+    manifests/<skill>.json      Skill files: path, mode, sha256 of content
+    blobs/<sha256>              File contents, stored once per distinct content
+
+Bundles use the same reproducibility rules as package_skill.py (sorted entries,
+fixed timestamps, .skillignore, stored vs deflated per file type).
+
+Usage:
+    python3 scripts/bundle_skills.py build <skill-or-skills-dir>... -o plugin.skillbundle
+    python3 scripts/bundle_skills.py unpack plugin.skillbundle <dest-dir> [--skill NAME]...
+    python3 scripts/bundle_skills.py list plugin.skillbundle
+"""
+
+import sys
+import os
+import json
+import hashlib
+import tempfile
+import zipfile
+from pathlib import Path, PureWindowsPath
+from quick_validate import validate_skill
+from package_skill import ZIP_EPOCH, collect_files, compression_for, find_skill_dirs, hash_file
+
+BUNDLE_FORMAT = 1
+
+
+def _zip_info(name, compress_type=zipfile.ZIP_DEFLATED):
+    """ZipInfo with normalized metadata for reproducible bundles."""
+    info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+    info.create_system = 3
+    info.external_attr = 0o100644 << 16
+    info.compress_type = compress_type
+    return info
+
+
+def build_bundle(skill_paths, bundle_path):
+    """
+    Build a deduplicated bundle from skill folders.
+
+    Args:
+        skill_paths: Skill folders or directories containing skills
+        bundle_path: Output bundle file
+
+    Returns:
+        Stats dict (skills, files, blobs, total_bytes, unique_bytes), or None if error
+    """
+    skills = find_skill_dirs(skill_paths)
+    if not skills:
+        print("❌ Error: No skills found (no SKILL.md in the given paths)")
+        return None
+
+    manifests = {}
+    blobs = {}  # sha256 -> source path (first occurrence)
+    total_bytes = 0
+
+    for skill in skills:
+        valid, message = validate_skill(skill)
+        if not valid:
+            print(f"❌ {skill.name}: validation failed: {message}")
+            return None
+        if skill.name in manifests:
+            print(f"❌ Error: Duplicate skill name '{skill.name}' ({skill})")
+            return None
+
+        files = []
+        for arcname, file_path, mode in collect_files(skill):
+            digest = hash_file(file_path)
+            blobs.setdefault(digest, file_path)
+            total_bytes += file_path.stat().st_size
+            files.append({
+                'path': arcname.split('/', 1)[1],
+                'mode': f"{mode:o}",
+                'sha256': digest,
+            })
+        manifests[skill.name] = {'skill': skill.name, 'files': files}
+
+    bundle_path = Path(bundle_path).resolve()
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{bundle_path.name}.", suffix='.tmp', dir=bundle_path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as raw, zipfile.ZipFile(raw, 'w') as zipf:
+            index = {'format': BUNDLE_FORMAT, 'skills': sorted(manifests)}
+            zipf.writestr(_zip_info('bundle.json'), json.dumps(index, indent=2) + '\n')
+
+            for name in sorted(manifests):
+                zipf.writestr(_zip_info(f'manifests/{name}.json'),
+                              json.dumps(manifests[name], indent=2) + '\n')
+
+            for digest in sorted(blobs):
+                source = blobs[digest]
+                info = _zip_info(f'blobs/{digest}', compression_for(source))
+                info.file_size = source.stat().st_size
+                with open(source, 'rb') as src, zipf.open(info, 'w') as dst:
+                    while chunk := src.read(1 << 20):
+                        dst.write(chunk)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, bundle_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    unique_bytes = sum(path.stat().st_size for path in blobs.values())
+    return {
+        'skills': len(manifests),
+        'files': sum(len(m['files']) for m in manifests.values()),
+        'blobs': len(blobs),
+        'total_bytes': total_bytes,
+        'unique_bytes': unique_bytes,
+    }
+
+
+def check_skill_name(name):
+    """Reject skill names that are not one plain path component (they become dest/<skill>/)."""
+    if (not isinstance(name, str) or not name or '..' in name
+            or any(char in name for char in '/\\\0')
+            or os.path.isabs(name) or PureWindowsPath(name).drive):
+        raise ValueError(f"Unsafe skill name in bundle: {name!r}")
+
+
+def file_mode(value):
+    """Mode to unpack a manifest entry with: 0o755 if any exec bit is set, else 0o644 (as the packer writes).
+
+    Anything but an octal string within the permission bits (setuid, setgid,
+    sticky or file-type bits included) is rejected.
+    """
+    if not isinstance(value, str) or not value or any(char not in '01234567' for char in value):
+        raise ValueError(f"Invalid file mode in bundle: {value!r}")
+    mode = int(value, 8)
+    if mode & ~0o777:
+        raise ValueError(f"Unsafe file mode in bundle: {value}")
+    return 0o755 if mode & 0o111 else 0o644
+
+
+def read_index(zipf):
+    """Read and check bundle.json."""
+    index = json.loads(zipf.read('bundle.json'))
+    if index.get('format') != BUNDLE_FORMAT:
+        raise ValueError(f"Unsupported bundle format: {index.get('format')}")
+    for name in index['skills']:
+        check_skill_name(name)
+    return index
+
+
+def unpack_bundle(bundle_path, dest_dir, skills=None, verify=False):
+    """
+    Unpack skills from a bundle into dest_dir/<skill>/...
+
+    Each blob is decompressed once and written to every path that uses it.
+    Skill names and file paths that would land outside dest_dir, and modes
+    beyond the permission bits, are rejected before anything is written;
+    files are written 0o755 or 0o644.
+
+    Returns:
+        Number of files written
+    """
+    dest_dir = Path(dest_dir).resolve()
+    with zipfile.ZipFile(bundle_path, 'r') as zipf:
+        index = read_index(zipf)
+        selected = skills or index['skills']
+        unknown = set(selected) - set(index['skills'])
+        if unknown:
+            raise ValueError(f"Skills not in bundle: {', '.join(sorted(unknown))}")
+
+        # Group destinations by blob so each blob is read once
+        targets = {}
+        for name in selected:
+            manifest = json.loads(zipf.read(f'manifests/{name}.json'))
+            skill_dir = (dest_dir / name).resolve()
+            if skill_dir == dest_dir or not skill_dir.is_relative_to(dest_dir):
+                raise ValueError(f"Unsafe skill name in bundle: {name!r}")
+            for entry in manifest['files']:
+                target = (skill_dir / entry['path']).resolve()
+                if not target.is_relative_to(skill_dir):
+                    raise ValueError(f"Unsafe path in manifest for {name}: {entry['path']}")
+                targets.setdefault(entry['sha256'], []).append((target, file_mode(entry['mode'])))
+
+        written = 0
+        for digest in sorted(targets):
+            data = zipf.read(f'blobs/{digest}')
+            if verify and hashlib.sha256(data).hexdigest() != digest:
+                raise ValueError(f"Blob {digest} is corrupt")
+            for target, mode in targets[digest]:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data)
+                os.chmod(target, mode)
+                written += 1
+
+    return written
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Build or unpack a deduplicated multi-skill bundle',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 scripts/bundle_skills.py build plugins/m42-meta-toolkit/skills -o dist/meta-toolkit.skillbundle
+  python3 scripts/bundle_skills.py unpack dist/meta-toolkit.skillbundle ~/.claude/skills
+  python3 scripts/bundle_skills.py unpack dist/meta-toolkit.skillbundle ./skills --skill creating-hooks
+  python3 scripts/bundle_skills.py list dist/meta-toolkit.skillbundle
+        """
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help='Build a bundle from skill folders')
+    build.add_argument('paths', nargs='+', help='Skill folders or directories containing skills')
+    build.add_argument('-o', '--output', required=True, type=Path, help='Bundle file to write')
+
+    unpack = subparsers.add_parser('unpack', help='Unpack skills from a bundle')
+    unpack.add_argument('bundle', type=Path, help='Bundle file')
+    unpack.add_argument('dest', type=Path, help='Destination directory (skills land in dest/<skill>/)')
+    unpack.add_argument('--skill', action='append', help='Only unpack this skill (repeatable)')
+    unpack.add_argument('--verify', action='store_true', help='Check blob hashes while unpacking')
+
+    list_cmd = subparsers.add_parser('list', help='List skills in a bundle')
+    list_cmd.add_argument('bundle', type=Path, help='Bundle file')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'build':
+            print(f"📦 Bundling skills into: {args.output}")
+            stats = build_bundle(args.paths, args.output)
+            if not stats:
+                sys.exit(1)
+            saved = stats['total_bytes'] - stats['unique_bytes']
+            print(f"✅ {stats['skills']} skills, {stats['files']} files -> {stats['blobs']} unique blobs")
+            print(f"   Content: {stats['total_bytes']} bytes, {stats['unique_bytes']} after dedup ({saved} saved)")
+
+        elif args.command == 'unpack':
+            written = unpack_bundle(args.bundle, args.dest, args.skill, verify=args.verify)
+            print(f"✅ Unpacked {written} files into {args.dest}")
+
+        else:
+            with zipfile.ZipFile(args.bundle, 'r') as zipf:
+                for name in read_index(zipf)['skills']:
+                    manifest = json.loads(zipf.read(f'manifests/{name}.json'))
+                    print(f"{name} ({len(manifest['files'])} files)")
+
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,56 +2,218 @@
 """
 Skill Packager - Creates a distributable zip file of a skill folder
 
+Packages are reproducible: entries are sorted, timestamps and permissions are
+normalized, and files matched by built-in ignores or a `.skillignore` file in
+the skill folder are skipped. The archive comment carries a manifest digest of
+the packaged content, so `--incremental` can skip rebuilding unchanged skills.
+
+Already-compressed assets (images, archives, fonts) are stored as-is; everything
+else is deflated. Archives are written to a temp file next to the target and
+atomically renamed into place, so readers never see a partial zip.
+
+Validation reuses a result cached by `validate_skill.py --cache` (see
+validation_cache.py) while the skill's files and the validator are unchanged;
+otherwise quick_validate runs. Packaging never writes the cache. Either way a
+skill passes on the validator's own criterion: all counted checks passed.
+
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--incremental] [--verbose]
+    python utils/package_skill.py <skill-or-skills-dir>... --output-dir DIR [--jobs N]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --incremental
+    python utils/package_skill.py plugins/ --output-dir ./dist --jobs 8 --incremental
 """
 
 import sys
+import os
+import fnmatch
+import hashlib
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from quick_validate import validate_skill
+from validation_cache import load_result
+
+# Patterns always excluded from packages (matched against each path component)
+DEFAULT_IGNORES = ['__pycache__', '*.pyc', '.git']
+
+# Fixed entry timestamp (earliest date the zip format can represent)
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+MANIFEST_PREFIX = b'skill-manifest:sha256:'
+
+# Formats that are already compressed; deflating them again only burns CPU
+STORED_SUFFIXES = {
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z',
+    '.woff', '.woff2', '.mp3', '.mp4', '.webm',
+}
+
+
+def load_ignore_patterns(skill_path):
+    """Return default ignore patterns plus any listed in the skill's .skillignore."""
+    patterns = list(DEFAULT_IGNORES)
+    ignore_file = skill_path / '.skillignore'
+    if ignore_file.is_file():
+        for line in ignore_file.read_text(encoding='utf-8').splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                patterns.append(line.rstrip('/'))
+    return patterns
+
+
+def is_ignored(rel_path, patterns):
+    """Check a skill-relative path against ignore patterns.
+
+    Patterns containing '/' match the whole relative path; others match any
+    single path component (so '__pycache__' excludes the directory anywhere).
+    """
+    posix = rel_path.as_posix()
+    for pattern in patterns:
+        if '/' in pattern:
+            if fnmatch.fnmatch(posix, pattern):
+                return True
+        elif any(fnmatch.fnmatch(part, pattern) for part in rel_path.parts):
+            return True
+    return False
+
+
+def collect_files(skill_path):
+    """Return sorted (arcname, path, mode) for every packaged file."""
+    patterns = load_ignore_patterns(skill_path)
+    entries = []
+    for file_path in skill_path.rglob('*'):
+        if not file_path.is_file():
+            continue
+        rel_path = file_path.relative_to(skill_path)
+        if is_ignored(rel_path, patterns):
+            continue
+        # Normalize permissions: keep only the executable bit
+        mode = 0o755 if os.access(file_path, os.X_OK) else 0o644
+        arcname = (Path(skill_path.name) / rel_path).as_posix()
+        entries.append((arcname, file_path, mode))
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def hash_file(file_path):
+    """Return the sha256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_manifest_digest(entries, compresslevel=None):
+    """Hash (arcname, mode, content hash) of every entry into one digest.
+
+    The compression level is part of the digest so changing it forces a rebuild.
+    """
+    manifest = hashlib.sha256(f"compresslevel={compresslevel}\n".encode('utf-8'))
+    for arcname, file_path, mode in entries:
+        manifest.update(f"{arcname}\0{mode:o}\0{hash_file(file_path)}\n".encode('utf-8'))
+    return manifest.hexdigest()
+
+
+def read_manifest_digest(zip_filename):
+    """Return the manifest digest stored in an existing package, or None."""
+    try:
+        with zipfile.ZipFile(zip_filename, 'r') as zipf:
+            comment = zipf.comment
+    except (OSError, zipfile.BadZipFile):
+        return None
+    if comment.startswith(MANIFEST_PREFIX):
+        return comment[len(MANIFEST_PREFIX):].decode('ascii', errors='replace')
+    return None
+
+
+def compression_for(file_path):
+    """Pick ZIP_STORED for already-compressed formats, ZIP_DEFLATED otherwise."""
+    if file_path.suffix.lower() in STORED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def write_package(zip_filename, entries, digest, compresslevel=None, log=print, verbose=False):
+    """Stream entries into a temp zip with normalized metadata, then atomically replace."""
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{zip_filename.name}.", suffix='.tmp', dir=zip_filename.parent)
+    try:
+        with os.fdopen(fd, 'wb') as raw, zipfile.ZipFile(raw, 'w') as zipf:
+            for arcname, file_path, mode in entries:
+                info = zipfile.ZipInfo(arcname, date_time=ZIP_EPOCH)
+                info.create_system = 3  # Unix, so permissions are honoured everywhere
+                info.external_attr = (0o100000 | mode) << 16
+                info.compress_type = compression_for(file_path)
+                zipf.writestr(info, file_path.read_bytes(), compresslevel=compresslevel)
+                if verbose:
+                    log(f"  Added: {arcname}")
+            zipf.comment = MANIFEST_PREFIX + digest.encode('ascii')
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, zip_filename)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
-def package_skill(skill_path, output_dir=None):
+def package_skill(skill_path, output_dir=None, incremental=False, verbose=False,
+                  compresslevel=None, log=print):
     """
     Package a skill folder into a zip file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the zip file (defaults to current directory)
+        incremental: Skip rebuilding when the existing zip's manifest matches the content
+        verbose: Print every added file
+        compresslevel: Deflate level 0-9 (None = zlib default)
+        log: Callable receiving each output line (bulk mode buffers per skill)
 
     Returns:
-        Path to the created zip file, or None if error
+        Path to the created (or up-to-date) zip file, or None if error
     """
     skill_path = Path(skill_path).resolve()
 
     # Validate skill folder exists
     if not skill_path.exists():
-        print(f"❌ Error: Skill folder not found: {skill_path}")
+        log(f"❌ Error: Skill folder not found: {skill_path}")
         return None
 
     if not skill_path.is_dir():
-        print(f"❌ Error: Path is not a directory: {skill_path}")
+        log(f"❌ Error: Path is not a directory: {skill_path}")
         return None
 
     # Validate SKILL.md exists
     skill_md = skill_path / "SKILL.md"
     if not skill_md.exists():
-        print(f"❌ Error: SKILL.md not found in {skill_path}")
+        log(f"❌ Error: SKILL.md not found in {skill_path}")
         return None
 
-    # Run validation before packaging
-    print("🔍 Validating skill...")
-    valid, message = validate_skill(skill_path)
-    if not valid:
-        print(f"❌ Validation failed: {message}")
-        print("   Please fix the validation errors before packaging.")
-        return None
-    print(f"✅ {message}\n")
+    # Reuse the last validation result when the skill has not changed since
+    cached = load_result(skill_path)
+    if cached:
+        # Same pass criterion the validator reports (errors outside the
+        # counted checks, e.g. portable paths, do not fail validate_skill)
+        if cached['passed'] < cached['total']:
+            log(f"❌ Validation failed ({cached['validator']}, cached): "
+                f"{cached['passed']}/{cached['total']} checks passed")
+            for issue in cached['errors']:
+                log(f"   ✗ {issue['check']}: {issue['fix']}")
+            log("   Please fix the validation errors before packaging.")
+            return None
+        log(f"✅ Skill is valid ({cached['validator']}, cached)\n")
+    else:
+        log("🔍 Validating skill...")
+        valid, message = validate_skill(skill_path)
+        if not valid:
+            log(f"❌ Validation failed: {message}")
+            log("   Please fix the validation errors before packaging.")
+            return None
+        log(f"✅ {message}\n")
 
     # Determine output location
     skill_name = skill_path.name
@@ -65,46 +227,144 @@ def package_skill(skill_path, output_dir=None):
 
     # Create the zip file
     try:
-        with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
-
-        print(f"\n✅ Successfully packaged skill to: {zip_filename}")
+        entries = collect_files(skill_path)
+        digest = compute_manifest_digest(entries, compresslevel)
+
+        if incremental and zip_filename.exists() and read_manifest_digest(zip_filename) == digest:
+            log(f"✅ Up to date, skipped rebuild: {zip_filename}")
+            return zip_filename
+
+        write_package(zip_filename, entries, digest, compresslevel=compresslevel, log=log, verbose=verbose)
+
+        log(f"✅ Successfully packaged skill ({len(entries)} files) to: {zip_filename}")
         return zip_filename
 
     except Exception as e:
-        print(f"❌ Error creating zip file: {e}")
+        log(f"❌ Error creating zip file: {e}")
         return None
 
 
+def find_skill_dirs(paths):
+    """Expand paths to skill folders: a folder with SKILL.md, or every SKILL.md beneath it."""
+    skills = []
+    for path in paths:
+        path = Path(path).resolve()
+        if (path / "SKILL.md").is_file() or not path.is_dir():
+            # Non-directories fall through so package_skill reports the error
+            skills.append(path)
+        else:
+            skills.extend(sorted(skill_md.parent for skill_md in path.rglob("SKILL.md")))
+
+    # De-duplicate while keeping order
+    return list(dict.fromkeys(skills))
+
+
+def package_skills(skill_paths, output_dir, jobs=None, **options):
+    """Package many skills concurrently.
+
+    Compression and hashing release the GIL, so threads keep all cores busy
+    while output stays grouped per skill in input order.
+
+    Returns:
+        List of (skill_path, zip_path or None)
+    """
+    skill_paths = find_skill_dirs(skill_paths)
+    names = {}
+    for skill in skill_paths:
+        names.setdefault(skill.name, []).append(skill)
+    clashes = {name: dirs for name, dirs in names.items() if len(dirs) > 1}
+    if clashes:
+        for name, dirs in clashes.items():
+            print(f"❌ Error: {len(dirs)} skills named '{name}' would overwrite {name}.zip:")
+            for d in dirs:
+                print(f"   {d}")
+        return [(skill, None) for skill in skill_paths]
+
+    def run(skill):
+        lines = []
+        result = package_skill(skill, output_dir, log=lines.append, **options)
+        return skill, result, lines
+
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        for skill, result, lines in pool.map(run, skill_paths):
+            print(f"📦 {skill.name}")
+            for line in lines:
+                print(f"   {line}".rstrip())
+            results.append((skill, result))
+    return results
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
-        sys.exit(1)
+    import argparse
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    parser = argparse.ArgumentParser(
+        description='Package skill folders into reproducible zip files',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python utils/package_skill.py skills/public/my-skill
+  python utils/package_skill.py skills/public/my-skill ./dist
+  python utils/package_skill.py skills/public/my-skill ./dist --incremental
+  python utils/package_skill.py plugins/ --output-dir ./dist --jobs 8 --incremental
 
-    print(f"📦 Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
-    print()
+Bulk mode:
+  Pass several skill folders, or a directory containing skills (every SKILL.md
+  beneath it is packaged), together with --output-dir. Skills are packaged
+  concurrently; output is grouped per skill.
 
-    result = package_skill(skill_path, output_dir)
+Ignored files:
+  __pycache__/, *.pyc and .git/ are always excluded. Add one glob per line to
+  a .skillignore file in the skill folder to exclude more.
+        """
+    )
 
-    if result:
-        sys.exit(0)
-    else:
+    parser.add_argument('paths', nargs='+', metavar='path',
+                        help='Skill folder(s) or directories containing skills; '
+                             'a trailing non-skill path is the output directory (single-skill form)')
+    parser.add_argument('-o', '--output-dir', help='Output directory (default: current directory)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Skip rebuilding when the existing zip already matches the skill content')
+    parser.add_argument('--verbose', action='store_true',
+                        help='List every file added to the package')
+    parser.add_argument('--compression-level', type=int, choices=range(0, 10), metavar='0-9',
+                        help='Deflate level for compressible files (default: zlib default)')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='Skills to package concurrently in bulk mode (0 = one per CPU, default: 0)')
+
+    args = parser.parse_args()
+
+    paths = args.paths
+    output_dir = args.output_dir
+    # Single-skill form: <skill-folder> <output-directory>
+    if output_dir is None and len(paths) == 2 and not (Path(paths[1]) / "SKILL.md").is_file() \
+            and (Path(paths[0]) / "SKILL.md").is_file():
+        paths, output_dir = paths[:1], paths[1]
+
+    options = {
+        'incremental': args.incremental,
+        'verbose': args.verbose,
+        'compresslevel': args.compression_level,
+    }
+
+    if len(paths) == 1 and (Path(paths[0]) / "SKILL.md").is_file():
+        print(f"📦 Packaging skill: {paths[0]}")
+        if output_dir:
+            print(f"   Output directory: {output_dir}")
+        print()
+
+        result = package_skill(paths[0], output_dir, **options)
+        sys.exit(0 if result else 1)
+
+    results = package_skills(paths, output_dir, jobs=args.jobs, **options)
+    if not results:
+        print("❌ Error: No skills found (no SKILL.md in the given paths)")
         sys.exit(1)
 
+    failed = [skill for skill, result in results if not result]
+    print(f"\n{'✅' if not failed else '❌'} Packaged {len(results) - len(failed)}/{len(results)} skills")
+    sys.exit(1 if failed else 0)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
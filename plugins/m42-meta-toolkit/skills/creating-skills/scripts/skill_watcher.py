@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+File change notifications for a skill folder, used by validate_skill.py --watch.
+
+On Linux the folder tree is watched with inotify (via ctypes, no extra
+packages); elsewhere, or when inotify is unavailable, the folder is polled by
+comparing (mtime, size) signatures. Either way, watch() reports batches of
+changed paths relative to the skill folder, ignoring the same files the
+validation cache ignores.
+
+Usage:
+    python3 scripts/skill_watcher.py /path/to/skill-folder   # print changes
+"""
+
+import sys
+import os
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Iterator, Optional, Set, Tuple
+
+from validation_cache import SKIP_PARTS, SKIP_SUFFIXES, skill_signature
+
+# inotify event masks (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+# Events arriving this close together are reported as one batch (editors save in several steps)
+DEBOUNCE_SECONDS = 0.05
+
+
+def _ignored(rel: str) -> bool:
+    """True for paths that never affect validation (caches, VCS metadata)."""
+    parts = rel.split('/')
+    return bool(SKIP_PARTS.intersection(parts)) or os.path.splitext(rel)[1] in SKIP_SUFFIXES
+
+
+class InotifyWatcher:
+    """Recursive inotify watch on a directory tree."""
+
+    def __init__(self, root: Path):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.root = root
+        self.fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}  # watch descriptor -> directory relative to root ('' for root)
+        self._add_tree(root)
+
+    def _add_dir(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        rel = directory.relative_to(self.root).as_posix()
+        self.dirs[wd] = '' if rel == '.' else rel
+
+    def _add_tree(self, top: Path) -> None:
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_PARTS]
+            self._add_dir(Path(dirpath))
+
+    def read(self, timeout: Optional[float]) -> Optional[Set[str]]:
+        """
+        Wait up to timeout seconds for changes.
+
+        Returns:
+            Set of changed relative paths (empty on timeout), or None when the
+            kernel queue overflowed and the caller should rescan everything
+        """
+        changed = set()
+        while True:
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+            if not ready:
+                return changed
+            data = os.read(self.fd, 64 * 1024)
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                if mask & IN_IGNORED:
+                    self.dirs.pop(wd, None)
+                    continue
+                parent = self.dirs.get(wd)
+                if parent is None or not name:
+                    continue
+                rel = f"{parent}/{name}" if parent else name
+                if _ignored(rel):
+                    continue
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        # New subtree: watch it and report the files it already holds
+                        self._add_tree(self.root / rel)
+                        for path in (self.root / rel).rglob('*'):
+                            if path.is_file():
+                                changed.add(path.relative_to(self.root).as_posix())
+                    else:
+                        changed.add(rel)
+                    continue
+                changed.add(rel)
+            # Keep collecting until the burst of events settles
+            timeout = DEBOUNCE_SECONDS
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def open_inotify(root: Path) -> Optional[InotifyWatcher]:
+    """Return an inotify watcher for root, or None where inotify is unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        return InotifyWatcher(root)
+    except (OSError, AttributeError):  # no libc symbol, watch limit reached, ...
+        return None
+
+
+def _inotify_changes(watcher: InotifyWatcher) -> Iterator[Optional[Set[str]]]:
+    try:
+        while True:
+            changed = watcher.read(None)
+            if changed is None or changed:
+                yield changed
+    finally:
+        watcher.close()
+
+
+def _poll_changes(skill_path: Path, interval: float) -> Iterator[Set[str]]:
+    previous = skill_signature(skill_path)
+    while True:
+        time.sleep(interval)
+        current = skill_signature(skill_path)
+        changed = {rel for rel in previous.keys() | current.keys() if previous.get(rel) != current.get(rel)}
+        previous = current
+        if changed:
+            yield changed
+
+
+def watch(skill_path: Path, interval: float = 0.5, backend: str = 'auto') -> Tuple[str, Iterator[Optional[Set[str]]]]:
+    """
+    Start watching skill_path.
+
+    backend is 'auto' (inotify, else polling), 'inotify' or 'poll'.
+
+    Returns:
+        (backend used, iterator yielding sets of changed relative posix paths
+        forever; a yielded None means changes were lost and everything should
+        be rechecked)
+
+    Raises:
+        OSError: backend='inotify' but inotify is unavailable
+    """
+    skill_path = Path(skill_path).resolve()
+    watcher = open_inotify(skill_path) if backend != 'poll' else None
+    if watcher:
+        return 'inotify', _inotify_changes(watcher)
+    if backend == 'inotify':
+        raise OSError("inotify is not available on this system")
+    return 'polling', _poll_changes(skill_path, interval)
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python3 skill_watcher.py <skill_directory>")
+        sys.exit(1)
+
+    backend, changes = watch(Path(sys.argv[1]))
+    print(f"Watching {sys.argv[1]} ({backend}), Ctrl-C to stop")
+    try:
+        for changed in changes:
+            stamp = time.strftime('%H:%M:%S')
+            print(f"[{stamp}] " + (', '.join(sorted(changed)) if changed is not None else 'rescan'))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
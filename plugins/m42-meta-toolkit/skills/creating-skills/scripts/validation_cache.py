@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Validation result cache shared by validate_skill.py and package_skill.py.
+
+validate_skill.py stores its SKILL.md result per skill when run with --cache;
+package_skill.py reuses it instead of re-parsing. An entry is fresh when the
+validator's source is unchanged (new or changed checks invalidate it) and
+every file's (mtime, size) still matches - checked with stat() only - or,
+failing that, when the content hash of the skill folder is unchanged.
+
+Cache location: $M42_VALIDATION_CACHE_DIR, else $XDG_CACHE_HOME/m42-meta-toolkit/
+skill-validation, else ~/.cache/m42-meta-toolkit/skill-validation.
+
+Usage:
+    python3 scripts/validation_cache.py /path/to/skill-folder   # show cached result
+"""
+
+import sys
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+CACHE_VERSION = 2
+
+# Never part of validation input
+SKIP_PARTS = {'__pycache__', '.git'}
+SKIP_SUFFIXES = {'.pyc', '.pyo'}
+
+
+def cache_dir() -> Path:
+    """Return the cache directory (not created)."""
+    override = os.environ.get('M42_VALIDATION_CACHE_DIR')
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'm42-meta-toolkit' / 'skill-validation'
+
+
+def cache_file(skill_path: Path) -> Path:
+    """Cache entry path for a skill folder (keyed by its resolved path)."""
+    key = hashlib.sha256(str(Path(skill_path).resolve()).encode('utf-8')).hexdigest()[:32]
+    return cache_dir() / f"{key}.json"
+
+
+def list_files(skill_path: Path):
+    """Yield (relative posix path, Path) for every file that can affect validation."""
+    for file_path in sorted(skill_path.rglob('*')):
+        rel = file_path.relative_to(skill_path)
+        if SKIP_PARTS.intersection(rel.parts) or file_path.suffix in SKIP_SUFFIXES:
+            continue
+        if file_path.is_file():
+            yield rel.as_posix(), file_path
+
+
+def skill_signature(skill_path: Path) -> Dict[str, list]:
+    """Map each file to [mtime_ns, size] - stat only, no reads."""
+    signature = {}
+    for rel, file_path in list_files(skill_path):
+        st = file_path.stat()
+        signature[rel] = [st.st_mtime_ns, st.st_size]
+    return signature
+
+
+def content_hash(skill_path: Path) -> str:
+    """sha256 over every file's path and content."""
+    digest = hashlib.sha256()
+    for rel, file_path in list_files(skill_path):
+        digest.update(rel.encode('utf-8') + b'\0')
+        digest.update(hashlib.sha256(file_path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def validator_digest(validator: str) -> str:
+    """sha256 of a validator's source (scripts/<validator>.py), '' if it cannot be read."""
+    try:
+        return hashlib.sha256((Path(__file__).resolve().parent / f"{validator}.py").read_bytes()).hexdigest()
+    except OSError:
+        return ''
+
+
+def store_result(skill_path: Path, validator: str, passed: int, total: int,
+                 errors: list, warnings: list) -> Optional[Path]:
+    """Store a validation result for skill_path. errors/warnings are lists of {check, fix}.
+
+    Returns the cache file, or None if the cache is not writable (caching is best-effort).
+    """
+    skill_path = Path(skill_path).resolve()
+    entry = {
+        'version': CACHE_VERSION,
+        'skill': str(skill_path),
+        'validator': validator,
+        'validator_digest': validator_digest(validator),
+        'signature': skill_signature(skill_path),
+        'content_hash': content_hash(skill_path),
+        'passed': passed,
+        'total': total,
+        'errors': errors,
+        'warnings': warnings,
+    }
+
+    target = cache_file(skill_path)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=target.parent)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_name, target)
+    except OSError:
+        return None
+    return target
+
+
+def load_result(skill_path: Path) -> Optional[Dict]:
+    """Return the cached result if it still matches the skill's files, else None."""
+    skill_path = Path(skill_path).resolve()
+    try:
+        entry = json.loads(cache_file(skill_path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if entry.get('version') != CACHE_VERSION or entry.get('skill') != str(skill_path):
+        return None
+    # Recorded by another version of the validator: its checks or total may differ
+    if not entry['validator_digest'] or entry['validator_digest'] != validator_digest(entry['validator']):
+        return None
+
+    # Fast path: nothing touched since validation
+    if entry['signature'] == skill_signature(skill_path):
+        return entry
+
+    # Touched but maybe not changed (checkout, copy): compare content
+    if entry['content_hash'] == content_hash(skill_path):
+        return entry
+    return None
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python3 validation_cache.py <skill_directory>")
+        sys.exit(1)
+
+    entry = load_result(Path(sys.argv[1]))
+    if entry is None:
+        print("No fresh cached validation result")
+        sys.exit(1)
+
+    print(f"{entry['validator']}: {entry['passed']}/{entry['total']} | "
+          f"{len(entry['errors'])} errors, {len(entry['warnings'])} warnings")
+    for issue in entry['errors']:
+        print(f"  ✗ {issue['check']}: {issue['fix']}")
+    for issue in entry['warnings']:
+        print(f"  ⚠ {issue['check']}")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,27 @@ tool count, skill references), and provides quality analysis.
 Usage:
     python3 scripts/validate_subagent.py /path/to/subagent.md
     python3 scripts/validate_subagent.py /path/to/subagent.md --minimal
+    python3 scripts/validate_subagent.py /path/to/subagent.md --baseline .m42-baseline.json
+    python3 scripts/validate_subagent.py /path/to/subagent.md --baseline .m42-baseline.json --new-only
 """
 
 import sys
 import re
 import yaml
+import contextvars
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 
+# Shared --baseline helper in the plugin's scripts/; absent when this skill is packaged on its own
+_PLUGIN_SCRIPTS = Path(__file__).resolve().parents[3] / 'scripts'
+if (_PLUGIN_SCRIPTS / 'issue_baseline.py').is_file() and str(_PLUGIN_SCRIPTS) not in sys.path:
+    sys.path.append(str(_PLUGIN_SCRIPTS))
+try:
+    import issue_baseline
+except ImportError:
+    issue_baseline = None
+
 # ANSI color codes
 class Colors:
     GREEN = '\033[92m'
@@ -26,18 +39,55 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
-# Global flag for minimal mode
-_MINIMAL_MODE = False
+CHECK_ICONS = {
+    'pass': (Colors.GREEN, '✓'),
+    'fail': (Colors.RED, '✗'),
+    'skip': (Colors.YELLOW, '⊘'),
+    'info': (Colors.CYAN, 'ℹ'),
+    'warn': (Colors.YELLOW, '⚠'),
+}
+
+def print_check_event(kind: str, text: str):
+    """Default check sink: print headers, sections and check lines to stdout."""
+    if kind == 'header':
+        print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}")
+        print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.END}")
+        print(f"{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}\n")
+    elif kind == 'section':
+        print(f"\n{Colors.BOLD}{Colors.CYAN}{text}{Colors.END}")
+        print(f"{Colors.CYAN}{'-' * len(text)}{Colors.END}\n")
+    else:
+        color, icon = CHECK_ICONS[kind]
+        print(f"{color}{icon}{Colors.END} {text}")
+
+# Where check progress goes: sink(kind, text), or None to stay silent.
+# Context-local, so validations running in different threads never share it.
+_CHECK_SINK = contextvars.ContextVar('check_sink', default=print_check_event)
 
 def set_minimal_mode(enabled: bool):
-    """Set global minimal mode flag."""
-    global _MINIMAL_MODE
-    _MINIMAL_MODE = enabled
+    """Silence (or restore) per-check output in the current context."""
+    _CHECK_SINK.set(None if enabled else print_check_event)
+
+@contextmanager
+def check_sink(sink):
+    """Send per-check events to sink(kind, text) inside the block (None = silent)."""
+    token = _CHECK_SINK.set(sink)
+    try:
+        yield
+    finally:
+        _CHECK_SINK.reset(token)
+
+def _emit(kind: str, text: str):
+    sink = _CHECK_SINK.get()
+    if sink:
+        sink(kind, text)
 
 class ValidationIssue:
     """Represents a validation failure with specific remediation."""
+    __slots__ = ('check', 'location', 'found', 'expected', 'fix', 'severity')
+
     def __init__(self, check: str, location: str, found: str, expected: str, fix: str, severity: str = "error"):
-        self.check = check
+        self.check = sys.intern(check)
         self.location = location
         self.found = found
         self.expected = expected
@@ -60,36 +110,31 @@ class ValidationIssue:
 
 def print_header(text: str):
     """Print formatted header."""
-    if not _MINIMAL_MODE:
-        print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}\n")
+    _emit('header', text)
 
 def print_section(text: str):
     """Print section header."""
-    if not _MINIMAL_MODE:
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{text}{Colors.END}")
-        print(f"{Colors.CYAN}{'-' * len(text)}{Colors.END}\n")
+    _emit('section', text)
 
 def check_pass(msg: str):
     """Print passing check."""
-    if not _MINIMAL_MODE:
-        print(f"{Colors.GREEN}✓{Colors.END} {msg}")
+    _emit('pass', msg)
 
 def check_fail(msg: str):
     """Print failing check."""
-    if not _MINIMAL_MODE:
-        print(f"{Colors.RED}✗{Colors.END} {msg}")
+    _emit('fail', msg)
 
-def check_warn(msg: str):
-    """Print warning check."""
-    if not _MINIMAL_MODE:
-        print(f"{Colors.YELLOW}⚠{Colors.END} {msg}")
+def check_skip(msg: str):
+    """Print skipped check."""
+    _emit('skip', msg)
 
 def check_info(msg: str):
     """Print informational message."""
-    if not _MINIMAL_MODE:
-        print(f"{Colors.CYAN}ℹ{Colors.END} {msg}")
+    _emit('info', msg)
+
+def check_warn(msg: str):
+    """Print warning check."""
+    _emit('warn', msg)
 
 def parse_yaml_frontmatter(content: str) -> Tuple[Optional[dict], Optional[str], str]:
     """Extract and parse YAML frontmatter. Returns (parsed_dict, error_message, body_content)."""
@@ -122,15 +167,16 @@ def check_gerund_form(name: str) -> bool:
     """Check if name uses gerund form (-ing pattern)."""
     return bool(re.search(r'(ing-|-ing$)', name))
 
+# Compiled once at import so repeated validations in one process reuse them
+PERSON_PATTERNS = [re.compile(p) for p in [
+    r'\b[Yy]ou\s+(?:should|must|can|will|need|may|might)',
+    r'\b[Yy]our\s+',
+    r'\bI\s+(?:will|can|recommend|suggest)',
+    r'\b[Ww]e\s+(?:will|should|can|need)',
+]]
+
 def find_person_usage(content: str) -> List[Tuple[int, str]]:
     """Find first/second person usage with line numbers."""
-    patterns = [
-        r'\b[Yy]ou\s+(?:should|must|can|will|need|may|might)',
-        r'\b[Yy]our\s+',
-        r'\bI\s+(?:will|can|recommend|suggest)',
-        r'\b[Ww]e\s+(?:will|should|can|need)',
-    ]
-
     found = []
     lines = content.split('\n')
     in_code_block = False
@@ -155,29 +201,29 @@ def find_person_usage(content: str) -> List[Tuple[int, str]]:
         else:
             line_without_code = line
 
-        for pattern in patterns:
-            match = re.search(pattern, line_without_code)
+        for pattern in PERSON_PATTERNS:
+            match = pattern.search(line_without_code)
             if match:
                 found.append((i, match.group().strip()))
     return found
 
+TIME_SENSITIVE_PATTERNS = [(re.compile(p, re.IGNORECASE), label) for p, label in [
+    (r'\b20\d{2}\b', 'year'),
+    (r'\bcurrent(?:ly)?\b', 'current/currently'),
+    (r'\bas of\b', 'as of'),
+    (r'\brecent(?:ly)?\b', 'recent/recently'),
+    (r'\blatest\b', 'latest'),
+    (r'\btoday\b', 'today'),
+    (r'\bnow\b', 'now'),
+]]
+
 def find_time_sensitive(content: str) -> List[Tuple[int, str]]:
     """Find time-sensitive phrases with line numbers."""
-    patterns = [
-        (r'\b20\d{2}\b', 'year'),
-        (r'\bcurrent(?:ly)?\b', 'current/currently'),
-        (r'\bas of\b', 'as of'),
-        (r'\brecent(?:ly)?\b', 'recent/recently'),
-        (r'\blatest\b', 'latest'),
-        (r'\btoday\b', 'today'),
-        (r'\bnow\b', 'now'),
-    ]
-
     found = []
     lines = content.split('\n')
     for i, line in enumerate(lines, 1):
-        for pattern, label in patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+        for pattern, label in TIME_SENSITIVE_PATTERNS:
+            if pattern.search(line):
                 found.append((i, label))
     return found
 
@@ -185,8 +231,16 @@ def has_windows_paths(content: str) -> bool:
     """Check for Windows-style backslash paths."""
     return bool(re.search(r'[a-zA-Z]:\\', content))
 
-def validate_subagent(subagent_path: Path) -> Tuple[List[ValidationIssue], int, int, Dict]:
-    """Validate subagent file. Returns (issues, passed, total, metrics)."""
+# Frontmatter schema (also offered as completions by scripts/artifact_lsp.py)
+REQUIRED_FIELDS = ['name', 'description', 'tools', 'model', 'color']
+VALID_MODELS = ['inherit', 'sonnet', 'haiku', 'opus']
+VALID_COLORS = ['purple', 'blue', 'green', 'yellow', 'orange', 'red', 'cyan', 'magenta', 'white']
+
+def validate_subagent(subagent_path: Path, content: Optional[str] = None) -> Tuple[List[ValidationIssue], int, int, Dict]:
+    """Validate subagent file. Returns (issues, passed, total, metrics).
+
+    content, if given, is used instead of reading the file (e.g. an unsaved editor buffer).
+    """
     issues = []
     passed = 0
     total = 15  # Total number of actual validation checks
@@ -202,7 +256,7 @@ def validate_subagent(subagent_path: Path) -> Tuple[List[ValidationIssue], int,
     print_section("Category 1: File Structure (2 checks)")
 
     # Check 1: File exists
-    if not subagent_path.exists():
+    if content is None and not subagent_path.exists():
         check_fail("Subagent file exists")
         issues.append(ValidationIssue(
             "Subagent file exists",
@@ -218,8 +272,9 @@ def validate_subagent(subagent_path: Path) -> Tuple[List[ValidationIssue], int,
 
     # Check 2: Read file content
     try:
-        with open(subagent_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if content is None:
+            with open(subagent_path, 'r', encoding='utf-8') as f:
+                content = f.read()
         check_pass("Subagent file readable")
         passed += 1
     except Exception as e:
@@ -258,11 +313,10 @@ def validate_subagent(subagent_path: Path) -> Tuple[List[ValidationIssue], int,
     passed += 1
 
     # Check 4: Required fields
-    required_fields = ['name', 'description', 'tools', 'model', 'color']
-    missing_fields = [f for f in required_fields if f not in frontmatter]
+    missing_fields = [f for f in REQUIRED_FIELDS if f not in frontmatter]
 
     if missing_fields:
-        check_fail(f"Required fields present: {', '.join(required_fields)}")
+        check_fail(f"Required fields present: {', '.join(REQUIRED_FIELDS)}")
         issues.append(ValidationIssue(
             "Required frontmatter fields",
             "Subagent frontmatter",
@@ -272,7 +326,7 @@ def validate_subagent(subagent_path: Path) -> Tuple[List[ValidationIssue], int,
         ))
         return issues, passed, total, metrics
 
-    check_pass(f"Required fields present: {', '.join(required_fields)}")
+    check_pass(f"Required fields present: {', '.join(REQUIRED_FIELDS)}")
     passed += 1
 
     # ==================== CATEGORY 3: FRONTMATTER CONTENT ====================
@@ -299,8 +353,7 @@ def validate_subagent(subagent_path: Path) -> Tuple[List[ValidationIssue], int,
         ))
 
     # Check 6: Model value valid
-    valid_models = ['inherit', 'sonnet', 'haiku', 'opus']
-    if model in valid_models:
+    if model in VALID_MODELS:
         check_pass(f"model value valid: '{model}'")
         passed += 1
     else:
@@ -309,13 +362,12 @@ def validate_subagent(subagent_path: Path) -> Tuple[List[ValidationIssue], int,
             "model value",
             "frontmatter.model",
             f"'{model}'",
-            f"One of: {', '.join(valid_models)}",
-            f"Set model to one of: {', '.join(valid_models)}"
+            f"One of: {', '.join(VALID_MODELS)}",
+            f"Set model to one of: {', '.join(VALID_MODELS)}"
         ))
 
     # Check 7: Color value valid
-    valid_colors = ['purple', 'blue', 'green', 'yellow', 'orange', 'red', 'cyan', 'magenta', 'white']
-    if color in valid_colors:
+    if color in VALID_COLORS:
         check_pass(f"color value valid: '{color}'")
         passed += 1
     else:
@@ -324,8 +376,8 @@ def validate_subagent(subagent_path: Path) -> Tuple[List[ValidationIssue], int,
             "color value",
             "frontmatter.color",
             f"'{color}'",
-            f"One of: {', '.join(valid_colors)}",
-            f"Set color to one of: {', '.join(valid_colors)}\nSee references/color-codes.md"
+            f"One of: {', '.join(VALID_COLORS)}",
+            f"Set color to one of: {', '.join(VALID_COLORS)}\nSee references/color-codes.md"
         ))
 
     # Check 8: Description uses third person
@@ -634,14 +686,29 @@ Minimal Mode:
   - Failures with concise fix recommendations
   - Recommendations based on metrics
   - Suppresses all passing checks and verbose output
+
+Baseline:
+  --baseline FILE records the current issues in FILE (other files' entries
+  are kept). Add --new-only to report only issues missing from FILE; a run
+  whose errors are all known passes. Paths are relative to FILE. Line
+  numbers do not affect matching; another occurrence of a known issue, or a
+  larger count, is reported as new.
         """
     )
 
     parser.add_argument('subagent_path', type=Path, help='Path to subagent .md file')
     parser.add_argument('--minimal', action='store_true',
                         help='Minimal output mode: one-line score + failures only')
+    parser.add_argument('--baseline', type=Path, metavar='FILE',
+                        help='Record issues in this baseline file (compare against it with --new-only)')
+    parser.add_argument('--new-only', action='store_true',
+                        help='Report only issues not recorded in the --baseline file')
 
     args = parser.parse_args()
+    if args.new_only and not args.baseline:
+        parser.error('--new-only requires --baseline FILE')
+    if args.baseline and issue_baseline is None:
+        parser.error("--baseline needs issue_baseline.py from the scripts directory of the m42-meta-toolkit plugin")
 
     # Set minimal mode flag
     if args.minimal:
@@ -657,6 +724,14 @@ Minimal Mode:
         print(f"{Colors.RED}Error: Not a file: {subagent_path}{Colors.END}")
         sys.exit(1)
 
+    known_issues = None
+    if args.new_only:
+        try:
+            known_issues = issue_baseline.load_baseline(args.baseline)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"{Colors.RED}Error: Cannot read baseline {args.baseline}: {e}{Colors.END}")
+            sys.exit(1)
+
     subagent_name = subagent_path.stem
     minimal = args.minimal
 
@@ -669,11 +744,28 @@ Minimal Mode:
     # Run validation
     issues, passed, total, metrics = validate_subagent(subagent_path)
 
+    if known_issues is not None:
+        issues, hidden = issue_baseline.split_known(
+            issues, 'validate_subagent', issue_baseline.baseline_key(subagent_path, args.baseline), known_issues)
+        passed = issue_baseline.passed_without_known(passed, total, issues, hidden)
+
     if minimal:
         print_summary_minimal(issues, passed, total, metrics, subagent_name)
     else:
         print_summary(issues, passed, total, metrics)
 
+    if known_issues is not None:
+        print(f"\nBaseline: {len(hidden)} known issue(s) hidden ({args.baseline})")
+    elif args.baseline:
+        try:
+            recorded = issue_baseline.update_baseline(args.baseline, 'validate_subagent', {
+                issue_baseline.baseline_key(subagent_path, args.baseline):
+                    [(issue.check, issue_baseline.issue_context(issue)) for issue in issues]})
+        except (OSError, ValueError, KeyError) as e:
+            print(f"{Colors.RED}Error: Cannot write baseline {args.baseline}: {e}{Colors.END}")
+            sys.exit(1)
+        print(f"\nBaseline: recorded {recorded} issue(s) in {args.baseline}")
+
     # Exit code: 0 if no errors, 1 if errors (warnings don't cause failure)
     errors = [issue for issue in issues if issue.severity == "error"]
     sys.exit(0 if len(errors) == 0 else 1)